@@ -0,0 +1,321 @@
+import asyncio
+import math
+import platform
+import socket
+import statistics
+import time
+from datetime import datetime, timezone
+from typing import Callable, Iterable, Optional
+from urllib.parse import urlsplit
+
+import django
+from django.db import connection
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from ranking_api.cache import item_list_cache
+from ranking_api.models import RankingList
+from ranking_api.repositories.item_repository import ItemRepository
+from ranking_api.repositories.ranking_repository import RankingRepository
+from ranking_api.services.item_service import ItemService
+from ranking_api.services.ranking_service import RankingService
+
+DEFAULT_SIZES = (1000, 100000, 1000000)
+DEFAULT_REPEAT = 5
+# A benchmark regresses when its median grows by more than this fraction of
+# the baseline median...
+DEFAULT_THRESHOLD = 0.2
+# ...and by more than this many milliseconds, so sub-millisecond noise on
+# fast operations is never reported.
+DEFAULT_MIN_DELTA_MS = 2.0
+
+DEFAULT_SLOW_CLIENT_REQUESTS = 500
+DEFAULT_SLOW_CLIENT_CONCURRENCY = 64
+DEFAULT_CLIENT_DELAY = 0.01
+# Bytes a slow client reads between pauses; its receive buffer is kept just as
+# small so the server really does have to wait for it.
+SLOW_CLIENT_READ_SIZE = 16 * 1024
+
+
+class BenchmarkRun:
+    # One seeded ranking plus the state the benchmarks mutate as they go.
+
+    def __init__(self, size: int, ordering_mode: str):
+        self.size = size
+        self.ordering_mode = ordering_mode
+        self.item_service = ItemService(item_repository=ItemRepository())
+        self.ranking_service = RankingService(ranking_repository=RankingRepository())
+        self.client = Client(HTTP_HOST='localhost')
+        self.ranking_id = None
+        self.mover_id = None
+        self.mover_at_top = True
+
+    def seed(self):
+        ranking = self.ranking_service.create_ranking(f'benchmark-{self.size}', ordering_mode=self.ordering_mode)
+        self.ranking_id = ranking.id
+        self.item_service.import_items(ranking.id, ((f'Item {i}', None) for i in range(1, self.size + 1)))
+        self.mover_id = self.item_service.item_repository.get_item_rows_page(ranking.id, 1)[0]['id']
+
+    def tear_down(self):
+        if self.ranking_id is not None:
+            self.ranking_service.delete_ranking(self.ranking_id)
+            self.ranking_id = None
+
+    def next_long_move(self) -> int:
+        # Swings the same item between the ends of the ranking, so every move
+        # crosses every other item.
+        self.mover_at_top = not self.mover_at_top
+        return 1 if self.mover_at_top else self.item_service.item_repository.count_items_in_ranking(self.ranking_id)
+
+
+def _create_item_append(run: BenchmarkRun):
+    run.item_service.create_item('Benchmark item', run.ranking_id)
+
+
+def _create_item_top(run: BenchmarkRun):
+    run.item_service.create_item('Benchmark item', run.ranking_id, rank=1)
+
+
+def _update_item_rank_long(run: BenchmarkRun):
+    run.item_service.update_item_rank(run.mover_id, run.next_long_move())
+
+
+def _get_all_items(run: BenchmarkRun):
+    run.item_service.get_all_items(run.ranking_id)
+
+
+def _http(run: BenchmarkRun, method: str, route: str, kwargs: dict, data: Optional[dict] = None):
+    url = reverse(route, kwargs=kwargs)
+    if method == 'get':
+        response = run.client.get(url, data)
+    else:
+        response = run.client.post(url, data, content_type='application/json')
+    if response.status_code >= 400:
+        raise RuntimeError(f'{method.upper()} {url} returned {response.status_code}')
+    if response.streaming:
+        for _ in response.streaming_content:
+            pass
+
+
+def _http_list_items(run: BenchmarkRun):
+    _http(run, 'get', 'ranking-items', {'ranking_id': run.ranking_id})
+
+
+def _http_list_items_page(run: BenchmarkRun):
+    _http(run, 'get', 'ranking-items', {'ranking_id': run.ranking_id}, {'limit': 100})
+
+
+def _http_create_item(run: BenchmarkRun):
+    _http(run, 'post', 'ranking-items', {'ranking_id': run.ranking_id}, {'name': 'Benchmark item'})
+
+
+def _http_update_item_rank(run: BenchmarkRun):
+    _http(run, 'post', 'ranking-item-rank', {'item_id': run.mover_id}, {'rank': run.next_long_move()})
+
+
+def _drop_item_list_cache(run: BenchmarkRun):
+    item_list_cache.backend.clear()
+
+
+# name -> (operation, untimed per-iteration preparation)
+BENCHMARKS: dict[str, tuple[Callable[[BenchmarkRun], None], Optional[Callable[[BenchmarkRun], None]]]] = {
+    'create_item_append': (_create_item_append, None),
+    'create_item_top': (_create_item_top, None),
+    'update_item_rank_long': (_update_item_rank_long, None),
+    'get_all_items': (_get_all_items, None),
+    'http_list_items_cold': (_http_list_items, _drop_item_list_cache),
+    'http_list_items_cached': (_http_list_items, None),
+    'http_list_items_page': (_http_list_items_page, None),
+    'http_create_item': (_http_create_item, None),
+    'http_update_item_rank_long': (_http_update_item_rank, None),
+}
+
+
+def time_benchmark(run: BenchmarkRun, operation: Callable, prepare: Optional[Callable], repeat: int) -> dict:
+    # One untimed warm-up call, then `repeat` timed ones. Queries are counted
+    # on the last call.
+    timings = []
+    for iteration in range(repeat + 1):
+        if prepare is not None:
+            prepare(run)
+        with CaptureQueriesContext(connection) as queries:
+            start = time.perf_counter()
+            operation(run)
+            elapsed = time.perf_counter() - start
+        if iteration:
+            timings.append(elapsed * 1000)
+    return summarize(timings, len(queries))
+
+
+def summarize(timings: list[float], queries: int) -> dict:
+    ordered = sorted(timings)
+    return {
+        'repeat': len(ordered),
+        'min_ms': round(ordered[0], 3),
+        'median_ms': round(statistics.median(ordered), 3),
+        'p95_ms': round(ordered[math.ceil(0.95 * len(ordered)) - 1], 3),
+        'max_ms': round(ordered[-1], 3),
+        'queries': queries,
+    }
+
+
+def run_benchmarks(sizes: Iterable[int] = DEFAULT_SIZES, repeat: int = DEFAULT_REPEAT,
+                   names: Optional[Iterable[str]] = None, ordering_mode: str = RankingList.DENSE,
+                   progress: Optional[Callable[[str], None]] = None) -> dict:
+    names = list(BENCHMARKS) if names is None else list(names)
+    unknown = [name for name in names if name not in BENCHMARKS]
+    if unknown:
+        raise ValueError(f"Unknown benchmarks: {', '.join(unknown)}")
+    if repeat < 1:
+        raise ValueError('repeat must be at least 1')
+
+    results = []
+    for size in sizes:
+        run = BenchmarkRun(size, ordering_mode)
+        try:
+            start = time.perf_counter()
+            run.seed()
+            if progress is not None:
+                progress(f'Seeded {size} items in {time.perf_counter() - start:.1f}s')
+            for name in names:
+                operation, prepare = BENCHMARKS[name]
+                result = {'name': name, 'size': size, **time_benchmark(run, operation, prepare, repeat)}
+                results.append(result)
+                if progress is not None:
+                    progress(f"{name}[{size}]: median {result['median_ms']}ms, {result['queries']} queries")
+        finally:
+            run.tear_down()
+
+    return {
+        'meta': {
+            'created_at': datetime.now(timezone.utc).isoformat(),
+            'vendor': connection.vendor,
+            'ordering_mode': ordering_mode,
+            'python': platform.python_version(),
+            'django': django.get_version(),
+        },
+        'results': results,
+    }
+
+
+def compare_results(baseline: dict, current: dict, threshold: float = DEFAULT_THRESHOLD,
+                    min_delta_ms: float = DEFAULT_MIN_DELTA_MS) -> list[dict]:
+    # Pairs up benchmarks present in both runs by (name, size). A benchmark
+    # regresses when its median slows past both limits or it issues more queries.
+    baseline_results = {(result['name'], result['size']): result for result in baseline['results']}
+    comparisons = []
+    for result in current['results']:
+        before = baseline_results.get((result['name'], result['size']))
+        if before is None:
+            continue
+        delta_ms = result['median_ms'] - before['median_ms']
+        ratio = result['median_ms'] / before['median_ms'] if before['median_ms'] else None
+        slower = delta_ms > min_delta_ms and (ratio is None or ratio > 1 + threshold)
+        more_queries = result['queries'] > before['queries']
+        comparisons.append({
+            'name': result['name'],
+            'size': result['size'],
+            'baseline_ms': before['median_ms'],
+            'current_ms': result['median_ms'],
+            'ratio': None if ratio is None else round(ratio, 3),
+            'baseline_queries': before['queries'],
+            'current_queries': result['queries'],
+            'regressed': slower or more_queries,
+        })
+    return comparisons
+
+
+# Slow-client comparison of the sync (WSGI) and async (ASGI) item list
+# endpoints, run against two live single-worker servers sharing a database:
+#
+#     gunicorn ranking_api.wsgi -w 1 --threads 8 -b localhost:8000
+#     uvicorn ranking_api.asgi:application --workers 1 --port 8001
+#
+# Each client reads the response in small pieces and pauses between them, the
+# way a slow mobile connection would. Once the socket buffers fill, a threaded
+# WSGI worker has a thread blocked in sendall() for every such client, while
+# the ASGI worker only parks a coroutine. The ranking's item list must be
+# larger than the server's socket send buffer (net.ipv4.tcp_wmem, up to 4 MB on
+# Linux), otherwise the kernel absorbs the whole response and neither worker
+# ever waits. Django still opens one database connection per in-flight ASGI
+# request, so keep the concurrency below the database's max_connections.
+
+async def fetch_slowly(url: str, client_delay: float) -> tuple[int, float]:
+    # Returns the response status and the seconds until the body was read.
+    parts = urlsplit(url)
+    target = f'{parts.path}?{parts.query}' if parts.query else parts.path
+    started = time.perf_counter()
+
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, SLOW_CLIENT_READ_SIZE)
+    sock.setblocking(False)
+    await asyncio.get_running_loop().sock_connect(sock, (socket.gethostbyname(parts.hostname), parts.port or 80))
+    reader, writer = await asyncio.open_connection(sock=sock, limit=SLOW_CLIENT_READ_SIZE)
+    try:
+        writer.write(f'GET {target} HTTP/1.1\r\nHost: {parts.hostname}\r\nConnection: close\r\n\r\n'.encode())
+        await writer.drain()
+
+        status_line = await reader.readline()
+        while await reader.read(SLOW_CLIENT_READ_SIZE):
+            await asyncio.sleep(client_delay)
+        return int(status_line.split()[1]), time.perf_counter() - started
+    finally:
+        writer.close()
+
+
+async def run_slow_clients(url: str, requests: int, concurrency: int, client_delay: float) -> dict:
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one():
+        async with semaphore:
+            try:
+                return await fetch_slowly(url, client_delay)
+            except (OSError, IndexError, ValueError):
+                return None, None
+
+    started = time.perf_counter()
+    results = await asyncio.gather(*(one() for _ in range(requests)))
+    elapsed = time.perf_counter() - started
+
+    latencies = sorted(latency * 1000 for status, latency in results if status == 200)
+    return {
+        'ok': len(latencies),
+        'errors': requests - len(latencies),
+        'requests_per_second': round(len(latencies) / elapsed, 1),
+        'p50_ms': round(statistics.median(latencies), 1) if latencies else None,
+        'p95_ms': round(latencies[math.ceil(0.95 * len(latencies)) - 1], 1) if latencies else None,
+    }
+
+
+def run_server_comparison(ranking_id: int, wsgi_url: str, asgi_url: str,
+                          requests: int = DEFAULT_SLOW_CLIENT_REQUESTS,
+                          concurrency: int = DEFAULT_SLOW_CLIENT_CONCURRENCY,
+                          client_delay: float = DEFAULT_CLIENT_DELAY,
+                          progress: Optional[Callable[[str], None]] = None) -> dict:
+    if requests < 1 or concurrency < 1:
+        raise ValueError('requests and concurrency must be at least 1')
+    targets = {
+        'wsgi': f"{wsgi_url.rstrip('/')}/api/rankings/{ranking_id}/items/",
+        'asgi': f"{asgi_url.rstrip('/')}/api/async/rankings/{ranking_id}/items/",
+    }
+    results = []
+    for name, url in targets.items():
+        result = {'name': name, 'url': url, **asyncio.run(run_slow_clients(url, requests, concurrency, client_delay))}
+        results.append(result)
+        if progress is not None:
+            progress(
+                f"{name}: {result['requests_per_second']} req/s, p50 {result['p50_ms'] or 0}ms, "
+                f"p95 {result['p95_ms'] or 0}ms, {result['errors']} errors"
+            )
+
+    return {
+        'meta': {
+            'created_at': datetime.now(timezone.utc).isoformat(),
+            'ranking_id': ranking_id,
+            'requests': requests,
+            'concurrency': concurrency,
+            'client_delay': client_delay,
+        },
+        'results': results,
+    }
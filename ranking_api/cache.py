@@ -0,0 +1,77 @@
+import threading
+from typing import Awaitable, Callable, Optional
+
+from django.core.cache import caches
+
+ITEM_CACHE_ALIAS = 'items'
+
+
+class ItemListCache:
+    # Read-through cache for a ranking's item rows. Entries are keyed on the
+    # ranking id plus RankingList.version, which every write bumps in its own
+    # transaction, so all workers move to a new key as soon as the write
+    # commits. Nothing is deleted; superseded entries age out through the
+    # backend's LRU eviction (see CACHES['items'] in settings).
+
+    def __init__(self, alias: str = ITEM_CACHE_ALIAS):
+        self.alias = alias
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    @property
+    def backend(self):
+        return caches[self.alias]
+
+    def get_or_load(self, ranking_id: int, version: int, load: Callable[[], Optional[list]]) -> Optional[list]:
+        # `version` must be read before loading, so rows loaded while a writer
+        # commits are at least as new as the version they are stored under.
+        key = self._items_key(ranking_id, version)
+        rows = self.backend.get(key)
+        if rows is not None:
+            self._record(hit=True)
+            return rows
+
+        self._record(hit=False)
+        rows = load()
+        if rows is not None:
+            self.backend.set(key, rows)
+        return rows
+
+    async def aget_or_load(self, ranking_id: int, version: int,
+                           load: Callable[[], Awaitable[Optional[list]]]) -> Optional[list]:
+        # Async twin of get_or_load for the ASGI views; `load` is a coroutine function.
+        key = self._items_key(ranking_id, version)
+        rows = await self.backend.aget(key)
+        if rows is not None:
+            self._record(hit=True)
+            return rows
+
+        self._record(hit=False)
+        rows = await load()
+        if rows is not None:
+            await self.backend.aset(key, rows)
+        return rows
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {'hits': self.hits, 'misses': self.misses}
+
+    def reset_stats(self):
+        with self._lock:
+            self.hits = 0
+            self.misses = 0
+
+    def _record(self, hit: bool):
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    @staticmethod
+    def _items_key(ranking_id: int, version: int) -> str:
+        return f'ranking:{ranking_id}:items:{version}'
+
+
+item_list_cache = ItemListCache()
@@ -0,0 +1,68 @@
+import numpy as np
+
+
+def borda_scores(matrix: np.ndarray) -> np.ndarray:
+    # Each ranking gives a candidate one point per candidate placed below it.
+    size = matrix.shape[1]
+    return (size - 1 - matrix).sum(axis=0)
+
+
+def borda_order(matrix: np.ndarray) -> np.ndarray:
+    # Candidate indices by descending Borda score; ties keep candidate order.
+    return np.argsort(-borda_scores(matrix), kind='stable')
+
+
+def preference_matrix(matrix: np.ndarray) -> np.ndarray:
+    # preferences[a, b] is the number of rankings that put a above b. Positions
+    # are doubled so the half-integer ties become small ints, which compare
+    # faster than floats; one ranking at a time keeps the n x n temporary in cache.
+    size = matrix.shape[1]
+    doubled = (matrix * 2).astype(np.int16 if 2 * size <= np.iinfo(np.int16).max else np.int32)
+    preferences = np.zeros((size, size), dtype=np.int32)
+    for positions in doubled:
+        preferences += positions[:, None] < positions[None, :]
+    return preferences
+
+
+def kemeny_disagreements(order: np.ndarray, preferences: np.ndarray) -> int:
+    # Kemeny distance of `order` to the rankings: for every pair it puts a above
+    # b, the rankings that prefer b.
+    ordered = preferences[np.ix_(order, order)]
+    return int(np.tril(ordered, -1).sum())
+
+
+def kemeny_order(matrix: np.ndarray, max_passes: int = 50) -> tuple[np.ndarray, int]:
+    # Approximate Kemeny consensus. Exact Kemeny is NP-hard, so start from the
+    # Borda order and keep moving single candidates to whichever slot lowers
+    # the Kemeny distance most, until a full pass finds nothing to improve.
+    # Returns the order and its distance.
+    preferences = preference_matrix(matrix)
+    # margins[a, b] > 0 when more rankings put a above b than b above a.
+    margins = preferences - preferences.T
+    order = borda_order(matrix)
+    size = len(order)
+
+    for _ in range(max_passes):
+        improved = False
+        for candidate in order.copy():
+            index = int(np.flatnonzero(order == candidate)[0])
+            against = margins[order, candidate]
+            # Change in distance for moving the candidate up to slot j (j < index),
+            # past order[j:index], or down to slot j (j > index), past order[index+1:j+1].
+            up = np.cumsum(against[:index][::-1])[::-1]
+            down = -np.cumsum(against[index + 1:])
+            best_up = int(np.argmin(up)) if index else None
+            best_down = int(np.argmin(down)) if index < size - 1 else None
+
+            target, change = index, 0
+            if best_up is not None and up[best_up] < change:
+                target, change = best_up, up[best_up]
+            if best_down is not None and down[best_down] < change:
+                target, change = index + 1 + best_down, down[best_down]
+            if target != index:
+                order = np.insert(np.delete(order, index), target, candidate)
+                improved = True
+        if not improved:
+            break
+
+    return order, kemeny_disagreements(order, preferences)
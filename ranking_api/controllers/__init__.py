@@ -1,3 +1,9 @@
-# ranking_api/controllers/__init__.py
 from .item_controller import ItemController
 from .ranking_controller import RankingController
+from .metrics_controller import MetricsController
+from .consensus_controller import ConsensusController
+from .similarity_controller import SimilarityController
+from .history_controller import HistoryController
+from .snapshot_controller import SnapshotController
+from .async_item_controller import AsyncItemController
+from .async_ranking_controller import AsyncRankingController
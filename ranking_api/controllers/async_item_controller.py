@@ -0,0 +1,89 @@
+from django.http import JsonResponse, StreamingHttpResponse
+
+from ranking_api.controllers.async_viewset import AsyncViewSet
+from ranking_api.controllers.conditional import ranking_conditional
+from ranking_api.pagination import parse_limit, parse_rank_window
+from ranking_api.serializers import astream_json_list, serialize_item
+from ranking_api.services.item_service import ItemService
+from ranking_api.repositories.item_repository import ItemRepository
+from ranking_api.repositories.ranking_repository import RankingRepository
+from ranking_api.services.ranking_service import RankingService
+
+
+class AsyncItemController(AsyncViewSet):
+    # Read-only item endpoints for the ASGI app; writes go through ItemController.
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.item_service = ItemService(item_repository=ItemRepository())
+        self.ranking_service = RankingService(ranking_repository=RankingRepository())
+
+
+    @ranking_conditional
+    async def get_ranking_items(self, request, ranking_id: int):
+        if {'top', 'rank_from', 'rank_to'} & request.GET.keys():
+            return await self._get_ranking_items_in_rank_range(request, ranking_id)
+
+        streaming = request.GET.get('stream') == 'true'
+        if streaming or 'limit' in request.GET or 'cursor' in request.GET:
+            if await self.ranking_service.aget_ranking(ranking_id) is None:
+                return JsonResponse({'error': 'Ranking not found'}, status=404)
+            if streaming:
+                return StreamingHttpResponse(
+                    astream_json_list('items', self.item_service.aiter_item_rows(ranking_id)),
+                    content_type='application/json'
+                )
+            return await self._get_ranking_items_page(request, ranking_id)
+
+        try:
+            items = await self.item_service.aget_item_rows(ranking_id, getattr(request, 'ranking_version', None))
+            if items is None:
+                return JsonResponse({'error': 'Ranking not found'}, status=404)
+            return JsonResponse({'items': items})
+        except Exception as e:
+            return JsonResponse({'error': str(e)}, status=500)
+
+    async def _get_ranking_items_in_rank_range(self, request, ranking_id: int):
+        try:
+            rank_from, rank_to = parse_rank_window(
+                request.GET.get('top'),
+                request.GET.get('rank_from'),
+                request.GET.get('rank_to')
+            )
+            items = await self.item_service.aget_items_in_rank_range(ranking_id, rank_from, rank_to)
+        except ValueError as e:
+            return JsonResponse({'error': str(e)}, status=400)
+        except Exception as e:
+            return JsonResponse({'error': str(e)}, status=500)
+
+        if items is None:
+            return JsonResponse({'error': 'Ranking not found'}, status=404)
+        return JsonResponse({'items': items})
+
+    async def _get_ranking_items_page(self, request, ranking_id: int):
+        try:
+            limit = parse_limit(request.GET.get('limit'))
+            items, next_cursor = await self.item_service.aget_items_page(
+                ranking_id,
+                limit,
+                cursor=request.GET.get('cursor')
+            )
+        except ValueError as e:
+            return JsonResponse({'error': str(e)}, status=400)
+        except Exception as e:
+            return JsonResponse({'error': str(e)}, status=500)
+
+        return JsonResponse({
+            'items': items,
+            'next_cursor': next_cursor
+        })
+
+    async def get_ranking_item(self, request, item_id: int):
+        try:
+            item = await self.item_service.aget_item(item_id)
+
+            if item is None:
+                return JsonResponse({'error': 'Item not found'}, status=404)
+
+            return JsonResponse(serialize_item(item))
+        except Exception as e:
+            return JsonResponse({'error': str(e)}, status=500)
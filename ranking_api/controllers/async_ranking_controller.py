@@ -0,0 +1,53 @@
+from django.http import JsonResponse
+
+from ranking_api.controllers.async_viewset import AsyncViewSet
+from ranking_api.controllers.conditional import ranking_conditional
+from ranking_api.repositories.ranking_repository import RankingRepository
+from ranking_api.services.ranking_service import RankingService
+from ranking_api.pagination import parse_limit
+
+class AsyncRankingController(AsyncViewSet):
+    # Read-only ranking endpoints for the ASGI app; writes go through RankingController.
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.ranking_service = RankingService(ranking_repository=RankingRepository())
+
+    async def get_all_rankings(self, request):
+        # Always one keyset page (DEFAULT_PAGE_SIZE when no limit is given), so
+        # the response stays bounded however many rankings exist.
+        try:
+            limit = parse_limit(request.GET.get('limit'))
+            rankings, next_cursor = await self.ranking_service.aget_rankings_page(
+                limit,
+                cursor=request.GET.get('cursor'),
+                title_prefix=request.GET.get('title')
+            )
+        except ValueError as e:
+            return JsonResponse({'error': str(e)}, status=400)
+        except Exception as e:
+            return JsonResponse({'error': str(e)}, status=500)
+
+        return JsonResponse({
+            'rankings': [
+                {
+                    'id': ranking.id,
+                    'title': ranking.title,
+                    'description': ranking.description
+                } for ranking in rankings
+            ],
+            'next_cursor': next_cursor
+        })
+
+    @ranking_conditional
+    async def get_ranking(self, request, ranking_id: int):
+        try:
+            ranking = await self.ranking_service.aget_ranking(ranking_id)
+            if ranking is None:
+                return JsonResponse({'error': 'Ranking not found'}, status=404)
+            return JsonResponse({
+                'id': ranking.id,
+                'title': ranking.title,
+                'description': ranking.description
+            })
+        except Exception as e:
+            return JsonResponse({'error': str(e)}, status=500)
@@ -0,0 +1,18 @@
+from django.utils.functional import classproperty
+from django.views import View
+
+
+class AsyncViewSet(View):
+    # Async counterpart of DRF's ViewSet for the ASGI routes. as_view() takes
+    # the same {method: action} map, and every action is a coroutine, so the
+    # request runs on the event loop instead of holding a worker thread.
+    actions = None
+
+    @classproperty
+    def view_is_async(cls):
+        return True
+
+    def setup(self, request, *args, **kwargs):
+        for method, action in self.actions.items():
+            setattr(self, method, getattr(self, action))
+        super().setup(request, *args, **kwargs)
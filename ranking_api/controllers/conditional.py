@@ -0,0 +1,54 @@
+from functools import wraps
+
+from asgiref.sync import iscoroutinefunction
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date
+
+
+def ranking_conditional(view):
+    # Answers If-None-Match / If-Modified-Since from the ranking's version row
+    # alone, so a 304 never loads or serializes the ranking's items. Works on
+    # both the sync ViewSet actions and the async ASGI ones. The version read
+    # is left on request.ranking_version for the view to key caches on.
+    if iscoroutinefunction(view):
+        @wraps(view)
+        async def async_wrapper(self, request, *args, ranking_id: int, **kwargs):
+            validators = await self.ranking_service.aget_validators(ranking_id)
+            request.ranking_version = validators[2] if validators is not None else None
+            if validators is None:
+                return await view(self, request, *args, ranking_id=ranking_id, **kwargs)
+
+            response = _conditional_response(request, validators)
+            if response is None:
+                response = await view(self, request, *args, ranking_id=ranking_id, **kwargs)
+                if response.status_code != 200:
+                    return response
+            return _set_validators(response, validators)
+        return async_wrapper
+
+    @wraps(view)
+    def wrapper(self, request, *args, ranking_id: int, **kwargs):
+        validators = self.ranking_service.get_validators(ranking_id)
+        request.ranking_version = validators[2] if validators is not None else None
+        if validators is None:
+            return view(self, request, *args, ranking_id=ranking_id, **kwargs)
+
+        response = _conditional_response(request, validators)
+        if response is None:
+            response = view(self, request, *args, ranking_id=ranking_id, **kwargs)
+            if response.status_code != 200:
+                return response
+        return _set_validators(response, validators)
+    return wrapper
+
+
+def _conditional_response(request, validators: tuple[str, int, int]):
+    etag, last_modified, _ = validators
+    return get_conditional_response(request, etag=etag, last_modified=last_modified)
+
+
+def _set_validators(response, validators: tuple[str, int, int]):
+    etag, last_modified, _ = validators
+    response['ETag'] = etag
+    response['Last-Modified'] = http_date(last_modified)
+    return response
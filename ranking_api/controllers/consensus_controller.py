@@ -0,0 +1,35 @@
+from django.http import JsonResponse
+from rest_framework import viewsets
+
+from ranking_api.models import RankingList
+from ranking_api.repositories.item_repository import ItemRepository
+from ranking_api.services.consensus_service import BORDA, ConsensusService
+
+# Largest number of rankings a single consensus request may aggregate.
+MAX_CONSENSUS_RANKINGS = 5000
+
+
+class ConsensusController(viewsets.ViewSet):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.consensus_service = ConsensusService(item_repository=ItemRepository())
+
+    def get_consensus(self, request):
+        ranking_ids = request.data.get('ranking_ids')
+        if not isinstance(ranking_ids, list) or not ranking_ids:
+            return JsonResponse({'error': 'ranking_ids must be a non-empty list'}, status=400)
+        if len(ranking_ids) > MAX_CONSENSUS_RANKINGS:
+            return JsonResponse({'error': f'At most {MAX_CONSENSUS_RANKINGS} rankings can be aggregated at once'}, status=400)
+        try:
+            ranking_ids = [int(ranking_id) for ranking_id in ranking_ids]
+        except (TypeError, ValueError):
+            return JsonResponse({'error': 'ranking_ids must be integers'}, status=400)
+
+        try:
+            return JsonResponse(self.consensus_service.get_consensus(ranking_ids, request.data.get('method', BORDA)))
+        except ValueError as e:
+            return JsonResponse({'error': str(e)}, status=400)
+        except RankingList.DoesNotExist as e:
+            return JsonResponse({'error': str(e)}, status=404)
+        except Exception as e:
+            return JsonResponse({'error': str(e)}, status=500)
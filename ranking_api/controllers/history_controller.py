@@ -0,0 +1,41 @@
+from django.http import JsonResponse
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+from rest_framework import viewsets
+
+from ranking_api.models import RankingList
+from ranking_api.repositories.item_repository import ItemRepository
+from ranking_api.repositories.rank_event_repository import RankEventRepository
+from ranking_api.services.rank_history_service import RankHistoryService
+
+
+class HistoryController(viewsets.ViewSet):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.rank_history_service = RankHistoryService(
+            rank_event_repository=RankEventRepository(),
+            item_repository=ItemRepository()
+        )
+
+    def get_ranking_history(self, request, ranking_id: int):
+        at = request.query_params.get('at')
+        if at is None:
+            at = timezone.now()
+        else:
+            try:
+                at = parse_datetime(at)
+            except ValueError:
+                at = None
+            if at is None:
+                return JsonResponse({'error': 'at must be an ISO 8601 datetime'}, status=400)
+            if timezone.is_naive(at):
+                at = timezone.make_aware(at)
+
+        try:
+            return JsonResponse(self.rank_history_service.get_order_at(ranking_id, at))
+        except ValueError as e:
+            return JsonResponse({'error': str(e)}, status=400)
+        except RankingList.DoesNotExist as e:
+            return JsonResponse({'error': str(e)}, status=404)
+        except Exception as e:
+            return JsonResponse({'error': str(e)}, status=500)
@@ -1,11 +1,20 @@
-from django.http import JsonResponse
+from django.http import JsonResponse, StreamingHttpResponse
 from rest_framework import viewsets
 
+from ranking_api.controllers.conditional import ranking_conditional
+from ranking_api.models import Item, RankingList
+from ranking_api.pagination import parse_limit, parse_radius, parse_rank_window
+from ranking_api.serializers import EXPORT_FORMATS, serialize_item, stream_csv, stream_json_list, stream_ndjson
 from ranking_api.services.item_service import ItemService
 from ranking_api.repositories.item_repository import ItemRepository
 from ranking_api.repositories.ranking_repository import RankingRepository
 from ranking_api.services.ranking_service import RankingService
 
+# Largest number of items a single bulk request may create or delete.
+MAX_BULK_ITEMS = 10000
+# Longest search query accepted, in characters.
+MAX_SEARCH_QUERY_LENGTH = 200
+
 
 class ItemController(viewsets.ViewSet):
     def __init__(self, **kwargs):
@@ -14,25 +23,107 @@ class ItemController(viewsets.ViewSet):
         self.ranking_service = RankingService(ranking_repository=RankingRepository())
 
 
+    @ranking_conditional
     def get_ranking_items(self, request, ranking_id: int):
+        if {'top', 'rank_from', 'rank_to'} & request.query_params.keys():
+            return self._get_ranking_items_in_rank_range(request, ranking_id)
+
+        streaming = request.query_params.get('stream') == 'true'
+        if streaming or 'limit' in request.query_params or 'cursor' in request.query_params:
+            if self.ranking_service.get_ranking(ranking_id) is None:
+                return JsonResponse({'error': 'Ranking not found'}, status=404)
+            if streaming:
+                return StreamingHttpResponse(
+                    stream_json_list('items', self.item_service.iter_item_rows(ranking_id)),
+                    content_type='application/json'
+                )
+            return self._get_ranking_items_page(request, ranking_id)
+
+        try:
+            items = self.item_service.get_item_rows(ranking_id, getattr(request, 'ranking_version', None))
+            if items is None:
+                return JsonResponse({'error': 'Ranking not found'}, status=404)
+            return JsonResponse({'items': items})
+        except Exception as e:
+            return JsonResponse({'error': str(e)}, status=500)
+
+    def _get_ranking_items_in_rank_range(self, request, ranking_id: int):
+        try:
+            rank_from, rank_to = parse_rank_window(
+                request.query_params.get('top'),
+                request.query_params.get('rank_from'),
+                request.query_params.get('rank_to')
+            )
+            items = self.item_service.get_items_in_rank_range(ranking_id, rank_from, rank_to)
+        except ValueError as e:
+            return JsonResponse({'error': str(e)}, status=400)
+        except Exception as e:
+            return JsonResponse({'error': str(e)}, status=500)
+
+        if items is None:
+            return JsonResponse({'error': 'Ranking not found'}, status=404)
+        return JsonResponse({'items': items})
+
+    def _get_ranking_items_page(self, request, ranking_id: int):
+        try:
+            limit = parse_limit(request.query_params.get('limit'))
+            items, next_cursor = self.item_service.get_items_page(
+                ranking_id,
+                limit,
+                cursor=request.query_params.get('cursor')
+            )
+        except ValueError as e:
+            return JsonResponse({'error': str(e)}, status=400)
+        except Exception as e:
+            return JsonResponse({'error': str(e)}, status=500)
+
+        return JsonResponse({
+            'items': items,
+            'next_cursor': next_cursor
+        })
+
+    def export_ranking_items(self, request, ranking_id: int):
+        # ?type=csv|ndjson rather than ?format=, which DRF keeps for picking a renderer.
+        export_format = request.query_params.get('type', 'csv')
+        if export_format not in EXPORT_FORMATS:
+            return JsonResponse({'error': f"type must be one of {', '.join(EXPORT_FORMATS)}"}, status=400)
         if self.ranking_service.get_ranking(ranking_id) is None:
             return JsonResponse({'error': 'Ranking not found'}, status=404)
+
+        rows = self.item_service.iter_item_rows(ranking_id)
+        if export_format == 'csv':
+            response = StreamingHttpResponse(stream_csv(rows), content_type='text/csv')
+        else:
+            response = StreamingHttpResponse(stream_ndjson(rows), content_type='application/x-ndjson')
+        response['Content-Disposition'] = f'attachment; filename="ranking-{ranking_id}.{export_format}"'
+        return response
+
+    def search_items(self, request, ranking_id: int = None):
+        query = (request.query_params.get('q') or '').strip()
+        if not query:
+            return JsonResponse({'error': 'q is required'}, status=400)
+        if len(query) > MAX_SEARCH_QUERY_LENGTH:
+            return JsonResponse({'error': f'q must be at most {MAX_SEARCH_QUERY_LENGTH} characters'}, status=400)
+        if ranking_id is not None and self.ranking_service.get_ranking(ranking_id) is None:
+            return JsonResponse({'error': 'Ranking not found'}, status=404)
+
         try:
-            items = self.item_service.get_all_items(ranking_id)
-            return JsonResponse({
-                'items': [
-                    {
-                        'id': item.id,
-                        'name': item.name,
-                        'notes': item.notes,
-                        'rank': item.rank,
-                        'ranking_id': item.ranking.id
-                    } for item in items
-                ]
-            })
+            limit = parse_limit(request.query_params.get('limit'))
+            items, next_cursor = self.item_service.search_items(
+                query,
+                limit,
+                ranking_id=ranking_id,
+                cursor=request.query_params.get('cursor')
+            )
+        except ValueError as e:
+            return JsonResponse({'error': str(e)}, status=400)
         except Exception as e:
             return JsonResponse({'error': str(e)}, status=500)
 
+        return JsonResponse({
+            'items': items,
+            'next_cursor': next_cursor
+        })
 
     def get_ranking_item(self, request, item_id: int):
         try:
@@ -41,16 +132,23 @@ class ItemController(viewsets.ViewSet):
             if item is None:
                 return JsonResponse({'error': 'Item not found'}, status=404)
 
-            return JsonResponse({
-                'id': item.id,
-                'name': item.name,
-                'notes': item.notes,
-                'rank': item.rank,
-                'ranking_id': item.ranking.id
-            })
+            return JsonResponse(serialize_item(item))
         except Exception as e:
             return JsonResponse({'error': str(e)}, status=500)
 
+    def get_item_neighbors(self, request, item_id: int):
+        try:
+            radius = parse_radius(request.query_params.get('radius'))
+            neighbors = self.item_service.get_item_neighbors(item_id, radius)
+        except ValueError as e:
+            return JsonResponse({'error': str(e)}, status=400)
+        except Exception as e:
+            return JsonResponse({'error': str(e)}, status=500)
+
+        if neighbors is None:
+            return JsonResponse({'error': 'Item not found'}, status=404)
+        return JsonResponse({'item_id': item_id, **neighbors})
+
     def create_ranking_item(self, request, ranking_id: int):
         try:
             name = request.data.get('name')
@@ -59,6 +157,11 @@ class ItemController(viewsets.ViewSet):
 
             if not name:
                 return JsonResponse({'error': 'Name is required'}, status=400)
+            if insert_rank is not None:
+                try:
+                    insert_rank = int(insert_rank)
+                except (TypeError, ValueError):
+                    return JsonResponse({'error': 'rank must be an integer'}, status=400)
 
             item = self.item_service.create_item(
                 name=name,
@@ -67,12 +170,56 @@ class ItemController(viewsets.ViewSet):
                 ranking_id=ranking_id
             )
 
-            return JsonResponse({
-                'name': item.name,
-                'notes': item.notes,
-                'rank': item.rank,
-                'ranking_id': item.ranking.id
-            }, status=201)
+            return JsonResponse(serialize_item(item), status=201)
+        except RankingList.DoesNotExist as e:
+            return JsonResponse({'error': str(e)}, status=404)
+        except Exception as e:
+            return JsonResponse({'error': str(e)}, status=500)
+
+    def create_ranking_items(self, request, ranking_id: int):
+        items = request.data.get('items')
+        if not isinstance(items, list) or not items:
+            return JsonResponse({'error': 'items must be a non-empty list'}, status=400)
+        if len(items) > MAX_BULK_ITEMS:
+            return JsonResponse({'error': f'At most {MAX_BULK_ITEMS} items can be created at once'}, status=400)
+
+        try:
+            items = [
+                {
+                    'name': item['name'],
+                    'notes': item.get('notes'),
+                    'rank': None if item.get('rank') is None else int(item['rank']),
+                } for item in items
+            ]
+        except (KeyError, TypeError, ValueError, AttributeError):
+            return JsonResponse({'error': 'Each item needs a name and an optional integer rank'}, status=400)
+        if not all(item['name'] for item in items):
+            return JsonResponse({'error': 'Name is required'}, status=400)
+
+        try:
+            created = self.item_service.create_items(ranking_id, items)
+            return JsonResponse({'items': [serialize_item(item) for item in created]}, status=201)
+        except RankingList.DoesNotExist as e:
+            return JsonResponse({'error': str(e)}, status=404)
+        except Exception as e:
+            return JsonResponse({'error': str(e)}, status=500)
+
+    def delete_ranking_items(self, request, ranking_id: int):
+        item_ids = request.data.get('item_ids')
+        if not isinstance(item_ids, list) or not item_ids:
+            return JsonResponse({'error': 'item_ids must be a non-empty list'}, status=400)
+        if len(item_ids) > MAX_BULK_ITEMS:
+            return JsonResponse({'error': f'At most {MAX_BULK_ITEMS} items can be deleted at once'}, status=400)
+        try:
+            item_ids = [int(item_id) for item_id in item_ids]
+        except (TypeError, ValueError):
+            return JsonResponse({'error': 'item_ids must be integers'}, status=400)
+
+        try:
+            deleted = self.item_service.delete_items(ranking_id, item_ids)
+            return JsonResponse({'success': True, 'deleted': deleted})
+        except RankingList.DoesNotExist as e:
+            return JsonResponse({'error': str(e)}, status=404)
         except Exception as e:
             return JsonResponse({'error': str(e)}, status=500)
 
@@ -93,18 +240,43 @@ class ItemController(viewsets.ViewSet):
 
             updated_item = self.item_service.patch_item(item_id, name=name, notes=notes)
 
-            return JsonResponse({
-                'id': updated_item.id,
-                'name': updated_item.name,
-                'notes': updated_item.notes,
-                'rank': updated_item.rank,
-                'ranking': updated_item.ranking.id
-            })
+            # PATCH has always answered with the ranking id under `ranking`;
+            # it is kept for existing clients next to the shared ranking_id.
+            return JsonResponse({**serialize_item(updated_item), 'ranking': updated_item.ranking_id})
         except Exception as e:
             return JsonResponse({'error': str(e)}, status=404)
 
-    def update_item_rank(self, request, item_id):
-        new_rank = request.data.get['rank']
+    def update_item_rank(self, request, item_id: int):
+        try:
+            new_rank = int(request.data.get('rank'))
+        except (TypeError, ValueError):
+            return JsonResponse({'error': 'rank must be an integer'}, status=400)
 
-        updated_item = self.item_service.update_item_rank(item_id, new_rank)
-        return JsonResponse(updated_item.to_dict())
+        try:
+            updated_item = self.item_service.update_item_rank(item_id, new_rank)
+
+            return JsonResponse(serialize_item(updated_item))
+        except (Item.DoesNotExist, RankingList.DoesNotExist) as e:
+            return JsonResponse({'error': str(e)}, status=404)
+        except Exception as e:
+            return JsonResponse({'error': str(e)}, status=500)
+
+    def update_item_ranks(self, request, ranking_id: int):
+        if self.ranking_service.get_ranking(ranking_id) is None:
+            return JsonResponse({'error': 'Ranking not found'}, status=404)
+
+        moves = request.data.get('moves')
+        if not isinstance(moves, list) or not moves:
+            return JsonResponse({'error': 'moves must be a non-empty list'}, status=400)
+        try:
+            moves = [(int(move['item_id']), int(move['rank'])) for move in moves]
+        except (KeyError, TypeError, ValueError):
+            return JsonResponse({'error': 'Each move needs an integer item_id and rank'}, status=400)
+
+        try:
+            updated = self.item_service.update_item_ranks(ranking_id, moves)
+            return JsonResponse({'success': True, 'updated': updated})
+        except (Item.DoesNotExist, RankingList.DoesNotExist) as e:
+            return JsonResponse({'error': str(e)}, status=404)
+        except Exception as e:
+            return JsonResponse({'error': str(e)}, status=500)
@@ -0,0 +1,17 @@
+from django.http import JsonResponse
+from rest_framework import viewsets
+
+from ranking_api.cache import item_list_cache
+from ranking_api.db_pool import get_pool_stats
+
+
+class MetricsController(viewsets.ViewSet):
+    # Per-process figures: with several workers, each one reports its own pool and cache.
+    def get_metrics(self, request):
+        try:
+            return JsonResponse({
+                'database': get_pool_stats(),
+                'item_cache': item_list_cache.stats(),
+            })
+        except Exception as e:
+            return JsonResponse({'error': str(e)}, status=500)
@@ -1,9 +1,11 @@
 from django.http import JsonResponse
 from rest_framework import viewsets
 
+from ranking_api.controllers.conditional import ranking_conditional
 from ranking_api.repositories.ranking_repository import RankingRepository
 from ranking_api.services.ranking_service import RankingService
 from ranking_api.models import RankingList
+from ranking_api.pagination import parse_limit
 
 class RankingController(viewsets.ViewSet):
     def __init__(self, **kwargs):
@@ -11,20 +13,32 @@ class RankingController(viewsets.ViewSet):
         self.ranking_service = RankingService(ranking_repository=RankingRepository())
 
     def get_all_rankings(self, request):
+        # Always one keyset page (DEFAULT_PAGE_SIZE when no limit is given), so
+        # the response stays bounded however many rankings exist.
         try:
-            rankings = self.ranking_service.get_all_rankings()
-            return JsonResponse({
-                'rankings': [
-                    {
-                        'id': ranking.id,
-                        'title': ranking.title,
-                        'description': ranking.description
-                    } for ranking in rankings
-                ]
-            })
+            limit = parse_limit(request.query_params.get('limit'))
+            rankings, next_cursor = self.ranking_service.get_rankings_page(
+                limit,
+                cursor=request.query_params.get('cursor'),
+                title_prefix=request.query_params.get('title')
+            )
+        except ValueError as e:
+            return JsonResponse({'error': str(e)}, status=400)
         except Exception as e:
             return JsonResponse({'error': str(e)}, status=500)
 
+        return JsonResponse({
+            'rankings': [
+                {
+                    'id': ranking.id,
+                    'title': ranking.title,
+                    'description': ranking.description
+                } for ranking in rankings
+            ],
+            'next_cursor': next_cursor
+        })
+
+    @ranking_conditional
     def get_ranking(self, request, ranking_id: int):
         try:
             ranking = self.ranking_service.get_ranking(ranking_id)
@@ -42,13 +56,18 @@ class RankingController(viewsets.ViewSet):
         try:
             title = request.data.get('title')
             description = request.data.get('description')
+            ordering_mode = request.data.get('ordering_mode')
 
             if not title:
                 return JsonResponse({'error': 'title is required'}, status=500)
 
+            if ordering_mode is not None and ordering_mode not in (RankingList.DENSE, RankingList.SPARSE):
+                return JsonResponse({'error': 'ordering_mode must be dense or sparse'}, status=400)
+
             ranking = self.ranking_service.create_ranking(
                 title=title,
-                description=description
+                description=description,
+                ordering_mode=ordering_mode
             )
             return JsonResponse({
                 'title': ranking.title,
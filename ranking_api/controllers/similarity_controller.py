@@ -0,0 +1,59 @@
+from django.http import JsonResponse
+from rest_framework import viewsets
+
+from ranking_api.models import RankingList
+from ranking_api.repositories.item_repository import ItemRepository
+from ranking_api.services.similarity_service import SPEARMAN, SimilarityService
+
+# Largest number of rankings a similarity matrix may cover.
+MAX_SIMILARITY_RANKINGS = 200
+
+
+class SimilarityController(viewsets.ViewSet):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.similarity_service = SimilarityService(item_repository=ItemRepository())
+
+    def compare_rankings(self, request, ranking_id: int, other_ranking_id: int):
+        try:
+            p = float(request.query_params.get('p', 0.9))
+        except ValueError:
+            return JsonResponse({'error': 'p must be a number'}, status=400)
+
+        try:
+            return JsonResponse(self.similarity_service.compare_rankings(
+                ranking_id,
+                other_ranking_id,
+                key_field=request.query_params.get('key', 'name'),
+                p=p
+            ))
+        except ValueError as e:
+            return JsonResponse({'error': str(e)}, status=400)
+        except RankingList.DoesNotExist as e:
+            return JsonResponse({'error': str(e)}, status=404)
+        except Exception as e:
+            return JsonResponse({'error': str(e)}, status=500)
+
+    def get_similarity_matrix(self, request):
+        ranking_ids = request.data.get('ranking_ids')
+        if not isinstance(ranking_ids, list) or not ranking_ids:
+            return JsonResponse({'error': 'ranking_ids must be a non-empty list'}, status=400)
+        if len(ranking_ids) > MAX_SIMILARITY_RANKINGS:
+            return JsonResponse({'error': f'At most {MAX_SIMILARITY_RANKINGS} rankings can be compared at once'}, status=400)
+        try:
+            ranking_ids = [int(ranking_id) for ranking_id in ranking_ids]
+        except (TypeError, ValueError):
+            return JsonResponse({'error': 'ranking_ids must be integers'}, status=400)
+
+        try:
+            return JsonResponse(self.similarity_service.get_similarity_matrix(
+                ranking_ids,
+                metric=request.data.get('metric', SPEARMAN),
+                key_field=request.data.get('key', 'name')
+            ))
+        except ValueError as e:
+            return JsonResponse({'error': str(e)}, status=400)
+        except RankingList.DoesNotExist as e:
+            return JsonResponse({'error': str(e)}, status=404)
+        except Exception as e:
+            return JsonResponse({'error': str(e)}, status=500)
@@ -0,0 +1,58 @@
+from django.http import JsonResponse
+from rest_framework import viewsets
+
+from ranking_api.models import RankingList, RankSnapshot
+from ranking_api.pagination import parse_limit
+from ranking_api.repositories.item_repository import ItemRepository
+from ranking_api.repositories.rank_snapshot_repository import RankSnapshotRepository
+from ranking_api.services.item_service import ItemService
+from ranking_api.services.snapshot_service import SnapshotService
+
+
+class SnapshotController(viewsets.ViewSet):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        item_repository = ItemRepository()
+        self.snapshot_service = SnapshotService(
+            item_repository=item_repository,
+            snapshot_repository=RankSnapshotRepository()
+        )
+        self.item_service = ItemService(item_repository=item_repository, snapshot_service=self.snapshot_service)
+
+    def get_snapshots(self, request, ranking_id: int):
+        try:
+            limit = parse_limit(request.query_params.get('limit'))
+            return JsonResponse({'snapshots': self.snapshot_service.get_snapshots(ranking_id, limit)})
+        except ValueError as e:
+            return JsonResponse({'error': str(e)}, status=400)
+        except RankingList.DoesNotExist as e:
+            return JsonResponse({'error': str(e)}, status=404)
+        except Exception as e:
+            return JsonResponse({'error': str(e)}, status=500)
+
+    def create_snapshot(self, request, ranking_id: int):
+        try:
+            snapshot = self.snapshot_service.create_snapshot(ranking_id, request.data.get('name'))
+            return JsonResponse({
+                'id': snapshot.id,
+                'name': snapshot.name,
+                'ranking_version': snapshot.ranking_version,
+                'created_at': snapshot.created_at,
+                'automatic': False,
+            }, status=201)
+        except ValueError as e:
+            return JsonResponse({'error': str(e)}, status=400)
+        except RankingList.DoesNotExist as e:
+            return JsonResponse({'error': str(e)}, status=404)
+        except Exception as e:
+            return JsonResponse({'error': str(e)}, status=500)
+
+    def restore_snapshot(self, request, ranking_id: int, snapshot_id: int):
+        try:
+            return JsonResponse(self.item_service.restore_snapshot(ranking_id, snapshot_id))
+        except (RankingList.DoesNotExist, RankSnapshot.DoesNotExist) as e:
+            return JsonResponse({'error': str(e)}, status=404)
+        except ValueError as e:
+            return JsonResponse({'error': str(e)}, status=409)
+        except Exception as e:
+            return JsonResponse({'error': str(e)}, status=500)
@@ -0,0 +1,37 @@
+from django.db import DEFAULT_DB_ALIAS, connections
+
+
+def get_pool_stats(alias: str = DEFAULT_DB_ALIAS) -> dict:
+    # Usage counters for the alias's psycopg connection pool. They are
+    # cumulative since the pool opened, and each worker process has its own pool.
+    connection = connections[alias]
+    pool = getattr(connection, 'pool', None)
+    if pool is None:
+        return {
+            'alias': alias,
+            'pooled': False,
+            'conn_max_age': connection.settings_dict['CONN_MAX_AGE'],
+            'conn_health_checks': connection.settings_dict['CONN_HEALTH_CHECKS'],
+        }
+
+    stats = pool.get_stats()
+    queued = stats.get('requests_queued', 0)
+    wait_ms = stats.get('requests_wait_ms', 0)
+    return {
+        'alias': alias,
+        'pooled': True,
+        'min_size': stats['pool_min'],
+        'max_size': stats['pool_max'],
+        'size': stats['pool_size'],
+        'available': stats['pool_available'],
+        'checked_out': stats['pool_size'] - stats['pool_available'],
+        'requests': stats.get('requests_num', 0),
+        'requests_waiting': stats.get('requests_waiting', 0),
+        # Only requests that found no idle connection had to queue.
+        'requests_queued': queued,
+        'wait_ms_total': wait_ms,
+        'wait_ms_avg': wait_ms / queued if queued else 0,
+        'timeouts': stats.get('requests_errors', 0),
+        'connections_opened': stats.get('connections_num', 0),
+        'connections_lost': stats.get('connections_lost', 0),
+    }
@@ -0,0 +1,103 @@
+import importlib
+import inspect
+import pkgutil
+import time
+from contextvars import ContextVar
+from functools import wraps
+from typing import Optional
+
+# Layer name -> package whose *Controller / *Service / *Repository classes
+# belong to it.
+LAYERS = {
+    'controller': 'ranking_api.controllers',
+    'service': 'ranking_api.services',
+    'repository': 'ranking_api.repositories',
+}
+
+_current_timer: ContextVar[Optional['LayerTimer']] = ContextVar('layer_timer', default=None)
+_instrumented = False
+
+
+class LayerTimer:
+    # Wall-clock time per layer for one request. Only the outermost call into
+    # a layer is timed, so a service calling its own methods isn't counted
+    # twice; time spent in lower layers is included.
+
+    def __init__(self):
+        self.totals = dict.fromkeys(LAYERS, 0.0)
+        self._depth = dict.fromkeys(LAYERS, 0)
+
+    def enter(self, layer: str) -> bool:
+        self._depth[layer] += 1
+        return self._depth[layer] == 1
+
+    def exit(self, layer: str, outermost: bool, start: float):
+        self._depth[layer] -= 1
+        if outermost:
+            self.totals[layer] += time.perf_counter() - start
+
+    def server_timing(self) -> str:
+        return ', '.join(f'{layer};dur={seconds * 1000:.1f}' for layer, seconds in self.totals.items())
+
+
+def start_timing() -> LayerTimer:
+    timer = LayerTimer()
+    _current_timer.set(timer)
+    return timer
+
+
+def stop_timing():
+    _current_timer.set(None)
+
+
+def instrument_layers():
+    # Wraps the methods of every layer class once per process. Unsampled
+    # requests pay a single ContextVar lookup per call.
+    global _instrumented
+    if _instrumented:
+        return
+    for layer, package_name in LAYERS.items():
+        package = importlib.import_module(package_name)
+        for module_info in pkgutil.iter_modules(package.__path__):
+            module = importlib.import_module(f'{package_name}.{module_info.name}')
+            for cls in vars(module).values():
+                if inspect.isclass(cls) and cls.__module__ == module.__name__ and cls.__name__.endswith(layer.title()):
+                    _instrument_class(cls, layer)
+    _instrumented = True
+
+
+def _instrument_class(cls, layer: str):
+    for name, attribute in list(vars(cls).items()):
+        if name.startswith('__') or not inspect.isfunction(attribute):
+            continue
+        # Generators only do their work once iterated, after the call returns.
+        if inspect.isgeneratorfunction(attribute) or inspect.isasyncgenfunction(attribute):
+            continue
+        setattr(cls, name, _timed(attribute, layer))
+
+
+def _timed(function, layer: str):
+    if inspect.iscoroutinefunction(function):
+        @wraps(function)
+        async def async_wrapper(*args, **kwargs):
+            timer = _current_timer.get()
+            if timer is None:
+                return await function(*args, **kwargs)
+            outermost, start = timer.enter(layer), time.perf_counter()
+            try:
+                return await function(*args, **kwargs)
+            finally:
+                timer.exit(layer, outermost, start)
+        return async_wrapper
+
+    @wraps(function)
+    def wrapper(*args, **kwargs):
+        timer = _current_timer.get()
+        if timer is None:
+            return function(*args, **kwargs)
+        outermost, start = timer.enter(layer), time.perf_counter()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            timer.exit(layer, outermost, start)
+    return wrapper
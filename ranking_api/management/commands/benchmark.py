@@ -0,0 +1,120 @@
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+
+from ranking_api.benchmarks import (
+    BENCHMARKS, DEFAULT_CLIENT_DELAY, DEFAULT_MIN_DELTA_MS, DEFAULT_REPEAT, DEFAULT_SIZES,
+    DEFAULT_SLOW_CLIENT_CONCURRENCY, DEFAULT_SLOW_CLIENT_REQUESTS, DEFAULT_THRESHOLD,
+    compare_results, run_benchmarks, run_server_comparison,
+)
+from ranking_api.models import RankingList
+
+
+def _sizes(value: str) -> list[int]:
+    try:
+        sizes = [int(size) for size in value.split(',')]
+    except ValueError:
+        raise CommandError('--sizes must be a comma-separated list of integers')
+    if any(size < 1 for size in sizes):
+        raise CommandError('--sizes must all be positive')
+    return sizes
+
+
+class Command(BaseCommand):
+    help = (
+        "Times item writes, reads and HTTP endpoints against rankings seeded at each "
+        "size and prints the results as JSON. With --compare, flags benchmarks that "
+        "regressed against an earlier run's JSON and exits non-zero if any did. "
+        "With --slow-clients, instead compares the item list throughput of running "
+        "WSGI and ASGI servers under many slow clients."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--sizes', default=','.join(str(size) for size in DEFAULT_SIZES),
+            help='Comma-separated ranking sizes to seed and benchmark.'
+        )
+        parser.add_argument('--repeat', type=int, default=DEFAULT_REPEAT, help='Timed runs per benchmark.')
+        parser.add_argument('--only', action='append', choices=list(BENCHMARKS), help='Run just this benchmark; repeatable.')
+        parser.add_argument('--ordering-mode', choices=[RankingList.DENSE, RankingList.SPARSE], default=RankingList.DENSE)
+        parser.add_argument('--output', '-o', help='File to write the JSON results to; defaults to stdout.')
+        parser.add_argument('--compare', help='Baseline JSON from an earlier run to compare against.')
+        parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                            help='Fractional median slowdown that counts as a regression.')
+        parser.add_argument('--min-delta-ms', type=float, default=DEFAULT_MIN_DELTA_MS,
+                            help='Slowdowns smaller than this are never regressions.')
+        parser.add_argument(
+            '--in-place', action='store_true',
+            help="Seed the configured database instead of a throwaway test database. "
+                 "Benchmark rankings are deleted afterwards."
+        )
+        parser.add_argument('--keepdb', action='store_true', help='Reuse the test database between runs.')
+        parser.add_argument(
+            '--slow-clients', type=int, metavar='RANKING_ID',
+            help="Fetch this ranking's item list from the --wsgi and --asgi servers with slow "
+                 "clients. Use a ranking whose item list is larger than the servers' socket send buffer."
+        )
+        parser.add_argument('--wsgi', default='http://localhost:8000', help='Base URL of the WSGI server.')
+        parser.add_argument('--asgi', default='http://localhost:8001', help='Base URL of the ASGI server.')
+        parser.add_argument('--requests', type=int, default=DEFAULT_SLOW_CLIENT_REQUESTS,
+                            help='Slow-client requests per server.')
+        parser.add_argument('--concurrency', type=int, default=DEFAULT_SLOW_CLIENT_CONCURRENCY,
+                            help='Slow clients connected at once.')
+        parser.add_argument('--client-delay', type=float, default=DEFAULT_CLIENT_DELAY,
+                            help='Seconds a slow client pauses after each read.')
+
+    def handle(self, *args, sizes, repeat, only, ordering_mode, output, compare, threshold, min_delta_ms,
+               in_place, keepdb, slow_clients, wsgi, asgi, requests, concurrency, client_delay, **options):
+        if slow_clients is not None:
+            try:
+                results = run_server_comparison(
+                    slow_clients, wsgi, asgi, requests, concurrency, client_delay, progress=self.stderr.write
+                )
+            except ValueError as e:
+                raise CommandError(str(e))
+            self._write(results, output)
+            return
+
+        sizes = _sizes(sizes)
+        baseline = None
+        if compare is not None:
+            try:
+                with open(compare, encoding='utf-8') as file:
+                    baseline = json.load(file)
+            except (OSError, ValueError) as e:
+                raise CommandError(f'Could not read baseline: {e}')
+
+        old_name = None
+        if not in_place:
+            old_name = connection.settings_dict['NAME']
+            connection.creation.create_test_db(verbosity=0, autoclobber=True, keepdb=keepdb)
+        try:
+            results = run_benchmarks(sizes, repeat, names=only, ordering_mode=ordering_mode, progress=self.stderr.write)
+        except ValueError as e:
+            raise CommandError(str(e))
+        finally:
+            if old_name is not None:
+                connection.creation.destroy_test_db(old_name, verbosity=0, keepdb=keepdb)
+
+        regressions = []
+        if baseline is not None:
+            results['comparison'] = compare_results(baseline, results, threshold, min_delta_ms)
+            regressions = [entry for entry in results['comparison'] if entry['regressed']]
+            for entry in results['comparison']:
+                self.stderr.write(
+                    f"{'REGRESSED' if entry['regressed'] else 'ok':>9}  {entry['name']}[{entry['size']}]: "
+                    f"{entry['baseline_ms']}ms -> {entry['current_ms']}ms, "
+                    f"{entry['baseline_queries']} -> {entry['current_queries']} queries"
+                )
+
+        self._write(results, output)
+        if regressions:
+            raise CommandError(f'{len(regressions)} benchmark(s) regressed against {compare}.')
+
+    def _write(self, results: dict, output):
+        if output is None:
+            self.stdout.write(json.dumps(results, indent=2))
+        else:
+            with open(output, 'w', encoding='utf-8') as file:
+                json.dump(results, file, indent=2)
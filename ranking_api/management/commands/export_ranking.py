@@ -0,0 +1,28 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from ranking_api.repositories.item_repository import ItemRepository
+from ranking_api.serializers import EXPORT_FORMATS, stream_csv, stream_ndjson
+from ranking_api.services.item_service import ItemService
+
+
+class Command(BaseCommand):
+    help = "Streams a ranking's items, in rank order, out as CSV or NDJSON."
+
+    def add_arguments(self, parser):
+        parser.add_argument('ranking_id', type=int)
+        parser.add_argument('--format', choices=EXPORT_FORMATS, default='csv')
+        parser.add_argument('--output', '-o', help='File to write to; defaults to stdout.')
+
+    def handle(self, *args, ranking_id, format, output, **options):
+        item_repository = ItemRepository()
+        if item_repository.get_ordering_mode(ranking_id) is None:
+            raise CommandError(f"Ranking with id {ranking_id} does not exist.")
+
+        rows = ItemService(item_repository=item_repository).iter_item_rows(ranking_id)
+        chunks = stream_csv(rows) if format == 'csv' else stream_ndjson(rows)
+        if output is None:
+            for chunk in chunks:
+                self.stdout.write(chunk, ending='')
+            return
+        with open(output, 'w', newline='', encoding='utf-8') as file:
+            file.writelines(chunks)
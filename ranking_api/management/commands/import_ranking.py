@@ -0,0 +1,50 @@
+import sys
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from ranking_api.models import RankingList
+from ranking_api.repositories.item_repository import ItemRepository
+from ranking_api.repositories.ranking_repository import RankingRepository
+from ranking_api.serializers import EXPORT_FORMATS, parse_csv, parse_ndjson
+from ranking_api.services.item_service import ItemService
+from ranking_api.services.ranking_service import RankingService
+
+
+class Command(BaseCommand):
+    help = (
+        "Appends items from a CSV or NDJSON file (as written by export_ranking) to a "
+        "ranking, in file order. The file is streamed, never read whole."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', help="File to read; '-' for stdin.")
+        target = parser.add_mutually_exclusive_group(required=True)
+        target.add_argument('--ranking-id', type=int, help='Existing ranking to append to.')
+        target.add_argument('--title', help='Create a new ranking with this title.')
+        parser.add_argument(
+            '--format', choices=EXPORT_FORMATS,
+            help='Defaults to ndjson for .ndjson/.jsonl files and csv otherwise.'
+        )
+
+    def handle(self, *args, path, ranking_id, title, format, **options):
+        if format is None:
+            format = 'ndjson' if path.endswith(('.ndjson', '.jsonl')) else 'csv'
+        parse = parse_csv if format == 'csv' else parse_ndjson
+
+        try:
+            file = sys.stdin if path == '-' else open(path, newline='', encoding='utf-8')
+        except OSError as e:
+            raise CommandError(str(e))
+        try:
+            with transaction.atomic():
+                if title is not None:
+                    ranking_id = RankingService(ranking_repository=RankingRepository()).create_ranking(title).id
+                imported = ItemService(item_repository=ItemRepository()).import_items(ranking_id, parse(file))
+        except (ValueError, RankingList.DoesNotExist) as e:
+            raise CommandError(str(e))
+        finally:
+            if file is not sys.stdin:
+                file.close()
+
+        self.stdout.write(f"Imported {imported} items into ranking {ranking_id}.")
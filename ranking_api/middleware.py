@@ -0,0 +1,186 @@
+import cProfile
+import hmac
+import logging
+import os
+import random
+import time
+import uuid
+from contextlib import ExitStack
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+
+from ranking_api.layer_timing import instrument_layers, start_timing, stop_timing
+
+logger = logging.getLogger(__name__)
+
+
+class QueryStats:
+    # Query count and time spent in the database, summed over every alias.
+
+    def __init__(self):
+        self.count = 0
+        self.duration = 0.0
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.duration += time.perf_counter() - start
+            self.count += 1
+
+
+class QueryCountMiddleware:
+    # Counts and times the queries each request runs through
+    # connection.execute_wrapper, reports them in Server-Timing and
+    # X-DB-Queries headers, and logs requests over QUERY_BUDGET queries or
+    # QUERY_TIME_BUDGET_MS of database time. Queries a streaming response runs
+    # while its body is sent come after the headers and are not counted.
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        stats = QueryStats()
+        start = time.perf_counter()
+        with self._wrap_connections(stats):
+            response = self.get_response(request)
+        return self._finish(request, response, stats, time.perf_counter() - start)
+
+    async def __acall__(self, request):
+        # Connections are per thread, and an async request's ORM calls run in
+        # its thread-sensitive sync_to_async thread, so the wrappers go on
+        # that thread's connections.
+        stats = QueryStats()
+        start = time.perf_counter()
+        with await sync_to_async(self._wrap_connections)(stats):
+            response = await self.get_response(request)
+        return self._finish(request, response, stats, time.perf_counter() - start)
+
+    @staticmethod
+    def _wrap_connections(stats: QueryStats) -> ExitStack:
+        stack = ExitStack()
+        for connection in connections.all():
+            stack.enter_context(connection.execute_wrapper(stats))
+        return stack
+
+    def _finish(self, request, response, stats: QueryStats, elapsed: float):
+        db_ms = stats.duration * 1000
+        if settings.QUERY_STATS_HEADERS:
+            response['X-DB-Queries'] = str(stats.count)
+            _add_server_timing(response, f'db;dur={db_ms:.1f};desc="{stats.count} queries", total;dur={elapsed * 1000:.1f}')
+        if stats.count > settings.QUERY_BUDGET or db_ms > settings.QUERY_TIME_BUDGET_MS:
+            logger.warning(
+                '%s %s ran %d queries in %.1fms (budget %d queries, %.0fms)',
+                request.method, request.path, stats.count, db_ms,
+                settings.QUERY_BUDGET, settings.QUERY_TIME_BUDGET_MS
+            )
+        return response
+
+
+class ProfilingMiddleware:
+    # Opt-in diagnostics for slow endpoints; removed from the stack unless
+    # PROFILING_ENABLED is set or LAYER_TIMING_SAMPLE_RATE is above zero.
+    #
+    # A sync request carrying an X-Profile header or ?profile= parameter runs
+    # under cProfile when it comes from a staff user or the value matches
+    # PROFILING_TOKEN. The stats are written to PROFILING_DIR as
+    # <url name>-<timestamp>-<id>.prof, named in the X-Profile-File header.
+    #
+    # Independently, a LAYER_TIMING_SAMPLE_RATE fraction of requests reports
+    # the wall time spent in the controller, service and repository layers in
+    # Server-Timing, and logs it at INFO.
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        if not settings.PROFILING_ENABLED and settings.LAYER_TIMING_SAMPLE_RATE <= 0:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        if settings.LAYER_TIMING_SAMPLE_RATE > 0:
+            instrument_layers()
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        timer = start_timing() if self._sampled() else None
+        try:
+            if self._profiling_requested(request):
+                response = self._profile(request)
+            else:
+                response = self.get_response(request)
+        finally:
+            if timer is not None:
+                stop_timing()
+        return self._finish(request, response, timer)
+
+    async def __acall__(self, request):
+        # cProfile only sees the thread it runs on, which for an async request
+        # misses its sync_to_async work, so async requests get layer timing only.
+        timer = start_timing() if self._sampled() else None
+        try:
+            response = await self.get_response(request)
+        finally:
+            if timer is not None:
+                stop_timing()
+        return self._finish(request, response, timer)
+
+    @staticmethod
+    def _sampled() -> bool:
+        return random.random() < settings.LAYER_TIMING_SAMPLE_RATE
+
+    @staticmethod
+    def _profiling_requested(request) -> bool:
+        if not settings.PROFILING_ENABLED:
+            return False
+        value = request.headers.get('X-Profile') or request.GET.get('profile')
+        if not value:
+            return False
+        if settings.PROFILING_TOKEN and hmac.compare_digest(value.encode(), settings.PROFILING_TOKEN.encode()):
+            return True
+        user = getattr(request, 'user', None)
+        return user is not None and user.is_active and user.is_staff
+
+    def _profile(self, request):
+        profiler = cProfile.Profile()
+        try:
+            response = profiler.runcall(self.get_response, request)
+        finally:
+            path = self._dump(request, profiler)
+        response['X-Profile-File'] = os.path.basename(path)
+        return response
+
+    @staticmethod
+    def _dump(request, profiler: cProfile.Profile) -> str:
+        match = getattr(request, 'resolver_match', None)
+        route = (match.url_name if match is not None else None) or 'unresolved'
+        filename = f"{route}-{time.strftime('%Y%m%dT%H%M%S')}-{uuid.uuid4().hex[:8]}.prof"
+        os.makedirs(settings.PROFILING_DIR, exist_ok=True)
+        path = os.path.join(settings.PROFILING_DIR, filename)
+        profiler.dump_stats(path)
+        logger.info('Profiled %s %s to %s', request.method, request.path, path)
+        return path
+
+    @staticmethod
+    def _finish(request, response, timer):
+        if timer is not None:
+            _add_server_timing(response, timer.server_timing())
+            logger.info('Layer timing for %s %s: %s', request.method, request.path, timer.server_timing())
+        return response
+
+
+def _add_server_timing(response, metrics: str):
+    # Several middleware contribute metrics to the one header.
+    existing = response.get('Server-Timing')
+    response['Server-Timing'] = f'{existing}, {metrics}' if existing else metrics
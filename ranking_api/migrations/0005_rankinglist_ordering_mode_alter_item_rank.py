@@ -0,0 +1,23 @@
+# Generated by Django 5.1.6 on 2026-10-18 15:34
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ranking_api', '0004_rename_ranking_id_item_ranking'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='rankinglist',
+            name='ordering_mode',
+            field=models.CharField(choices=[('dense', 'Dense'), ('sparse', 'Sparse')], default='dense', max_length=10),
+        ),
+        migrations.AlterField(
+            model_name='item',
+            name='rank',
+            field=models.BigIntegerField(),
+        ),
+    ]
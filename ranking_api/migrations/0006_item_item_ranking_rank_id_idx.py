@@ -0,0 +1,17 @@
+# Generated by Django 5.1.6 on 2026-10-18 15:36
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ranking_api', '0005_rankinglist_ordering_mode_alter_item_rank'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='item',
+            index=models.Index(fields=['ranking', 'rank', 'id'], name='item_ranking_rank_id_idx'),
+        ),
+    ]
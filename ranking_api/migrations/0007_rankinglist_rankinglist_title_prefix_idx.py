@@ -0,0 +1,34 @@
+# Generated by Django 5.1.6 on 2026-10-18 15:37
+
+from django.db import migrations, models
+from django.db.models.functions import Collate
+
+# Must stay identical to ranking_api.repositories.ranking_repository._title_key,
+# otherwise the planner can't match queries to the index.
+TITLE_INDEX = models.Index(Collate('title', 'C'), 'id', name='rankinglist_title_id_idx')
+
+
+def add_title_index(apps, schema_editor):
+    # Postgres only. In byte order ("C") the index answers title LIKE 'prefix%'
+    # as a range whatever the database collation, and serves the (title, id)
+    # ordering of prefix pages. SQLite has no "C" collation.
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.add_index(apps.get_model('ranking_api', 'RankingList'), TITLE_INDEX)
+
+
+def remove_title_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute(f'DROP INDEX IF EXISTS {schema_editor.quote_name(TITLE_INDEX.name)}')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ranking_api', '0006_item_item_ranking_rank_id_idx'),
+    ]
+
+    operations = [
+        migrations.RunPython(add_title_index, remove_title_index),
+    ]
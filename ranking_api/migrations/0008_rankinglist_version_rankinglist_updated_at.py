@@ -0,0 +1,25 @@
+# Generated by Django 5.1.6 on 2026-10-18 16:12
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ranking_api', '0007_rankinglist_rankinglist_title_prefix_idx'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='rankinglist',
+            name='version',
+            field=models.PositiveBigIntegerField(default=1),
+        ),
+        migrations.AddField(
+            model_name='rankinglist',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True, default=django.utils.timezone.now),
+            preserve_default=False,
+        ),
+    ]
@@ -0,0 +1,57 @@
+# Generated by Django 5.1.6 on 2026-10-18 15:43
+
+import django.db.models.constraints
+from django.db import migrations, models
+from django.db.models import Count, Q
+
+SPARSE_RANK_GAP = 1 << 20
+
+
+def renumber_ranks(apps, schema_editor):
+    # Rankings written before this constraint can hold duplicate ranks (appends
+    # used to reuse the last rank), and dense rankings created before ranks
+    # were 1-based start at 0. Renumber every dense ranking to 1..n, and any
+    # sparse ranking holding duplicates to fresh gaps, in their current order
+    # so the constraint can be created.
+    Item = apps.get_model('ranking_api', 'Item')
+    RankingList = apps.get_model('ranking_api', 'RankingList')
+
+    sparse_with_duplicates = (
+        Item.objects
+        .filter(ranking__ordering_mode='sparse')
+        .values('ranking_id', 'rank')
+        .annotate(duplicates=Count('id'))
+        .filter(duplicates__gt=1)
+        .values_list('ranking_id', flat=True)
+        .distinct()
+    )
+    rankings = RankingList.objects.filter(Q(ordering_mode='dense') | Q(id__in=list(sparse_with_duplicates)))
+    for ranking in rankings.iterator():
+        gap = SPARSE_RANK_GAP if ranking.ordering_mode == 'sparse' else 1
+        items = list(Item.objects.filter(ranking_id=ranking.id).order_by('rank', 'id').only('id', 'rank'))
+        changed = []
+        for position, item in enumerate(items, start=1):
+            if item.rank != position * gap:
+                item.rank = position * gap
+                changed.append(item)
+        Item.objects.bulk_update(changed, ['rank'], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ranking_api', '0008_rankinglist_version_rankinglist_updated_at'),
+    ]
+
+    operations = [
+        migrations.RunPython(renumber_ranks, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='item',
+            constraint=models.UniqueConstraint(deferrable=django.db.models.constraints.Deferrable['DEFERRED'], fields=('ranking', 'rank'), name='item_unique_rank_per_ranking'),
+        ),
+        # The constraint's (ranking, rank) index serves the same ordered scans.
+        migrations.RemoveIndex(
+            model_name='item',
+            name='item_ranking_rank_id_idx',
+        ),
+    ]
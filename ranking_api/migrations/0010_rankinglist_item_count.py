@@ -0,0 +1,36 @@
+# Generated by Django 5.1.6 on 2026-10-18 18:05
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def count_items(apps, schema_editor):
+    Item = apps.get_model('ranking_api', 'Item')
+    RankingList = apps.get_model('ranking_api', 'RankingList')
+
+    counts = (
+        Item.objects
+        .filter(ranking_id=OuterRef('id'))
+        .order_by()
+        .values('ranking_id')
+        .annotate(total=Count('id'))
+        .values('total')
+    )
+    RankingList.objects.update(item_count=Coalesce(Subquery(counts), 0))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ranking_api', '0009_item_item_unique_rank_per_ranking'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='rankinglist',
+            name='item_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.RunPython(count_items, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,54 @@
+# Generated by Django 5.1.6 on 2026-10-18 18:40
+
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVector
+from django.db import migrations
+
+# Must stay identical to ranking_api.repositories.item_repository.SEARCH_VECTOR,
+# otherwise the planner can't match queries to the index.
+SEARCH_VECTOR = (
+    SearchVector('name', weight='A', config='english')
+    + SearchVector('notes', weight='B', config='english')
+)
+
+
+def search_indexes():
+    return [
+        GinIndex(SEARCH_VECTOR, name='item_search_vector_idx'),
+        GinIndex(fields=['name'], name='item_name_trgm_idx', opclasses=['gin_trgm_ops']),
+    ]
+
+
+def add_search_indexes(apps, schema_editor):
+    # Postgres only; other databases fall back to substring search. The trigram
+    # index is skipped where the server doesn't ship pg_trgm.
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    Item = apps.get_model('ranking_api', 'Item')
+    vector_index, trigram_index = search_indexes()
+    schema_editor.add_index(Item, vector_index)
+
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute("SELECT 1 FROM pg_available_extensions WHERE name = 'pg_trgm'")
+        if cursor.fetchone() is None:
+            return
+    schema_editor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    schema_editor.add_index(Item, trigram_index)
+
+
+def remove_search_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for index in search_indexes():
+        schema_editor.execute(f'DROP INDEX IF EXISTS {schema_editor.quote_name(index.name)}')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ranking_api', '0010_rankinglist_item_count'),
+    ]
+
+    operations = [
+        migrations.RunPython(add_search_indexes, remove_search_indexes),
+    ]
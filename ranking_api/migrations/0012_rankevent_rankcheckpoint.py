@@ -0,0 +1,54 @@
+# Generated by Django 5.1.6 on 2026-10-18 16:16
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+
+
+def create_baseline_checkpoints(apps, schema_editor):
+    # Nothing was logged before this migration, so record every ranking's
+    # current order as the point its history starts from.
+    Item = apps.get_model('ranking_api', 'Item')
+    RankCheckpoint = apps.get_model('ranking_api', 'RankCheckpoint')
+    RankingList = apps.get_model('ranking_api', 'RankingList')
+
+    for ranking_id in RankingList.objects.values_list('id', flat=True).iterator():
+        item_ids = list(Item.objects.filter(ranking_id=ranking_id).order_by('rank', 'id').values_list('id', flat=True))
+        RankCheckpoint.objects.create(ranking_id=ranking_id, last_event_id=0, item_ids=item_ids)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ranking_api', '0011_item_search_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RankCheckpoint',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('last_event_id', models.BigIntegerField()),
+                ('item_ids', models.JSONField()),
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('ranking', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='ranking_api.rankinglist')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['ranking', 'created_at'], name='rankcheckpoint_ranking_at_idx')],
+            },
+        ),
+        migrations.CreateModel(
+            name='RankEvent',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(choices=[('insert', 'Insert'), ('move', 'Move'), ('delete', 'Delete')], max_length=10)),
+                ('changes', models.JSONField()),
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('ranking', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='ranking_api.rankinglist')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['ranking', 'id'], name='rankevent_ranking_id_idx')],
+            },
+        ),
+        migrations.RunPython(create_baseline_checkpoints, migrations.RunPython.noop),
+    ]
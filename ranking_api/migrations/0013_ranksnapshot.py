@@ -0,0 +1,43 @@
+# Generated by Django 5.1.6 on 2026-10-18 16:22
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ranking_api', '0012_rankevent_rankcheckpoint'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='rankevent',
+            name='items',
+            field=models.JSONField(default=list),
+        ),
+        migrations.AlterField(
+            model_name='rankevent',
+            name='kind',
+            field=models.CharField(choices=[('insert', 'Insert'), ('move', 'Move'), ('delete', 'Delete'), ('import', 'Import')], max_length=10),
+        ),
+        migrations.AddIndex(
+            model_name='rankcheckpoint',
+            index=models.Index(fields=['ranking', 'last_event_id'], name='rankcheckpoint_ranking_ev_idx'),
+        ),
+        migrations.CreateModel(
+            name='RankSnapshot',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(blank=True, max_length=255, null=True)),
+                ('ranking_version', models.PositiveBigIntegerField()),
+                ('last_event_id', models.BigIntegerField()),
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('ranking', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='ranking_api.rankinglist')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['ranking', 'id'], name='ranksnapshot_ranking_id_idx')],
+            },
+        ),
+    ]
@@ -1,2 +1,4 @@
 from .ranking_list import RankingList
-from .item import Item
\ No newline at end of file
+from .item import Item
+from .rank_event import RankCheckpoint, RankEvent
+from .rank_snapshot import RankSnapshot
\ No newline at end of file
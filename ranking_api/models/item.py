@@ -4,8 +4,19 @@ from ranking_api.models.ranking_list import RankingList
 class Item(models.Model):
     name = models.CharField(max_length=255)
     notes = models.TextField(blank=True, null=True)
-    rank = models.IntegerField()
+    rank = models.BigIntegerField()
     ranking = models.ForeignKey(RankingList, on_delete=models.CASCADE)
 
+    class Meta:
+        constraints = [
+            # Deferred so multi-row shifts (rank = rank + 1) and respacing may
+            # pass through transient duplicates inside a transaction.
+            models.UniqueConstraint(
+                fields=['ranking', 'rank'],
+                name='item_unique_rank_per_ranking',
+                deferrable=models.Deferrable.DEFERRED,
+            ),
+        ]
+
     def __str__(self):
-        return self.name
\ No newline at end of file
+        return self.name
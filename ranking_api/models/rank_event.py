@@ -0,0 +1,54 @@
+from django.db import models
+from django.utils import timezone
+
+from ranking_api.models.ranking_list import RankingList
+
+
+class RankEvent(models.Model):
+    # Append-only log of rank-changing operations, one row per operation however
+    # many items it shifted. `changes` holds, in the order they were applied:
+    #   insert: [[item_id, position], ...] - the item lands at that 1-based position
+    #   move:   [[item_id, position], ...] - the item is taken out and put back there
+    #   delete: [item_id, ...]
+    #   import: [] - a bulk append too large to list; it is checkpointed at this
+    #           event, so replays start from that checkpoint instead of applying it
+    # Delete events also keep [item_id, name, notes] for every item they removed
+    # in `items`, so restoring a snapshot can bring the items back.
+    INSERT = 'insert'
+    MOVE = 'move'
+    DELETE = 'delete'
+    IMPORT = 'import'
+    KIND_CHOICES = [
+        (INSERT, 'Insert'),
+        (MOVE, 'Move'),
+        (DELETE, 'Delete'),
+        (IMPORT, 'Import'),
+    ]
+
+    ranking = models.ForeignKey(RankingList, on_delete=models.CASCADE)
+    kind = models.CharField(max_length=10, choices=KIND_CHOICES)
+    changes = models.JSONField()
+    items = models.JSONField(default=list)
+    created_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['ranking', 'id'], name='rankevent_ranking_id_idx'),
+        ]
+
+
+class RankCheckpoint(models.Model):
+    # The ranking's full order (item ids, top first) after event `last_event_id`,
+    # so replays start from the nearest checkpoint instead of the first event.
+    # last_event_id 0 marks the baseline taken when the log was introduced;
+    # there is no history before it.
+    ranking = models.ForeignKey(RankingList, on_delete=models.CASCADE)
+    last_event_id = models.BigIntegerField()
+    item_ids = models.JSONField()
+    created_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['ranking', 'created_at'], name='rankcheckpoint_ranking_at_idx'),
+            models.Index(fields=['ranking', 'last_event_id'], name='rankcheckpoint_ranking_ev_idx'),
+        ]
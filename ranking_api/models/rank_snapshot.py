@@ -0,0 +1,25 @@
+from django.db import models
+from django.utils import timezone
+
+from ranking_api.models.ranking_list import RankingList
+
+
+class RankSnapshot(models.Model):
+    # A saved point in a ranking's rank log: the order left by the ranking's
+    # events up to `last_event_id`. Storing the pointer rather than the order
+    # keeps taking a snapshot to one small row however large the ranking is.
+    # A restore rebuilds the order from the nearest checkpoint plus at most one
+    # checkpoint interval of events, and brings deleted items back from the
+    # details their delete events keep (see RankEvent).
+    ranking = models.ForeignKey(RankingList, on_delete=models.CASCADE)
+    # None for automatic snapshots, taken at each move or delete as the point
+    # to undo it to. Only the newest AUTOMATIC_SNAPSHOT_LIMIT are kept.
+    name = models.CharField(max_length=255, blank=True, null=True)
+    ranking_version = models.PositiveBigIntegerField()
+    last_event_id = models.BigIntegerField()
+    created_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['ranking', 'id'], name='ranksnapshot_ranking_id_idx'),
+        ]
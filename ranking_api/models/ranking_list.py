@@ -1,8 +1,24 @@
 from django.db import models
 
 class RankingList(models.Model):
+    DENSE = 'dense'
+    SPARSE = 'sparse'
+    ORDERING_MODE_CHOICES = [
+        (DENSE, 'Dense'),
+        (SPARSE, 'Sparse'),
+    ]
+
     title = models.CharField(max_length=255)
     description = models.TextField(blank=True, null=True)
+    # Dense rankings store positions 1..n in Item.rank. Sparse rankings store
+    # gapped sort keys there instead, so an insert or move rewrites one row.
+    ordering_mode = models.CharField(max_length=10, choices=ORDERING_MODE_CHOICES, default=DENSE)
+    # Bumped on every change to the ranking or its items; drives ETag/Last-Modified
+    # and the ItemListCache keys.
+    version = models.PositiveBigIntegerField(default=1)
+    updated_at = models.DateTimeField(auto_now=True)
+    # Number of items, kept in step by ItemService's writes so readers never need a COUNT(*).
+    item_count = models.PositiveIntegerField(default=0)
 
     def __str__(self):
-        return self.title
\ No newline at end of file
+        return self.title
@@ -0,0 +1,67 @@
+import base64
+import json
+from typing import Optional
+
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+DEFAULT_RADIUS = 5
+
+
+def encode_cursor(values: dict) -> str:
+    payload = json.dumps(values, separators=(',', ':')).encode()
+    return base64.urlsafe_b64encode(payload).decode().rstrip('=')
+
+
+def decode_cursor(cursor: str) -> dict:
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (ValueError, TypeError):
+        raise ValueError('Invalid cursor')
+    if not isinstance(values, dict):
+        raise ValueError('Invalid cursor')
+    return values
+
+
+def parse_limit(value: Optional[str]) -> int:
+    if value is None:
+        return DEFAULT_PAGE_SIZE
+    return min(_parse_positive(value, 'limit'), MAX_PAGE_SIZE)
+
+
+def parse_rank_window(top: Optional[str], rank_from: Optional[str], rank_to: Optional[str]) -> tuple[int, int]:
+    # Inclusive (first, last) ranks for ?top=K or ?rank_from=&rank_to=, never
+    # wider than one page.
+    if top is not None:
+        if rank_from is not None or rank_to is not None:
+            raise ValueError('top cannot be combined with rank_from or rank_to')
+        return 1, min(_parse_positive(top, 'top'), MAX_PAGE_SIZE)
+
+    first = 1 if rank_from is None else _parse_positive(rank_from, 'rank_from')
+    last = first + DEFAULT_PAGE_SIZE - 1 if rank_to is None else _parse_positive(rank_to, 'rank_to')
+    if last < first:
+        raise ValueError('rank_to must not be less than rank_from')
+    return first, min(last, first + MAX_PAGE_SIZE - 1)
+
+
+def parse_radius(value: Optional[str]) -> int:
+    # Items on each side of ?radius=; the whole window stays within one page.
+    if value is None:
+        return DEFAULT_RADIUS
+    try:
+        radius = int(value)
+    except (TypeError, ValueError):
+        raise ValueError('radius must be an integer')
+    if radius < 0:
+        raise ValueError('radius must not be negative')
+    return min(radius, MAX_PAGE_SIZE // 2)
+
+
+def _parse_positive(value: str, name: str) -> int:
+    try:
+        number = int(value)
+    except (TypeError, ValueError):
+        raise ValueError(f'{name} must be an integer')
+    if number < 1:
+        raise ValueError(f'{name} must be at least 1')
+    return number
@@ -0,0 +1,43 @@
+from bisect import bisect_left
+from typing import Sequence
+
+
+def longest_increasing_run(values: Sequence[int]) -> set[int]:
+    # Indices of one longest strictly increasing subsequence of `values`
+    # (patience sorting, O(n log n)).
+    tails, tail_indices = [], []
+    previous = [-1] * len(values)
+    for index, value in enumerate(values):
+        slot = bisect_left(tails, value)
+        if slot == len(tails):
+            tails.append(value)
+            tail_indices.append(index)
+        else:
+            tails[slot] = value
+            tail_indices[slot] = index
+        previous[index] = tail_indices[slot - 1] if slot else -1
+
+    run = set()
+    index = tail_indices[-1] if tail_indices else -1
+    while index != -1:
+        run.add(index)
+        index = previous[index]
+    return run
+
+
+def diff_orders(base: Sequence[int], target: Sequence[int]) -> dict:
+    # Edit script that turns the item order `base` into `target`: drop the
+    # `removed` ids and the `placed` ones, then insert each placed [item_id,
+    # index] in ascending index. Items on a longest run that kept its relative
+    # order stay where they are, so the script grows with the change rather
+    # than the list: moving one item costs one entry.
+    base_index = {item_id: index for index, item_id in enumerate(base)}
+    shared = [(index, base_index[item_id]) for index, item_id in enumerate(target) if item_id in base_index]
+    kept = {shared[position][0] for position in longest_increasing_run([old for _, old in shared])}
+
+    target_ids = set(target)
+    return {
+        'removed': [item_id for item_id in base if item_id not in target_ids],
+        'placed': [[item_id, index] for index, item_id in enumerate(target) if index not in kept],
+    }
+
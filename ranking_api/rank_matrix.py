@@ -0,0 +1,39 @@
+from itertools import chain
+from typing import Hashable
+
+import numpy as np
+
+
+def build_rank_matrix(ranked_keys: dict[int, list[Hashable]], ranking_ids: list[int]) -> tuple[list, np.ndarray]:
+    # Turns each ranking's keys, in rank order, into the sorted candidate keys
+    # and an (rankings x candidates) matrix of 0-based positions, one row per
+    # entry of ranking_ids. A ranking that leaves candidates out ties them at
+    # the average of the positions it didn't use; a key repeated within a
+    # ranking keeps its best position.
+    lists = [ranked_keys.get(ranking_id, []) for ranking_id in ranking_ids]
+    candidates = sorted(set(chain.from_iterable(lists)))
+    if not candidates:
+        return candidates, np.zeros((len(ranking_ids), 0))
+
+    candidate_index = {key: index for index, key in enumerate(candidates)}
+    lengths = np.fromiter(map(len, lists), dtype=np.int64, count=len(lists))
+    row_ranking = np.repeat(np.arange(len(lists)), lengths)
+    row_candidate = np.fromiter(
+        (candidate_index[key] for key in chain.from_iterable(lists)), dtype=np.int64, count=len(row_ranking)
+    )
+
+    # np.unique returns each (ranking, candidate) pair's first row, i.e. its best rank.
+    size = len(candidates)
+    _, first = np.unique(row_ranking * size + row_candidate, return_index=True)
+    first.sort()
+    row_ranking, row_candidate = row_ranking[first], row_candidate[first]
+
+    # Rows are grouped by ranking, so a row's position is its offset from the
+    # start of its group.
+    counts = np.bincount(row_ranking, minlength=len(lists))
+    starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+    positions = np.arange(len(row_ranking)) - starts[row_ranking]
+
+    matrix = np.repeat(((counts + size - 1) / 2)[:, None], size, axis=1)
+    matrix[row_ranking, row_candidate] = positions
+    return candidates, matrix
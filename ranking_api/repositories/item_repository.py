@@ -1,7 +1,31 @@
-from django.db.models import F
+from itertools import groupby, islice
+from operator import itemgetter
+
+from django.contrib.postgres.aggregates import ArrayAgg
+from django.contrib.postgres.search import SearchQuery, SearchRank, SearchVector, TrigramSimilarity
+from django.db import connection, transaction
+from django.utils import timezone
+from django.db.models import BigIntegerField, Case, Count, F, FloatField, Max, OuterRef, Q, Subquery, Value, When
+from django.db.models.functions import Cast, Coalesce
+
+from ranking_api.models import Item, RankingList
+from ranking_api.serializers import ITEM_FIELDS
+from typing import AsyncIterator, Iterable, Iterator, List, Optional, Tuple
+
+# Rows per INSERT when an import falls back to bulk_create.
+IMPORT_BATCH_SIZE = 5000
+
+# Text search configuration and document for Postgres full-text search. Migration
+# 0011 builds a GIN index on this exact expression; change both together.
+SEARCH_CONFIG = 'english'
+SEARCH_VECTOR = (
+    SearchVector('name', weight='A', config=SEARCH_CONFIG)
+    + SearchVector('notes', weight='B', config=SEARCH_CONFIG)
+)
+
+# Whether pg_trgm is installed, per database alias; looked up once per process.
+_trigram_available = {}
 
-from ranking_api.models import Item
-from typing import List, Optional
 
 class ItemRepository:
     def __init__(self):
@@ -9,7 +33,7 @@ class ItemRepository:
 
     def get_item(self, item_id) -> Optional[Item]:
         try:
-            return self.model.objects.get(
+            return self.model.objects.select_related('ranking').get(
                 id = item_id
             )
         except self.model.DoesNotExist:
@@ -22,6 +46,137 @@ class ItemRepository:
             .order_by('rank')
         )
 
+    def get_all_item_rows(self, ranking_id: int) -> List[dict]:
+        return list(self._item_rows(ranking_id))
+
+    def iter_item_rows(self, ranking_id: int, chunk_size: int = 2000) -> Iterator[dict]:
+        # iterator() streams rows through a server-side cursor on Postgres
+        # instead of materialising the whole result set.
+        return self._item_rows(ranking_id).iterator(chunk_size=chunk_size)
+
+    def get_item_rows_page(self, ranking_id: int, limit: int, after: Optional[Tuple[int, int]] = None) -> List[dict]:
+        return list(self._item_rows(ranking_id, after)[:limit])
+
+    def get_item_rows_in_rank_range(self, ranking_id: int, rank_from: int, rank_to: int) -> List[dict]:
+        # An index range scan on (ranking, rank); the LIMIT caps the rows read
+        # even if the ranking has picked up duplicate or gapped ranks.
+        return list(
+            self._item_rows(ranking_id)
+            .filter(rank__range=(rank_from, rank_to))[:rank_to - rank_from + 1]
+        )
+
+    def get_item_rows_at_positions(self, ranking_id: int, offset: int, limit: int) -> List[dict]:
+        # For sparse rankings, whose stored ranks aren't positions: walks the
+        # (ranking, rank) index and skips `offset` rows.
+        return list(self._item_rows(ranking_id)[offset:offset + limit])
+
+    def get_item_rows_around(self, ranking_id: int, rank: int, radius: int) -> Tuple[List[dict], List[dict]]:
+        # For sparse rankings: up to `radius` rows before the stored rank (nearest
+        # first) and the row at it plus up to `radius` after it, each a LIMIT-ed
+        # walk of the (ranking, rank) index in one direction.
+        queryset = self.model.objects.filter(ranking_id=ranking_id)
+        before = list(queryset.filter(rank__lt=rank).order_by('-rank', '-id').values(*ITEM_FIELDS)[:radius])
+        after = list(self._item_rows(ranking_id).filter(rank__gte=rank)[:radius + 1])
+        return before, after
+
+    def search_item_rows(self, query: str, limit: int, ranking_id: Optional[int] = None,
+                         after: Optional[Tuple[float, int]] = None) -> List[dict]:
+        # Matching rows with a relevance `score`, best first. Keyset pagination on
+        # (score, id): `after` is the last row of the previous page.
+        queryset = self.model.objects.all()
+        if ranking_id is not None:
+            queryset = queryset.filter(ranking_id=ranking_id)
+        if connection.vendor == 'postgresql':
+            queryset = self._postgres_search(queryset, query)
+        else:
+            queryset = self._fallback_search(queryset, query)
+
+        if after is not None:
+            after_score, after_id = after
+            queryset = queryset.filter(Q(score__lt=after_score) | Q(score=after_score, id__gt=after_id))
+        return list(queryset.order_by('-score', 'id').values(*ITEM_FIELDS, 'score')[:limit])
+
+    def _postgres_search(self, queryset, query: str):
+        # Full-text matches come from the GIN index on SEARCH_VECTOR; with pg_trgm
+        # installed, names within trigram distance (typos) match too, through
+        # their own GIN index. The score is cast to double precision so it
+        # survives the round trip through a cursor exactly.
+        search_query = SearchQuery(query, search_type='websearch', config=SEARCH_CONFIG)
+        matches = Q(search=search_query)
+        score = SearchRank(SEARCH_VECTOR, search_query)
+        if self._has_trigram():
+            matches |= Q(name__trigram_similar=query)
+            score = score + TrigramSimilarity('name', query)
+        return (
+            queryset
+            .annotate(search=SEARCH_VECTOR, score=Cast(score, FloatField()))
+            .filter(matches)
+        )
+
+    def _fallback_search(self, queryset, query: str):
+        # Portable substring search for SQLite: every word has to appear in the
+        # name or notes, and a word found in the name counts double.
+        terms = query.split()
+        score = Value(0.0)
+        for term in terms:
+            queryset = queryset.filter(Q(name__icontains=term) | Q(notes__icontains=term))
+            score = score + Case(
+                When(name__icontains=term, then=Value(2.0)),
+                default=Value(1.0),
+                output_field=FloatField()
+            )
+        return queryset.annotate(score=Cast(score, FloatField()))
+
+    def _has_trigram(self) -> bool:
+        if connection.alias not in _trigram_available:
+            with connection.cursor() as cursor:
+                cursor.execute("SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm'")
+                _trigram_available[connection.alias] = cursor.fetchone() is not None
+        return _trigram_available[connection.alias]
+
+    def get_ranking_modes(self, ranking_ids: Iterable[int]) -> dict[int, str]:
+        return dict(
+            RankingList.objects
+            .filter(id__in=ranking_ids)
+            .values_list('id', 'ordering_mode')
+        )
+
+    def get_item_names(self, item_ids: Iterable[int]) -> dict[int, str]:
+        return dict(self.model.objects.filter(id__in=item_ids).values_list('id', 'name'))
+
+    def get_ranked_keys(self, ranking_ids: List[int], key_field: str = 'name') -> dict[int, List[str]]:
+        # Each ranking's item keys (names by default) in rank order, from one
+        # query; items with no key are left out. Postgres aggregates every
+        # ranking into a single array, which halves the rows and Python objects
+        # to build compared with one row per item.
+        queryset = (
+            self.model.objects
+            .filter(ranking_id__in=ranking_ids, **{f'{key_field}__isnull': False})
+            .exclude(**{key_field: ''})
+        )
+        if connection.vendor == 'postgresql':
+            return dict(
+                queryset
+                .values('ranking_id')
+                .order_by('ranking_id')
+                .annotate(keys=ArrayAgg(key_field, ordering=('rank', 'id')))
+                .values_list('ranking_id', 'keys')
+            )
+        rows = queryset.order_by('ranking_id', 'rank', 'id').values_list('ranking_id', key_field)
+        return {
+            ranking_id: [key for _, key in group]
+            for ranking_id, group in groupby(rows, key=itemgetter(0))
+        }
+
+    def _item_rows(self, ranking_id: int, after: Optional[Tuple[int, int]] = None):
+        # Keyset pagination on (rank, id): each page is a range scan that starts
+        # right after the previous page's last row instead of an OFFSET.
+        queryset = self.model.objects.filter(ranking_id=ranking_id)
+        if after is not None:
+            after_rank, after_id = after
+            queryset = queryset.filter(Q(rank__gt=after_rank) | Q(rank=after_rank, id__gt=after_id))
+        return queryset.order_by('rank', 'id').values(*ITEM_FIELDS)
+
     def create_item(self, name: str, ranking_id: int, notes: Optional[str] = None, rank: Optional[int] = None) -> Item:
         return self.model.objects.create(
             name = name,
@@ -30,31 +185,265 @@ class ItemRepository:
             ranking_id = ranking_id,
         )
 
+    def bulk_create_items(self, ranking_id: int, items: List[dict], batch_size: int = 1000) -> List[Item]:
+        return self.model.objects.bulk_create(
+            [
+                self.model(
+                    name = item['name'],
+                    notes = item['notes'] if item.get('notes') is not None else '',
+                    rank = item['rank'],
+                    ranking_id = ranking_id,
+                ) for item in items
+            ],
+            batch_size=batch_size,
+        )
+
     def count_items_in_ranking(self, ranking_id: int) -> int:
         return self.model.objects.filter(ranking_id=ranking_id).count()
 
+    def get_max_rank(self, ranking_id: int) -> Optional[int]:
+        return self.model.objects.filter(ranking_id=ranking_id).aggregate(Max('rank'))['rank__max']
+
     def shift_ranks_for_insert(self, ranking_id: int, insert_rank: int):
         self.model.objects.filter(
             ranking_id=ranking_id,
             rank__gte=insert_rank
         ).update(rank=F('rank') + 1)
 
-    def shift_ranks_down(self, ranking_id: int, start: int, end: int):
+    def shift_ranks_for_bulk_insert(self, ranking_id: int, shifts: List[Tuple[int, int]]) -> int:
+        # shifts holds (from_rank, offset) pairs: every item at or below from_rank
+        # moves down by offset, the largest from_rank that applies winning. One
+        # UPDATE with a WHEN per insert position, however many items are inserted.
+        if not shifts:
+            return 0
+        shifts = sorted(shifts, reverse=True)
+        return self.model.objects.filter(
+            ranking_id=ranking_id,
+            rank__gte=shifts[-1][0]
+        ).update(rank=Case(
+            *[When(rank__gte=from_rank, then=F('rank') + offset) for from_rank, offset in shifts],
+            default=F('rank'),
+            output_field=BigIntegerField()
+        ))
+
+    def move_item(self, ranking_id: int, item_id: int, old_rank: int, new_rank: int):
+        # One UPDATE both shifts the items in between and places the moved item,
+        # so (ranking, rank) is unique again by the end of the statement.
+        if new_rank < old_rank:
+            low, high, shifted_rank = new_rank, old_rank, F('rank') + 1
+        else:
+            low, high, shifted_rank = old_rank, new_rank, F('rank') - 1
+
         self.model.objects.filter(
             ranking_id=ranking_id,
-            rank__gte=start,
-            rank__lte=end
-        ).update(rank=F('rank') + 1)
+            rank__gte=low,
+            rank__lte=high
+        ).update(rank=Case(
+            When(id=item_id, then=Value(new_rank)),
+            default=shifted_rank,
+            output_field=BigIntegerField()
+        ))
+
+    def get_ranking_id(self, item_id: int) -> Optional[int]:
+        return self.model.objects.filter(id=item_id).values_list('ranking_id', flat=True).first()
+
+    def get_ordering_mode(self, ranking_id: int) -> Optional[str]:
+        return self._ordering_mode(ranking_id).first()
+
+    def _ordering_mode(self, ranking_id: int):
+        return RankingList.objects.filter(id=ranking_id).values_list('ordering_mode', flat=True)
+
+    def lock_ranking(self, ranking_id: int) -> Optional[str]:
+        # Row-locks the RankingList (SELECT ... FOR UPDATE) until the surrounding
+        # transaction ends and returns its ordering mode, or None if it is missing.
+        return (
+            RankingList.objects
+            .select_for_update()
+            .filter(id=ranking_id)
+            .values_list('ordering_mode', flat=True)
+            .first()
+        )
+
+    def get_ranking_version(self, ranking_id: int) -> Optional[int]:
+        return self._ranking_version(ranking_id).first()
+
+    def get_item_count(self, ranking_id: int) -> Optional[int]:
+        return RankingList.objects.filter(id=ranking_id).values_list('item_count', flat=True).first()
+
+    def _ranking_version(self, ranking_id: int):
+        return RankingList.objects.filter(id=ranking_id).values_list('version', flat=True)
+
+    def touch_ranking(self, ranking_id: int, item_delta: int = 0):
+        # Bumps the version and, when items were added or removed, the item count.
+        changes = {'version': F('version') + 1, 'updated_at': timezone.now()}
+        if item_delta:
+            changes['item_count'] = F('item_count') + item_delta
+        RankingList.objects.filter(id=ranking_id).update(**changes)
+
+    def count_items_before(self, ranking_id: int, rank: int) -> int:
+        return self.model.objects.filter(ranking_id=ranking_id, rank__lt=rank).count()
+
+    def get_item_positions(self, item_ids: Iterable[int]) -> dict[int, int]:
+        # 1-based positions of the given items within their rankings, counted
+        # in one query rather than one count_items_before per item.
+        items_before = (
+            self.model.objects
+            .filter(ranking_id=OuterRef('ranking_id'), rank__lt=OuterRef('rank'))
+            .order_by()
+            .values('ranking_id')
+            .annotate(count=Count('id'))
+            .values('count')
+        )
+        return dict(
+            self.model.objects
+            .filter(id__in=item_ids)
+            .annotate(position=Coalesce(Subquery(items_before), 0) + 1)
+            .values_list('id', 'position')
+        )
+
+    def get_neighbor_ranks(self, ranking_id: int, position: Optional[int] = None,
+                           exclude_item_id: Optional[int] = None) -> Tuple[Optional[int], Optional[int]]:
+        # Stored ranks of the items directly above and below the 1-based
+        # position; position=None means "append after the last item".
+        queryset = self.model.objects.filter(ranking_id=ranking_id)
+        if exclude_item_id is not None:
+            queryset = queryset.exclude(id=exclude_item_id)
+        ranks = queryset.order_by('rank').values_list('rank', flat=True)
 
-    def shift_ranks_up(self, ranking_id: int, start: int, end: Optional[int] = None):
-        queryset = self.model.objects.filter(
+        if position is not None and position <= 1:
+            return None, ranks.first()
+
+        if position is not None:
+            window = list(ranks[position - 2:position])
+            if window:
+                return window[0], window[1] if len(window) > 1 else None
+
+        return queryset.aggregate(Max('rank'))['rank__max'], None
+
+    def set_rank(self, item_id: int, rank: int):
+        self.model.objects.filter(id=item_id).update(rank=rank)
+
+    def respace_ranks(self, ranking_id: int, gap: int):
+        item_ids = (
+            self.model.objects
+            .filter(ranking_id=ranking_id)
+            .order_by('rank', 'id')
+            .values_list('id', flat=True)
+        )
+        # The batches may collide with each other's old keys; the unique rank
+        # constraint is deferred, so it only has to hold once the block commits.
+        with transaction.atomic():
+            self.model.objects.bulk_update(
+                [self.model(id=item_id, rank=index * gap) for index, item_id in enumerate(item_ids, start=1)],
+                ['rank'],
+                batch_size=1000,
+            )
+
+    def get_ranked_item_ids(self, ranking_id: int) -> List[Tuple[int, int]]:
+        return list(
+            self.model.objects
+            .filter(ranking_id=ranking_id)
+            .order_by('rank', 'id')
+            .values_list('id', 'rank')
+        )
+
+    def get_item_details(self, ranking_id: int, item_ids: Iterable[int]) -> List[Tuple[int, str, Optional[str]]]:
+        return list(
+            self.model.objects
+            .filter(ranking_id=ranking_id, id__in=item_ids)
+            .values_list('id', 'name', 'notes')
+        )
+
+    def recreate_items(self, ranking_id: int, items: List[Tuple[int, str, Optional[str], int]]) -> List[Item]:
+        # Puts deleted items back under their old ids, as (id, name, notes, rank).
+        return self.model.objects.bulk_create(
+            self.model(id=item_id, name=name, notes=notes, rank=rank, ranking_id=ranking_id)
+            for item_id, name, notes, rank in items
+        )
+
+    def apply_ranks(self, ranking_id: int, ranks: dict[int, int]) -> int:
+        if not ranks:
+            return 0
+        if connection.vendor == 'postgresql':
+            # A join against two unnested arrays plans in constant time, where
+            # a CASE with a branch per item gets slow to build and run once
+            # thousands of ranks change (a restore, a large drag session).
+            table = connection.ops.quote_name(self.model._meta.db_table)
+            rank = connection.ops.quote_name('rank')
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    f"""
+                    UPDATE {table} SET {rank} = new.rank
+                    FROM unnest(%s::bigint[], %s::bigint[]) AS new (id, rank)
+                    WHERE {table}.id = new.id AND {table}.ranking_id = %s
+                    """,
+                    [list(ranks.keys()), list(ranks.values()), ranking_id]
+                )
+                return cursor.rowcount
+        return self.model.objects.filter(
             ranking_id=ranking_id,
-            rank__gte=start
+            id__in=ranks.keys()
+        ).update(rank=Case(
+            *[When(id=item_id, then=Value(rank)) for item_id, rank in ranks.items()],
+            default=F('rank'),
+            output_field=BigIntegerField()
+        ))
+
+    def import_items(self, ranking_id: int, rows: Iterable[Tuple[str, Optional[str]]], first_rank: int, gap: int) -> int:
+        # Appends (name, notes) rows in order with ranks first_rank,
+        # first_rank + gap, ... and returns how many were written. Postgres
+        # streams them through COPY FROM STDIN; other backends insert a batch
+        # at a time. Either way only one batch is held in memory.
+        if connection.vendor == 'postgresql':
+            return self._copy_items(ranking_id, rows, first_rank, gap)
+
+        ranked = ((name, notes, first_rank + index * gap) for index, (name, notes) in enumerate(rows))
+        imported = 0
+        while batch := list(islice(ranked, IMPORT_BATCH_SIZE)):
+            self.model.objects.bulk_create(
+                self.model(name=name, notes=notes, rank=rank, ranking_id=ranking_id) for name, notes, rank in batch
+            )
+            imported += len(batch)
+        return imported
+
+    def _copy_items(self, ranking_id: int, rows: Iterable[Tuple[str, Optional[str]]], first_rank: int, gap: int) -> int:
+        # Imported here because it needs a Postgres driver, which other
+        # backends don't install.
+        from django.db.backends.postgresql.psycopg_any import is_psycopg3
+
+        table = connection.ops.quote_name(self.model._meta.db_table)
+        columns = ', '.join(connection.ops.quote_name(column) for column in ('name', 'notes', 'rank', 'ranking_id'))
+        sql = f"COPY {table} ({columns}) FROM STDIN"
+        if is_psycopg3:
+            return self._copy_rows(sql, ranking_id, rows, first_rank, gap)
+
+        suffix = f'\t{ranking_id}\n'
+        reader = _CopyReader(
+            f'{_copy_value(name)}\t{_copy_value(notes)}\t{first_rank + index * gap}{suffix}'
+            for index, (name, notes) in enumerate(rows)
         )
-        if end is not None:
-            queryset = queryset.filter(rank__lte=end)
+        with connection.cursor() as cursor:
+            try:
+                cursor.copy_expert(sql, reader)
+            except Exception:
+                # psycopg2 reports an error raised while reading the rows as a
+                # cancelled COPY; surface the original (e.g. a bad input row).
+                if reader.error is not None:
+                    raise reader.error
+                raise
+        return reader.lines
 
-        queryset.update(rank=F('rank') - 1)
+    @staticmethod
+    def _copy_rows(sql: str, ranking_id: int, rows: Iterable[Tuple[str, Optional[str]]], first_rank: int, gap: int) -> int:
+        # psycopg 3 (DB_POOL mode) has no copy_expert; its cursor.copy() takes
+        # rows one at a time and does the COPY escaping itself.
+        imported = 0
+        with connection.cursor() as cursor:
+            with cursor.copy(sql) as copy:
+                for name, notes in rows:
+                    copy.write_row((name, notes, first_rank + imported * gap, ranking_id))
+                    imported += 1
+        return imported
 
     def delete_item(self, item_id: int) -> bool:
         try:
@@ -64,9 +453,34 @@ class ItemRepository:
         except self.model.DoesNotExist:
             return False
 
+    def delete_items(self, ranking_id: int, item_ids: List[int]) -> int:
+        deleted, _ = self.model.objects.filter(ranking_id=ranking_id, id__in=item_ids).delete()
+        return deleted
+
+    def compact_ranks(self, ranking_id: int) -> int:
+        # Renumbers the ranking to 1..n in (rank, id) order with a single
+        # UPDATE ... FROM over a ROW_NUMBER() window. The ORM can't put a window
+        # in an UPDATE, hence the raw SQL. Rows already in place aren't written.
+        table = connection.ops.quote_name(self.model._meta.db_table)
+        rank = connection.ops.quote_name('rank')
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"""
+                UPDATE {table} SET {rank} = ordered.position
+                FROM (
+                    SELECT id, ROW_NUMBER() OVER (ORDER BY {rank}, id) AS position
+                    FROM {table}
+                    WHERE ranking_id = %s
+                ) AS ordered
+                WHERE {table}.id = ordered.id AND {table}.{rank} <> ordered.position
+                """,
+                [ranking_id]
+            )
+            return cursor.rowcount
+
     def patch_item(self, item_id: int, name: str = None, notes: str = None):
         try:
-            item = self.model.objects.get(id=item_id)
+            item = self.model.objects.select_related('ranking').get(id=item_id)
             if name is not None:
                 item.name = name
             if notes is not None:
@@ -74,4 +488,83 @@ class ItemRepository:
             item.save()
             return item
         except self.model.DoesNotExist:
-            return None
\ No newline at end of file
+            return None
+
+    # Async variants used by the ASGI controllers. They run the same queries
+    # through Django's async ORM, so a request waiting on the database or on a
+    # slow client doesn't tie up a worker thread.
+
+    async def aget_item(self, item_id) -> Optional[Item]:
+        try:
+            return await self.model.objects.select_related('ranking').aget(
+                id = item_id
+            )
+        except self.model.DoesNotExist:
+            return None
+
+    async def aget_all_item_rows(self, ranking_id: int) -> List[dict]:
+        return [row async for row in self._item_rows(ranking_id)]
+
+    def aiter_item_rows(self, ranking_id: int, chunk_size: int = 2000) -> AsyncIterator[dict]:
+        return self._item_rows(ranking_id).aiterator(chunk_size=chunk_size)
+
+    async def aget_item_rows_page(self, ranking_id: int, limit: int, after: Optional[Tuple[int, int]] = None) -> List[dict]:
+        return [row async for row in self._item_rows(ranking_id, after)[:limit]]
+
+    async def aget_item_rows_in_rank_range(self, ranking_id: int, rank_from: int, rank_to: int) -> List[dict]:
+        return [
+            row async for row in
+            self._item_rows(ranking_id).filter(rank__range=(rank_from, rank_to))[:rank_to - rank_from + 1]
+        ]
+
+    async def aget_item_rows_at_positions(self, ranking_id: int, offset: int, limit: int) -> List[dict]:
+        return [row async for row in self._item_rows(ranking_id)[offset:offset + limit]]
+
+    async def aget_ordering_mode(self, ranking_id: int) -> Optional[str]:
+        return await self._ordering_mode(ranking_id).afirst()
+
+    async def aget_ranking_version(self, ranking_id: int) -> Optional[int]:
+        return await self._ranking_version(ranking_id).afirst()
+
+    async def acount_items_before(self, ranking_id: int, rank: int) -> int:
+        return await self.model.objects.filter(ranking_id=ranking_id, rank__lt=rank).acount()
+
+
+def _copy_value(value: Optional[str]) -> str:
+    # COPY text format: \N is NULL, and backslashes and the characters that
+    # delimit values are backslash-escaped.
+    if value is None:
+        return '\\N'
+    if '\\' in value or '\t' in value or '\n' in value or '\r' in value:
+        return value.replace('\\', '\\\\').replace('\t', '\\t').replace('\n', '\\n').replace('\r', '\\r')
+    return value
+
+
+class _CopyReader:
+    # File-like view of an iterator of COPY lines, read in chunks by
+    # cursor.copy_expert, so the import never has to exist in full.
+    def __init__(self, lines: Iterator[str]):
+        self._lines = lines
+        self._buffer = ''
+        self.lines = 0
+        self.error = None
+
+    def read(self, size: int = -1) -> str:
+        chunk = []
+        length = len(self._buffer)
+        try:
+            for line in self._lines:
+                chunk.append(line)
+                self.lines += 1
+                length += len(line)
+                if 0 <= size <= length:
+                    break
+        except Exception as e:
+            self.error = e
+            raise
+        data = self._buffer + ''.join(chunk)
+        if size < 0:
+            self._buffer = ''
+            return data
+        self._buffer = data[size:]
+        return data[:size]
@@ -0,0 +1,102 @@
+from datetime import datetime
+
+from django.db.models import Subquery
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+from ranking_api.models import Item, RankCheckpoint, RankEvent
+from typing import Dict, List, Optional, Tuple
+
+
+class RankEventRepository:
+    def __init__(self):
+        self.model = RankEvent
+
+    def record_event(self, ranking_id: int, kind: str, changes: list, items: Optional[list] = None) -> RankEvent:
+        return self.model.objects.create(ranking_id=ranking_id, kind=kind, changes=changes, items=items or [])
+
+    def count_events_since_checkpoint(self, ranking_id: int) -> int:
+        # Walks the (ranking, id) index from the latest checkpoint on, so it
+        # never reads more than one checkpoint interval of rows.
+        latest_checkpoint = (
+            RankCheckpoint.objects
+            .filter(ranking_id=ranking_id)
+            .order_by('-last_event_id')
+            .values('last_event_id')[:1]
+        )
+        return self.model.objects.filter(
+            ranking_id=ranking_id,
+            id__gt=Coalesce(Subquery(latest_checkpoint), 0)
+        ).count()
+
+    def get_last_event_id(self, ranking_id: int) -> int:
+        # 0 when the ranking has no events yet, like a baseline checkpoint.
+        return (
+            self.model.objects
+            .filter(ranking_id=ranking_id)
+            .order_by('-id')
+            .values_list('id', flat=True)
+            .first()
+        ) or 0
+
+    def create_checkpoint(self, ranking_id: int, last_event_id: int,
+                          created_at: Optional[datetime] = None) -> RankCheckpoint:
+        # Passing the event's created_at keeps the checkpoint from falling
+        # after a history lookup whose time lies between the two.
+        item_ids = list(
+            Item.objects
+            .filter(ranking_id=ranking_id)
+            .order_by('rank', 'id')
+            .values_list('id', flat=True)
+        )
+        return RankCheckpoint.objects.create(
+            ranking_id=ranking_id, last_event_id=last_event_id, item_ids=item_ids,
+            created_at=created_at or timezone.now()
+        )
+
+    def get_checkpoint_at(self, ranking_id: int, at: datetime) -> Optional[RankCheckpoint]:
+        # The latest checkpoint taken at or before `at`.
+        return (
+            RankCheckpoint.objects
+            .filter(ranking_id=ranking_id, created_at__lte=at)
+            .order_by('-created_at', '-last_event_id')
+            .first()
+        )
+
+    def get_checkpoint_through(self, ranking_id: int, last_event_id: int) -> Optional[RankCheckpoint]:
+        # The latest checkpoint of the order after at most `last_event_id`.
+        return (
+            RankCheckpoint.objects
+            .filter(ranking_id=ranking_id, last_event_id__lte=last_event_id)
+            .order_by('-last_event_id', '-id')
+            .first()
+        )
+
+    def get_first_checkpoint(self, ranking_id: int) -> Optional[RankCheckpoint]:
+        return RankCheckpoint.objects.filter(ranking_id=ranking_id).order_by('created_at', 'last_event_id').first()
+
+    def get_events(self, ranking_id: int, after_event_id: int, at: datetime) -> List[RankEvent]:
+        return list(
+            self.model.objects
+            .filter(ranking_id=ranking_id, id__gt=after_event_id, created_at__lte=at)
+            .order_by('id')
+        )
+
+    def get_events_through(self, ranking_id: int, after_event_id: int, last_event_id: int) -> List[RankEvent]:
+        return list(
+            self.model.objects
+            .filter(ranking_id=ranking_id, id__gt=after_event_id, id__lte=last_event_id)
+            .order_by('id')
+        )
+
+    def get_deleted_items(self, ranking_id: int, after_event_id: int) -> Dict[int, Tuple[str, Optional[str]]]:
+        # (name, notes) of every item deleted after the event, by id.
+        deleted = {}
+        for items in (
+            self.model.objects
+            .filter(ranking_id=ranking_id, kind=RankEvent.DELETE, id__gt=after_event_id)
+            .order_by('id')
+            .values_list('items', flat=True)
+        ):
+            deleted.update((item_id, (name, notes)) for item_id, name, notes in items)
+        return deleted
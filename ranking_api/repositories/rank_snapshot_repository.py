@@ -0,0 +1,57 @@
+from django.db.models import Subquery
+
+from ranking_api.models import RankingList, RankSnapshot
+from typing import List, Optional
+
+
+class RankSnapshotRepository:
+    def __init__(self):
+        self.model = RankSnapshot
+
+    def create_snapshot(self, ranking_id: int, name: Optional[str], ranking_version: int,
+                        last_event_id: int) -> RankSnapshot:
+        return self.model.objects.create(
+            ranking_id=ranking_id,
+            name=name,
+            ranking_version=ranking_version,
+            last_event_id=last_event_id
+        )
+
+    def create_automatic_snapshot(self, ranking_id: int, last_event_id: int):
+        # Reads the ranking's version inside the INSERT, so the snapshot costs
+        # a single query.
+        self.model.objects.create(
+            ranking_id=ranking_id,
+            ranking_version=Subquery(RankingList.objects.filter(id=ranking_id).values('version')),
+            last_event_id=last_event_id
+        )
+
+    def get_last_event_id(self, ranking_id: int, snapshot_id: int) -> Optional[int]:
+        return (
+            self.model.objects
+            .filter(ranking_id=ranking_id, id=snapshot_id)
+            .values_list('last_event_id', flat=True)
+            .first()
+        )
+
+    def delete_automatic_snapshots(self, ranking_id: int, keep: int) -> int:
+        # Deletes all but the newest `keep` automatic snapshots of the ranking.
+        oldest_kept = (
+            self.model.objects
+            .filter(ranking_id=ranking_id, name__isnull=True)
+            .order_by('-id')
+            .values_list('id', flat=True)[keep - 1:keep]
+            .first()
+        )
+        if oldest_kept is None:
+            return 0
+        deleted, _ = self.model.objects.filter(ranking_id=ranking_id, name__isnull=True, id__lt=oldest_kept).delete()
+        return deleted
+
+    def get_snapshots(self, ranking_id: int, limit: int) -> List[dict]:
+        return list(
+            self.model.objects
+            .filter(ranking_id=ranking_id)
+            .order_by('-id')
+            .values('id', 'name', 'ranking_version', 'created_at')[:limit]
+        )
@@ -1,5 +1,11 @@
+from datetime import datetime
+
+from django.db import connection
+from django.db.models import F, Q
+from django.db.models.functions import Collate
+
 from ranking_api.models import RankingList
-from typing import Optional
+from typing import Optional, Tuple
 
 class RankingRepository:
     def __init__(self):
@@ -11,13 +17,37 @@ class RankingRepository:
         except self.model.DoesNotExist:
             return None
 
-    def get_all_rankings(self) -> list[RankingList]:
-        return list(self.model.objects.all())
+    def get_version(self, ranking_id: int) -> Optional[Tuple[int, datetime]]:
+        return self._version(ranking_id).first()
+
+    def _version(self, ranking_id: int):
+        return self.model.objects.filter(id=ranking_id).values_list('version', 'updated_at')
+
+    def get_rankings_page(self, limit: int, after_id: Optional[int] = None, title_prefix: Optional[str] = None,
+                          after_title: Optional[str] = None) -> list[RankingList]:
+        return list(self._rankings_page(limit, after_id, title_prefix, after_title))
 
-    def create_ranking(self, title: str, description: str = None) -> RankingList:
+    def _rankings_page(self, limit: int, after_id: Optional[int], title_prefix: Optional[str],
+                       after_title: Optional[str]):
+        if not title_prefix:
+            queryset = self.model.objects.all()
+            if after_id is not None:
+                queryset = queryset.filter(id__gt=after_id)
+            return queryset.order_by('id')[:limit]
+
+        # Prefix pages are keyed on (title, id) in byte order, so the prefix
+        # match, the cursor and the ordering all come from one index range.
+        queryset = self.model.objects.annotate(title_key=_title_key()).filter(title_key__startswith=title_prefix)
+        if after_id is not None:
+            # The first condition bounds the index scan; the second breaks ties.
+            queryset = queryset.filter(Q(title_key__gte=after_title), Q(title_key__gt=after_title) | Q(id__gt=after_id))
+        return queryset.order_by('title_key', 'id')[:limit]
+
+    def create_ranking(self, title: str, description: str = None, ordering_mode: str = None) -> RankingList:
         return self.model.objects.create(
             title=title,
-            description=description if description is not None else ''
+            description=description if description is not None else '',
+            ordering_mode=ordering_mode if ordering_mode is not None else RankingList.DENSE
         )
 
     def delete_ranking(self, ranking_id: int) -> bool:
@@ -33,9 +63,33 @@ class RankingRepository:
             ranking = self.model.objects.get(id=ranking_id)
             ranking.title = title
             ranking.description = description if description is not None else ''
-            ranking.save()
+            ranking.version = F('version') + 1
+            # item_count and ordering_mode belong to the item writers, which
+            # may have changed them since the row was read.
+            ranking.save(update_fields=['title', 'description', 'version', 'updated_at'])
+            ranking.refresh_from_db(fields=['version', 'item_count'])
             return ranking
         except self.model.DoesNotExist:
             return None
 
+    # Async variants used by the ASGI controllers.
+
+    async def aget_ranking(self, ranking_id) -> Optional[RankingList]:
+        try:
+            return await self.model.objects.aget(id=ranking_id)
+        except self.model.DoesNotExist:
+            return None
+
+    async def aget_version(self, ranking_id: int) -> Optional[Tuple[int, datetime]]:
+        return await self._version(ranking_id).afirst()
+
+    async def aget_rankings_page(self, limit: int, after_id: Optional[int] = None, title_prefix: Optional[str] = None,
+                                 after_title: Optional[str] = None) -> list[RankingList]:
+        return [ranking async for ranking in self._rankings_page(limit, after_id, title_prefix, after_title)]
+
 
+def _title_key():
+    # Must stay identical to the (title COLLATE "C", id) index from migration
+    # 0007, otherwise Postgres can't match queries to it. SQLite already
+    # compares text byte by byte.
+    return Collate('title', 'C') if connection.vendor == 'postgresql' else F('title')
@@ -0,0 +1,135 @@
+import csv
+import io
+import json
+from typing import AsyncIterable, AsyncIterator, Iterable, Iterator, Optional, Tuple
+
+from django.core.serializers.json import DjangoJSONEncoder
+
+from ranking_api.models import Item
+
+# Rows are flushed to the client in batches of this size when streaming.
+STREAM_BATCH_SIZE = 500
+
+# Item columns exposed by the API. List endpoints fetch exactly these with
+# values(), so rows can be returned as-is without building Item instances.
+ITEM_FIELDS = ('id', 'name', 'notes', 'rank', 'ranking_id')
+
+# Columns written by exports and read back by imports. Imports take the order
+# of the rows, so `rank` is informational.
+EXPORT_FIELDS = ('rank', 'name', 'notes')
+EXPORT_FORMATS = ('csv', 'ndjson')
+MAX_NAME_LENGTH = Item._meta.get_field('name').max_length
+
+
+def serialize_item(item: Item) -> dict:
+    # ranking_id is read off the row itself; item.ranking.id would load the RankingList.
+    return {field: getattr(item, field) for field in ITEM_FIELDS}
+
+
+def stream_json_list(key: str, rows: Iterable[dict]) -> Iterator[str]:
+    # Emits {"<key>": [row, ...]} piece by piece so only one batch of rows is
+    # ever held in memory.
+    encoder = DjangoJSONEncoder()
+    yield '{%s: [' % encoder.encode(key)
+    batch = []
+    separator = ''
+    for row in rows:
+        batch.append(encoder.encode(row))
+        if len(batch) >= STREAM_BATCH_SIZE:
+            yield separator + ', '.join(batch)
+            separator = ', '
+            batch = []
+    if batch:
+        yield separator + ', '.join(batch)
+    yield ']}'
+
+
+async def astream_json_list(key: str, rows: AsyncIterable[dict]) -> AsyncIterator[str]:
+    # Async twin of stream_json_list for StreamingHttpResponse under ASGI.
+    encoder = DjangoJSONEncoder()
+    yield '{%s: [' % encoder.encode(key)
+    batch = []
+    separator = ''
+    async for row in rows:
+        batch.append(encoder.encode(row))
+        if len(batch) >= STREAM_BATCH_SIZE:
+            yield separator + ', '.join(batch)
+            separator = ', '
+            batch = []
+    if batch:
+        yield separator + ', '.join(batch)
+    yield ']}'
+
+
+def stream_csv(rows: Iterable[dict]) -> Iterator[str]:
+    # CSV with a header row, a batch of rows per chunk.
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(EXPORT_FIELDS)
+    for count, row in enumerate(rows, start=1):
+        writer.writerow([row[field] for field in EXPORT_FIELDS])
+        if count % STREAM_BATCH_SIZE == 0:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+    yield buffer.getvalue()
+
+
+def stream_ndjson(rows: Iterable[dict]) -> Iterator[str]:
+    # One JSON object per line, a batch of lines per chunk.
+    encoder = DjangoJSONEncoder()
+    batch = []
+    for row in rows:
+        batch.append(encoder.encode({field: row[field] for field in EXPORT_FIELDS}) + '\n')
+        if len(batch) >= STREAM_BATCH_SIZE:
+            yield ''.join(batch)
+            batch = []
+    yield ''.join(batch)
+
+
+def parse_csv(lines: Iterable[str]) -> Iterator[Tuple[str, Optional[str]]]:
+    # (name, notes) per row of a CSV with a header naming at least `name`.
+    # Empty notes read as None.
+    reader = csv.reader(lines)
+    header = next(reader, None)
+    if header is None or 'name' not in header:
+        raise ValueError('CSV header must include a name column')
+    name_index = header.index('name')
+    notes_index = header.index('notes') if 'notes' in header else None
+    for row in reader:
+        if not row:
+            continue
+        try:
+            name = row[name_index]
+            notes = (row[notes_index] or None) if notes_index is not None else None
+        except IndexError:
+            raise ValueError(f'Line {reader.line_num}: missing columns')
+        if not name:
+            raise ValueError(f'Line {reader.line_num}: name is required')
+        if len(name) > MAX_NAME_LENGTH:
+            raise ValueError(f'Line {reader.line_num}: name is too long')
+        yield name, notes
+
+
+def parse_ndjson(lines: Iterable[str]) -> Iterator[Tuple[str, Optional[str]]]:
+    # (name, notes) per non-blank line holding a JSON object.
+    for line_number, line in enumerate(lines, start=1):
+        if not line.strip():
+            continue
+        try:
+            row = json.loads(line)
+        except ValueError:
+            raise ValueError(f'Line {line_number}: invalid JSON')
+        if not isinstance(row, dict):
+            raise ValueError(f'Line {line_number}: expected a JSON object')
+        yield _import_row(row.get('name'), row.get('notes'), line_number)
+
+
+def _import_row(name, notes, line_number: int) -> Tuple[str, Optional[str]]:
+    if not isinstance(name, str) or not name:
+        raise ValueError(f'Line {line_number}: name is required')
+    if len(name) > MAX_NAME_LENGTH:
+        raise ValueError(f'Line {line_number}: name is too long')
+    if notes is not None and not isinstance(notes, str):
+        raise ValueError(f'Line {line_number}: notes must be a string')
+    return name, notes
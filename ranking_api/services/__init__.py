@@ -1,3 +1,7 @@
 # ranking_api/services/__init__.py
 from .item_service import ItemService
-from .ranking_service import RankingService
\ No newline at end of file
+from .ranking_service import RankingService
+from .consensus_service import ConsensusService
+from .similarity_service import SimilarityService
+from .rank_history_service import RankHistoryService
+from .snapshot_service import SnapshotService
\ No newline at end of file
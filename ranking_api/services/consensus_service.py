@@ -0,0 +1,50 @@
+from ranking_api import consensus
+from ranking_api.models import RankingList
+from ranking_api.rank_matrix import build_rank_matrix
+from ranking_api.repositories.item_repository import ItemRepository
+
+BORDA = 'borda'
+KEMENY = 'kemeny'
+CONSENSUS_METHODS = (BORDA, KEMENY)
+
+# Kemeny keeps an n x n preference matrix and a local search that is quadratic per pass.
+MAX_KEMENY_CANDIDATES = 2000
+
+
+class ConsensusService:
+    def __init__(self, item_repository: ItemRepository):
+        self.item_repository = item_repository
+
+    def get_consensus(self, ranking_ids: list[int], method: str = BORDA) -> dict:
+        # Aggregates rankings of a shared candidate set, matched by item name,
+        # into one order. Candidates a ranking leaves out count as tied below
+        # everything it does rank.
+        if method not in CONSENSUS_METHODS:
+            raise ValueError(f"method must be one of {', '.join(CONSENSUS_METHODS)}")
+        ranking_ids = list(dict.fromkeys(ranking_ids))
+
+        found = self.item_repository.get_ranking_modes(ranking_ids)
+        missing = [ranking_id for ranking_id in ranking_ids if ranking_id not in found]
+        if missing:
+            raise RankingList.DoesNotExist(f"Rankings with ids {missing} do not exist.")
+
+        candidates, matrix = build_rank_matrix(self.item_repository.get_ranked_keys(ranking_ids), ranking_ids)
+        result = {'method': method, 'rankings': len(ranking_ids)}
+
+        if method == BORDA:
+            scores = consensus.borda_scores(matrix)
+            result['items'] = [
+                {'rank': rank, 'name': candidates[index], 'score': float(scores[index])}
+                for rank, index in enumerate(consensus.borda_order(matrix), start=1)
+            ]
+            return result
+
+        if len(candidates) > MAX_KEMENY_CANDIDATES:
+            raise ValueError(f'kemeny supports at most {MAX_KEMENY_CANDIDATES} distinct items')
+        order, disagreements = consensus.kemeny_order(matrix)
+        result['items'] = [
+            {'rank': rank, 'name': candidates[index]}
+            for rank, index in enumerate(order, start=1)
+        ]
+        result['disagreements'] = disagreements
+        return result
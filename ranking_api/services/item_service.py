@@ -1,57 +1,566 @@
-from ranking_api.models import Item
+from django.db import transaction
+
+from ranking_api.cache import ItemListCache, item_list_cache
+from ranking_api.models import Item, RankEvent, RankingList
+from ranking_api.pagination import decode_cursor, encode_cursor
+from ranking_api.permutation_diff import diff_orders
 from ranking_api.repositories.item_repository import ItemRepository
-from typing import Optional
+from ranking_api.repositories.rank_event_repository import RankEventRepository
+from ranking_api.repositories.rank_snapshot_repository import RankSnapshotRepository
+from ranking_api.services.snapshot_service import SnapshotService
+from typing import AsyncIterator, Iterable, Iterator, Optional
+
+# Spacing between neighbouring sort keys in sparse rankings. Each insert between
+# two items halves their gap, so ~20 inserts can land in the same slot before
+# the ranking has to be respaced.
+SPARSE_RANK_GAP = 1 << 20
+
+# Rank events between checkpoints of a ranking's full order; the most events a
+# history replay ever has to apply.
+CHECKPOINT_INTERVAL = 100
 
 
 class ItemService:
-    def __init__(self, item_repository: ItemRepository):
+    def __init__(self, item_repository: ItemRepository, item_cache: Optional[ItemListCache] = None,
+                 event_repository: Optional[RankEventRepository] = None,
+                 snapshot_service: Optional[SnapshotService] = None):
         self.item_repository = item_repository
+        self.item_cache = item_cache if item_cache is not None else item_list_cache
+        self.event_repository = event_repository if event_repository is not None else RankEventRepository()
+        self.snapshot_service = (
+            snapshot_service if snapshot_service is not None
+            else SnapshotService(item_repository, RankSnapshotRepository())
+        )
 
     def get_item(self, item_id: int) -> Optional[Item]:
-        return self.item_repository.get_item(item_id)
+        item = self.item_repository.get_item(item_id)
+        if item is not None:
+            self._apply_position(item)
+        return item
 
     def get_all_items(self, ranking_id: int) -> list[Item]:
-        return self.item_repository.get_all_items(ranking_id)
+        items = self.item_repository.get_all_items(ranking_id)
+        if items and self._is_sparse(ranking_id):
+            for position, item in enumerate(items, start=1):
+                item.rank = position
+        return items
 
-    def create_item(self, name: str, ranking_id: int, notes: str = None, rank: Optional[int] = None):
-        if rank is None:
-            rank = self.item_repository.count_items_in_ranking(ranking_id)
+    def get_item_rows(self, ranking_id: int, version: Optional[int] = None) -> Optional[list[dict]]:
+        # Returns None when the ranking does not exist. Callers that have
+        # already read the ranking's version pass it to save the lookup.
+        if version is None:
+            version = self.item_repository.get_ranking_version(ranking_id)
+            if version is None:
+                return None
+        return self.item_cache.get_or_load(ranking_id, version, lambda: self._load_item_rows(ranking_id))
+
+    def iter_item_rows(self, ranking_id: int) -> Iterator[dict]:
+        rows = self.item_repository.iter_item_rows(ranking_id)
+        if not self._is_sparse(ranking_id):
+            return rows
+        return (
+            {**row, 'rank': position}
+            for position, row in enumerate(rows, start=1)
+        )
+
+    def get_items_page(self, ranking_id: int, limit: int, cursor: Optional[str] = None) -> tuple[list[dict], Optional[str]]:
+        after, position = self._parse_items_cursor(cursor)
+        # Fetch one extra row to learn whether another page exists without a COUNT.
+        rows = self.item_repository.get_item_rows_page(ranking_id, limit + 1, after)
+        rows, next_cursor = self._split_items_page(rows, limit, position)
+
+        if rows and self._is_sparse(ranking_id):
+            self._apply_row_positions(rows, position)
+        return rows, next_cursor
+
+    def get_items_in_rank_range(self, ranking_id: int, rank_from: int, rank_to: int) -> Optional[list[dict]]:
+        # Items ranked rank_from..rank_to inclusive; None when the ranking does not exist.
+        ordering_mode = self.item_repository.get_ordering_mode(ranking_id)
+        if ordering_mode is None:
+            return None
+        if ordering_mode == RankingList.DENSE:
+            return self.item_repository.get_item_rows_in_rank_range(ranking_id, rank_from, rank_to)
+
+        rows = self.item_repository.get_item_rows_at_positions(ranking_id, rank_from - 1, rank_to - rank_from + 1)
+        self._apply_row_positions(rows, rank_from - 1)
+        return rows
+
+    def get_item_neighbors(self, item_id: int, radius: int) -> Optional[dict]:
+        # The item with up to `radius` items on either side, its rank and the
+        # ranking's size; None when the item does not exist.
+        item = self.item_repository.get_item(item_id)
+        if item is None:
+            return None
+
+        if item.ranking.ordering_mode == RankingList.DENSE:
+            rank = item.rank
+            rows = self.item_repository.get_item_rows_in_rank_range(
+                item.ranking_id, max(rank - radius, 1), rank + radius
+            )
         else:
-            self.item_repository.shift_ranks_for_insert(ranking_id, rank)
+            rank = self.item_repository.count_items_before(item.ranking_id, item.rank) + 1
+            before, after = self.item_repository.get_item_rows_around(item.ranking_id, item.rank, radius)
+            rows = before[::-1] + after
+            self._apply_row_positions(rows, rank - len(before) - 1)
+
+        return {
+            'rank': rank,
+            'total': item.ranking.item_count,
+            'items': rows,
+        }
+
+    def search_items(self, query: str, limit: int, ranking_id: Optional[int] = None,
+                     cursor: Optional[str] = None) -> tuple[list[dict], Optional[str]]:
+        # Items matching `query`, most relevant first, across all rankings or
+        # within one.
+        after = self._parse_search_cursor(cursor)
+        rows = self.item_repository.search_item_rows(query, limit + 1, ranking_id, after)
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = encode_cursor({'score': rows[-1]['score'], 'id': rows[-1]['id']})
+
+        # Hits in sparse rankings carry sort keys; all of them are positioned in one query.
+        modes = self.item_repository.get_ranking_modes({row['ranking_id'] for row in rows}) if rows else {}
+        sparse_rows = [row for row in rows if modes.get(row['ranking_id']) == RankingList.SPARSE]
+        if sparse_rows:
+            positions = self.item_repository.get_item_positions([row['id'] for row in sparse_rows])
+            for row in sparse_rows:
+                row['rank'] = positions[row['id']]
+        return rows, next_cursor
+
+    def create_item(self, name: str, ranking_id: int, notes: str = None, rank: Optional[int] = None):
+        with transaction.atomic():
+            ordering_mode = self._lock_ranking(ranking_id)
+
+            if ordering_mode == RankingList.SPARSE:
+                sort_key = self._allocate_sparse_rank(ranking_id, rank)
+                item = self.item_repository.create_item(name, ranking_id, notes, sort_key)
+                item.rank = self.item_repository.count_items_before(ranking_id, sort_key) + 1
+                self._record(ranking_id, RankEvent.INSERT, [[item.id, item.rank]])
+                self._ranking_changed(ranking_id, item_delta=1)
+                return item
+
+            # Out-of-range ranks are appended or put on top, as in create_items.
+            size = self.item_repository.get_max_rank(ranking_id) or 0
+            rank = size + 1 if rank is None else min(max(rank, 1), size + 1)
+            if rank <= size:
+                self.item_repository.shift_ranks_for_insert(ranking_id, rank)
+
+            item = self.item_repository.create_item(name, ranking_id, notes, rank)
+            self._record(ranking_id, RankEvent.INSERT, [[item.id, rank]])
+            self._ranking_changed(ranking_id, item_delta=1)
+            return item
+
+    def create_items(self, ranking_id: int, items: list[dict]) -> list[Item]:
+        # Each item is a dict with a name, optional notes and an optional rank.
+        # Ranks are positions in the ranking as it was before this call; items
+        # with no rank, or one past the end, are appended. Items aimed at the
+        # same spot keep their request order.
+        with transaction.atomic():
+            ordering_mode = self._lock_ranking(ranking_id)
+            sparse = ordering_mode == RankingList.SPARSE
+            # The row lock keeps item_count current, so no COUNT(*) is needed.
+            size = (
+                self.item_repository.get_item_count(ranking_id) if sparse
+                else self.item_repository.get_max_rank(ranking_id) or 0
+            )
+
+            placements = sorted(
+                (size + 1 if item.get('rank') is None else min(max(item['rank'], 1), size + 1), index)
+                for index, item in enumerate(items)
+            )
+            if sparse:
+                sort_keys = self._allocate_sparse_ranks(ranking_id, [position for position, _ in placements])
+            else:
+                # Existing items at or after each insert position move down by the
+                # number of new items placed at or before it.
+                shifts = {}
+                for placed, (position, _) in enumerate(placements, start=1):
+                    if position <= size:
+                        shifts[position] = placed
+                self.item_repository.shift_ranks_for_bulk_insert(ranking_id, list(shifts.items()))
+                sort_keys = [position + placed for placed, (position, _) in enumerate(placements)]
+
+            created = self.item_repository.bulk_create_items(ranking_id, [
+                {**items[index], 'rank': sort_key}
+                for (_, index), sort_key in zip(placements, sort_keys)
+            ])
+            for placed, ((position, _), item) in enumerate(zip(placements, created)):
+                item.rank = position + placed
+            self._record(ranking_id, RankEvent.INSERT, [[item.id, item.rank] for item in created])
+            self._ranking_changed(ranking_id, item_delta=len(created))
+            return created
 
-        return self.item_repository.create_item(name, ranking_id, notes, rank)
+    def import_items(self, ranking_id: int, rows: Iterable[tuple[str, Optional[str]]]) -> int:
+        # Appends (name, notes) rows after the ranking's last item, in order.
+        # Rows are consumed lazily, so imports of any size run in bounded memory.
+        with transaction.atomic():
+            ordering_mode = self._lock_ranking(ranking_id)
+            gap = SPARSE_RANK_GAP if ordering_mode == RankingList.SPARSE else 1
+            first_rank = (self.item_repository.get_max_rank(ranking_id) or 0) + gap
+            imported = self.item_repository.import_items(ranking_id, rows, first_rank, gap)
+            if imported:
+                # The import event is checkpointed at once, so the new order
+                # stands in for an insert naming every imported item.
+                event = self.event_repository.record_event(ranking_id, RankEvent.IMPORT, [])
+                self.event_repository.create_checkpoint(ranking_id, event.id, event.created_at)
+                self._ranking_changed(ranking_id, item_delta=imported)
+            return imported
 
     def delete_item(self, item_id: int):
-        deleted = self.item_repository.delete_item(item_id)
-        if not deleted:
+        ranking_id = self.item_repository.get_ranking_id(item_id)
+        if ranking_id is None:
             raise Item.DoesNotExist(f"Item with id {item_id} does not exist.")
 
+        with transaction.atomic():
+            ordering_mode = self._lock_ranking(ranking_id)
+            details = self.item_repository.get_item_details(ranking_id, [item_id])
+            deleted = self.item_repository.delete_item(item_id)
+            if not deleted:
+                raise Item.DoesNotExist(f"Item with id {item_id} does not exist.")
+            if ordering_mode == RankingList.DENSE:
+                self.item_repository.compact_ranks(ranking_id)
+            self._record(ranking_id, RankEvent.DELETE, [item_id], items=details, snapshot=True)
+            self._ranking_changed(ranking_id, item_delta=-1)
+
+    def delete_items(self, ranking_id: int, item_ids: list[int]) -> int:
+        # Ids that aren't in the ranking are ignored; returns how many items went.
+        with transaction.atomic():
+            ordering_mode = self._lock_ranking(ranking_id)
+            details = self.item_repository.get_item_details(ranking_id, item_ids)
+            deleted = self.item_repository.delete_items(ranking_id, item_ids)
+            if not deleted:
+                return 0
+            # Sparse keys are allowed gaps, so only dense rankings are renumbered.
+            if ordering_mode == RankingList.DENSE:
+                self.item_repository.compact_ranks(ranking_id)
+            # Ids that weren't in the ranking are skipped again on replay.
+            self._record(ranking_id, RankEvent.DELETE, item_ids, items=details, snapshot=True)
+            self._ranking_changed(ranking_id, item_delta=-deleted)
+            return deleted
+
     def patch_item(self, item_id: int, name: str = None, notes: str = None):
         patched_item = self.item_repository.patch_item(item_id, name=name, notes=notes)
         if not patched_item:
             raise Item.DoesNotExist(f"Item with id {item_id} does not exist.")
+        self._ranking_changed(patched_item.ranking_id)
+        self._apply_position(patched_item)
         return patched_item
 
     def update_item_rank(self, item_id: int, new_rank: int) -> Item:
-        item = self.item_repository.get_item(item_id)
-        if item.rank == new_rank:
-            return item  # No change
-
-        if new_rank < item.rank:
-            # Item is moving up
-            self.item_repository.shift_ranks_down(
-                ranking_id=item.ranking_id,
-                start=new_rank,
-                end=item.rank - 1
-            )
-        else:
-            # Item is moving down
-            self.item_repository.shift_ranks_up(
-                ranking_id=item.ranking_id,
-                start=item.rank + 1,
-                end=new_rank
+        ranking_id = self.item_repository.get_ranking_id(item_id)
+        if ranking_id is None:
+            raise Item.DoesNotExist(f"Item with id {item_id} does not exist.")
+
+        with transaction.atomic():
+            self._lock_ranking(ranking_id)
+            # Re-read under the lock: another writer may have moved the item meanwhile.
+            item = self.item_repository.get_item(item_id)
+            if item is None or item.ranking_id != ranking_id:
+                raise Item.DoesNotExist(f"Item with id {item_id} does not exist.")
+
+            if item.ranking.ordering_mode == RankingList.SPARSE:
+                sort_key = self._allocate_sparse_rank(item.ranking_id, new_rank, exclude_item_id=item.id)
+                self.item_repository.set_rank(item.id, sort_key)
+                item.rank = self.item_repository.count_items_before(item.ranking_id, sort_key) + 1
+                self._record(item.ranking_id, RankEvent.MOVE, [[item.id, item.rank]], snapshot=True)
+                self._ranking_changed(item.ranking_id)
+                return item
+
+            # Out-of-range ranks land at the top or bottom, as in update_item_ranks.
+            new_rank = min(max(new_rank, 1), item.ranking.item_count)
+            if item.rank == new_rank:
+                return item  # No change
+
+            self.item_repository.move_item(item.ranking_id, item.id, item.rank, new_rank)
+            item.rank = new_rank
+            self._record(item.ranking_id, RankEvent.MOVE, [[item.id, new_rank]], snapshot=True)
+            self._ranking_changed(item.ranking_id)
+            return item
+
+    def update_item_ranks(self, ranking_id: int, moves: list[tuple[int, int]]) -> int:
+        # Replays the moves in memory and writes every changed rank in one UPDATE,
+        # so a whole drag session costs the same handful of queries as a single move.
+        with transaction.atomic():
+            ordering_mode = self._lock_ranking(ranking_id)
+            ranked_items = self.item_repository.get_ranked_item_ids(ranking_id)
+            current_ranks = dict(ranked_items)
+            order = [item_id for item_id, _ in ranked_items]
+
+            applied = []
+            for item_id, new_rank in moves:
+                if item_id not in current_ranks:
+                    raise Item.DoesNotExist(f"Item with id {item_id} does not exist in ranking {ranking_id}.")
+                order.remove(item_id)
+                position = min(max(new_rank, 1), len(order) + 1)
+                order.insert(position - 1, item_id)
+                applied.append([item_id, position])
+
+            if ordering_mode == RankingList.SPARSE:
+                changed_ranks = self._place_moved_items(order, current_ranks, {item_id for item_id, _ in moves})
+            else:
+                changed_ranks = self._respaced_ranks(order, current_ranks, 1)
+            self.item_repository.apply_ranks(ranking_id, changed_ranks)
+            self._record(ranking_id, RankEvent.MOVE, applied, snapshot=True)
+            self._ranking_changed(ranking_id)
+            return len(changed_ranks)
+
+    def restore_snapshot(self, ranking_id: int, snapshot_id: int) -> dict:
+        # Puts the ranking back to a snapshot's order: items added since are
+        # deleted, deleted ones come back under their old ids, and every rank
+        # is rewritten in one UPDATE. The order it replaces is snapshotted, so
+        # a restore can itself be undone.
+        with transaction.atomic():
+            ordering_mode = self._lock_ranking(ranking_id)
+            order, items = self.snapshot_service.get_snapshot_state(ranking_id, snapshot_id)
+            current_ranks = dict(self.item_repository.get_ranked_item_ids(ranking_id))
+            current_order = list(current_ranks)
+            gap = SPARSE_RANK_GAP if ordering_mode == RankingList.SPARSE else 1
+            target_ranks = {item_id: position * gap for position, item_id in enumerate(order, start=1)}
+
+            removed = [item_id for item_id in current_order if item_id not in target_ranks]
+            missing = [item_id for item_id in order if item_id not in current_ranks]
+            lost = [item_id for item_id in missing if item_id not in items]
+            if lost:
+                raise ValueError(
+                    f"Snapshot {snapshot_id} can't be restored: no details were kept for deleted items {lost}."
+                )
+            details = self.item_repository.get_item_details(ranking_id, removed) if removed else []
+            if removed:
+                self.item_repository.delete_items(ranking_id, removed)
+            self.item_repository.apply_ranks(ranking_id, {
+                item_id: rank for item_id, rank in target_ranks.items()
+                if item_id in current_ranks and current_ranks[item_id] != rank
+            })
+            self.item_repository.recreate_items(
+                ranking_id, [(item_id, *items[item_id], target_ranks[item_id]) for item_id in missing]
             )
 
-        item.rank = new_rank
-        item.save()
-        return item
\ No newline at end of file
+            # Logged as a minimal edit script (see permutation_diff): drop the
+            # removed and moved items, then insert the moved ones in order. The
+            # order is already final, so only the second event may checkpoint it.
+            diff = diff_orders(current_order, order)
+            if diff['removed'] or diff['placed']:
+                self._record(
+                    ranking_id, RankEvent.DELETE, diff['removed'] + [item_id for item_id, _ in diff['placed']],
+                    items=details, snapshot=True, checkpoint=False
+                )
+                self._record(ranking_id, RankEvent.INSERT, [[item_id, index + 1] for item_id, index in diff['placed']])
+            self._ranking_changed(ranking_id, item_delta=len(missing) - len(removed))
+            return {
+                'ranking_id': ranking_id,
+                'snapshot_id': snapshot_id,
+                'moved': len(diff['placed']) - len(missing),
+                'deleted': len(removed),
+                'restored': len(missing),
+            }
+
+    # Async read path for the ASGI controllers. Writes stay on the sync methods
+    # above: they need transaction.atomic() and row locks, which the async ORM
+    # doesn't offer yet.
+
+    async def aget_item(self, item_id: int) -> Optional[Item]:
+        item = await self.item_repository.aget_item(item_id)
+        if item is not None and item.ranking.ordering_mode == RankingList.SPARSE:
+            item.rank = await self.item_repository.acount_items_before(item.ranking_id, item.rank) + 1
+        return item
+
+    async def aget_item_rows(self, ranking_id: int, version: Optional[int] = None) -> Optional[list[dict]]:
+        # Returns None when the ranking does not exist.
+        if version is None:
+            version = await self.item_repository.aget_ranking_version(ranking_id)
+            if version is None:
+                return None
+        return await self.item_cache.aget_or_load(ranking_id, version, lambda: self._aload_item_rows(ranking_id))
+
+    async def aiter_item_rows(self, ranking_id: int) -> AsyncIterator[dict]:
+        sparse = await self._ais_sparse(ranking_id)
+        position = 0
+        async for row in self.item_repository.aiter_item_rows(ranking_id):
+            if sparse:
+                position += 1
+                row['rank'] = position
+            yield row
+
+    async def aget_items_page(self, ranking_id: int, limit: int, cursor: Optional[str] = None) -> tuple[list[dict], Optional[str]]:
+        after, position = self._parse_items_cursor(cursor)
+        rows = await self.item_repository.aget_item_rows_page(ranking_id, limit + 1, after)
+        rows, next_cursor = self._split_items_page(rows, limit, position)
+
+        if rows and await self._ais_sparse(ranking_id):
+            self._apply_row_positions(rows, position)
+        return rows, next_cursor
+
+    async def aget_items_in_rank_range(self, ranking_id: int, rank_from: int, rank_to: int) -> Optional[list[dict]]:
+        ordering_mode = await self.item_repository.aget_ordering_mode(ranking_id)
+        if ordering_mode is None:
+            return None
+        if ordering_mode == RankingList.DENSE:
+            return await self.item_repository.aget_item_rows_in_rank_range(ranking_id, rank_from, rank_to)
+
+        rows = await self.item_repository.aget_item_rows_at_positions(ranking_id, rank_from - 1, rank_to - rank_from + 1)
+        self._apply_row_positions(rows, rank_from - 1)
+        return rows
+
+    def _load_item_rows(self, ranking_id: int) -> Optional[list[dict]]:
+        ordering_mode = self.item_repository.get_ordering_mode(ranking_id)
+        if ordering_mode is None:
+            return None
+
+        rows = self.item_repository.get_all_item_rows(ranking_id)
+        if ordering_mode == RankingList.SPARSE:
+            self._apply_row_positions(rows)
+        return rows
+
+    async def _aload_item_rows(self, ranking_id: int) -> Optional[list[dict]]:
+        ordering_mode = await self.item_repository.aget_ordering_mode(ranking_id)
+        if ordering_mode is None:
+            return None
+
+        rows = await self.item_repository.aget_all_item_rows(ranking_id)
+        if ordering_mode == RankingList.SPARSE:
+            self._apply_row_positions(rows)
+        return rows
+
+    @staticmethod
+    def _parse_items_cursor(cursor: Optional[str]) -> tuple[Optional[tuple[int, int]], int]:
+        if cursor is None:
+            return None, 0
+        values = decode_cursor(cursor)
+        try:
+            return (int(values['rank']), int(values['id'])), int(values['position'])
+        except (KeyError, TypeError, ValueError):
+            raise ValueError('Invalid cursor')
+
+    @staticmethod
+    def _parse_search_cursor(cursor: Optional[str]) -> Optional[tuple[float, int]]:
+        if cursor is None:
+            return None
+        values = decode_cursor(cursor)
+        try:
+            return float(values['score']), int(values['id'])
+        except (KeyError, TypeError, ValueError):
+            raise ValueError('Invalid cursor')
+
+    @staticmethod
+    def _split_items_page(rows: list[dict], limit: int, position: int) -> tuple[list[dict], Optional[str]]:
+        if len(rows) <= limit:
+            return rows, None
+        rows = rows[:limit]
+        return rows, encode_cursor({
+            'rank': rows[-1]['rank'],
+            'id': rows[-1]['id'],
+            'position': position + limit,
+        })
+
+    @staticmethod
+    def _apply_row_positions(rows: list[dict], offset: int = 0):
+        for position, row in enumerate(rows, start=offset + 1):
+            row['rank'] = position
+
+    def _lock_ranking(self, ranking_id: int) -> str:
+        # Serialises rank writers per ranking; writers on other rankings never wait.
+        ordering_mode = self.item_repository.lock_ranking(ranking_id)
+        if ordering_mode is None:
+            raise RankingList.DoesNotExist(f"Ranking with id {ranking_id} does not exist.")
+        return ordering_mode
+
+    def _record(self, ranking_id: int, kind: str, changes: list, items: Optional[list] = None,
+                snapshot: bool = False, checkpoint: bool = True):
+        # Appends the operation to the rank log, with an automatic snapshot of
+        # the order before it when `snapshot` is set. Every CHECKPOINT_INTERVAL
+        # events the resulting order is checkpointed so replays stay bounded,
+        # and old automatic snapshots are pruned. Callers logging one write as
+        # several events pass checkpoint=False for all but the last, since the
+        # items table only holds the order after the whole write.
+        event = self.event_repository.record_event(ranking_id, kind, changes, items)
+        if snapshot:
+            self.snapshot_service.take_snapshot(ranking_id, event)
+        if checkpoint and self.event_repository.count_events_since_checkpoint(ranking_id) >= CHECKPOINT_INTERVAL:
+            self.event_repository.create_checkpoint(ranking_id, event.id, event.created_at)
+            self.snapshot_service.prune_snapshots(ranking_id)
+
+    def _ranking_changed(self, ranking_id: int, item_delta: int = 0):
+        # The version bump also moves item_cache readers to a new key.
+        self.item_repository.touch_ranking(ranking_id, item_delta)
+
+    def _is_sparse(self, ranking_id: int) -> bool:
+        return self.item_repository.get_ordering_mode(ranking_id) == RankingList.SPARSE
+
+    async def _ais_sparse(self, ranking_id: int) -> bool:
+        return await self.item_repository.aget_ordering_mode(ranking_id) == RankingList.SPARSE
+
+    def _apply_position(self, item: Item):
+        # Sparse items carry a sort key in `rank`; callers only ever see the dense position.
+        if item.ranking.ordering_mode == RankingList.SPARSE:
+            item.rank = self.item_repository.count_items_before(item.ranking_id, item.rank) + 1
+
+    @staticmethod
+    def _respaced_ranks(order: list[int], current_ranks: dict[int, int], gap: int) -> dict[int, int]:
+        # position * gap for every item in `order` whose rank differs from it.
+        return {
+            item_id: position * gap
+            for position, item_id in enumerate(order, start=1)
+            if current_ranks[item_id] != position * gap
+        }
+
+    @classmethod
+    def _place_moved_items(cls, order: list[int], current_ranks: dict[int, int], moved: set[int]) -> dict[int, int]:
+        # Sparse keys for a batch of moves: each run of moved items in the final
+        # order is spread between the keys of the unmoved items around it. Moves
+        # never reorder the items they pass, so those keep their keys. Only when
+        # some run doesn't fit its gap is the whole ranking respaced.
+        changed_ranks, run, before = {}, [], 0
+        for item_id in order + [None]:
+            if item_id in moved:
+                run.append(item_id)
+                continue
+            if run:
+                after = None if item_id is None else current_ranks[item_id]
+                step = SPARSE_RANK_GAP if after is None else (after - before) // (len(run) + 1)
+                if step < 1:
+                    return cls._respaced_ranks(order, current_ranks, SPARSE_RANK_GAP)
+                for offset, moved_id in enumerate(run, start=1):
+                    if current_ranks[moved_id] != before + step * offset:
+                        changed_ranks[moved_id] = before + step * offset
+                run = []
+            if item_id is not None:
+                before = current_ranks[item_id]
+        return changed_ranks
+
+    def _allocate_sparse_ranks(self, ranking_id: int, positions: list[int]) -> list[int]:
+        # Sort keys for a sorted list of insert positions, one neighbour lookup per
+        # distinct position.
+        groups = {}
+        for position in positions:
+            groups[position] = groups.get(position, 0) + 1
+
+        sort_keys = self._spread_sparse_ranks(ranking_id, groups)
+        if sort_keys is None:
+            # Some gap is too narrow for the items aimed at it, so spread the whole ranking out first.
+            self.item_repository.respace_ranks(ranking_id, SPARSE_RANK_GAP)
+            sort_keys = self._spread_sparse_ranks(ranking_id, groups)
+        return sort_keys
+
+    def _spread_sparse_ranks(self, ranking_id: int, groups: dict[int, int]) -> Optional[list[int]]:
+        sort_keys = []
+        for position, count in groups.items():
+            before, after = self.item_repository.get_neighbor_ranks(ranking_id, position)
+            before = before or 0
+            step = SPARSE_RANK_GAP if after is None else (after - before) // (count + 1)
+            if step < 1:
+                return None
+            sort_keys.extend(before + step * offset for offset in range(1, count + 1))
+        return sort_keys
+
+    def _allocate_sparse_rank(self, ranking_id: int, position: Optional[int], exclude_item_id: Optional[int] = None) -> int:
+        before, after = self.item_repository.get_neighbor_ranks(ranking_id, position, exclude_item_id)
+        if after is not None and after - (before or 0) < 2:
+            # No room left between the neighbours, so spread the whole ranking out again.
+            self.item_repository.respace_ranks(ranking_id, SPARSE_RANK_GAP)
+            before, after = self.item_repository.get_neighbor_ranks(ranking_id, position, exclude_item_id)
+
+        if after is None:
+            return (before or 0) + SPARSE_RANK_GAP
+        return ((before or 0) + after) // 2
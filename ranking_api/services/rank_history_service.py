@@ -0,0 +1,58 @@
+from datetime import datetime
+
+from ranking_api.models import RankEvent, RankingList
+from ranking_api.repositories.item_repository import ItemRepository
+from ranking_api.repositories.rank_event_repository import RankEventRepository
+
+
+class RankHistoryService:
+    def __init__(self, rank_event_repository: RankEventRepository, item_repository: ItemRepository):
+        self.rank_event_repository = rank_event_repository
+        self.item_repository = item_repository
+
+    def get_order_at(self, ranking_id: int, at: datetime) -> dict:
+        # Rebuilds a ranking's order at `at` from the latest checkpoint before it
+        # plus the events logged since, so at most one checkpoint interval of
+        # events is replayed however long the history is.
+        if ranking_id not in self.item_repository.get_ranking_modes([ranking_id]):
+            raise RankingList.DoesNotExist(f"Ranking with id {ranking_id} does not exist.")
+
+        checkpoint = self.rank_event_repository.get_checkpoint_at(ranking_id, at)
+        if checkpoint is None:
+            first = self.rank_event_repository.get_first_checkpoint(ranking_id)
+            # A baseline checkpoint means the ranking already had items when the
+            # log started; anything older was never recorded.
+            if first is not None and first.last_event_id == 0:
+                raise ValueError(f"History for ranking {ranking_id} starts at {first.created_at.isoformat()}")
+            order, last_event_id = [], 0
+        else:
+            order, last_event_id = list(checkpoint.item_ids), checkpoint.last_event_id
+
+        events = self.rank_event_repository.get_events(ranking_id, last_event_id, at)
+        for event in events:
+            order = apply_event(order, event.kind, event.changes)
+
+        names = self.item_repository.get_item_names(order)
+        return {
+            'ranking_id': ranking_id,
+            'at': at.isoformat(),
+            'items': [
+                {'id': item_id, 'name': names.get(item_id), 'rank': rank}
+                for rank, item_id in enumerate(order, start=1)
+            ],
+            'events_replayed': len(events),
+        }
+
+
+def apply_event(order: list[int], kind: str, changes: list) -> list[int]:
+    # Positions are clamped the same way the write path clamps them.
+    if kind == RankEvent.DELETE:
+        deleted = set(changes)
+        return [item_id for item_id in order if item_id not in deleted]
+    for item_id, position in changes:
+        if kind == RankEvent.MOVE:
+            if item_id not in order:
+                continue
+            order.remove(item_id)
+        order.insert(min(max(position, 1), len(order) + 1) - 1, item_id)
+    return order
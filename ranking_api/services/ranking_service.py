@@ -1,5 +1,8 @@
+from django.utils.http import quote_etag
+
 from ranking_api.repositories.ranking_repository import RankingRepository
 from ranking_api.models import RankingList
+from ranking_api.pagination import decode_cursor, encode_cursor
 from typing import Optional
 
 
@@ -10,11 +13,19 @@ class RankingService:
     def get_ranking(self, ranking_id: int) -> Optional[RankingList]:
         return self.ranking_repository.get_ranking(ranking_id)
 
-    def get_all_rankings(self) -> list[RankingList]:
-        return self.ranking_repository.get_all_rankings()
+    def get_validators(self, ranking_id: int) -> Optional[tuple[str, int, int]]:
+        # (ETag, Last-Modified timestamp, version) for conditional GETs, from
+        # one indexed lookup. The version lets the view reuse the read.
+        return self._validators(ranking_id, self.ranking_repository.get_version(ranking_id))
+
+    def get_rankings_page(self, limit: int, cursor: Optional[str] = None,
+                          title_prefix: Optional[str] = None) -> tuple[list[RankingList], Optional[str]]:
+        after_title, after_id = self._parse_cursor(cursor, title_prefix)
+        rankings = self.ranking_repository.get_rankings_page(limit + 1, after_id, title_prefix, after_title)
+        return self._split_page(rankings, limit, title_prefix)
 
-    def create_ranking(self, title: str, description: str = None) -> RankingList:
-        return self.ranking_repository.create_ranking(title, description)
+    def create_ranking(self, title: str, description: str = None, ordering_mode: str = None) -> RankingList:
+        return self.ranking_repository.create_ranking(title, description, ordering_mode)
 
     def delete_ranking(self, ranking_id: int) -> None:
         deleted = self.ranking_repository.delete_ranking(ranking_id)
@@ -27,4 +38,48 @@ class RankingService:
             raise RankingList.DoesNotExist(f"Ranking with id {ranking_id} does not exist.")
         return updated_ranking
 
+    # Async read path for the ASGI controllers.
+
+    async def aget_ranking(self, ranking_id: int) -> Optional[RankingList]:
+        return await self.ranking_repository.aget_ranking(ranking_id)
+
+    async def aget_validators(self, ranking_id: int) -> Optional[tuple[str, int, int]]:
+        return self._validators(ranking_id, await self.ranking_repository.aget_version(ranking_id))
+
+    async def aget_rankings_page(self, limit: int, cursor: Optional[str] = None,
+                                 title_prefix: Optional[str] = None) -> tuple[list[RankingList], Optional[str]]:
+        after_title, after_id = self._parse_cursor(cursor, title_prefix)
+        rankings = await self.ranking_repository.aget_rankings_page(limit + 1, after_id, title_prefix, after_title)
+        return self._split_page(rankings, limit, title_prefix)
+
+    @staticmethod
+    def _validators(ranking_id: int, version) -> Optional[tuple[str, int, int]]:
+        if version is None:
+            return None
+        version_number, updated_at = version
+        return quote_etag(f'{ranking_id}-{version_number}'), int(updated_at.timestamp()), version_number
+
+    @staticmethod
+    def _parse_cursor(cursor: Optional[str], title_prefix: Optional[str]) -> tuple[Optional[str], Optional[int]]:
+        # (title, id) of the last ranking seen; prefix listings are ordered by
+        # title, so their cursors carry it too.
+        if cursor is None:
+            return None, None
+        try:
+            values = decode_cursor(cursor)
+            after_id = int(values['id'])
+            after_title = values['title'] if title_prefix else None
+        except (KeyError, TypeError, ValueError):
+            raise ValueError('Invalid cursor')
+        if title_prefix and not isinstance(after_title, str):
+            raise ValueError('Invalid cursor')
+        return after_title, after_id
 
+    @staticmethod
+    def _split_page(rankings: list[RankingList], limit: int,
+                    title_prefix: Optional[str]) -> tuple[list[RankingList], Optional[str]]:
+        if len(rankings) <= limit:
+            return rankings, None
+        rankings = rankings[:limit]
+        last = rankings[-1]
+        return rankings, encode_cursor({'title': last.title, 'id': last.id} if title_prefix else {'id': last.id})
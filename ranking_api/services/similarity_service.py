@@ -0,0 +1,88 @@
+from typing import Optional
+
+import numpy as np
+
+from ranking_api import similarity
+from ranking_api.models import RankingList
+from ranking_api.rank_matrix import build_rank_matrix
+from ranking_api.repositories.item_repository import ItemRepository
+
+# Item fields that may identify the same item across rankings. `notes` is for
+# rankings that keep an external id there.
+KEY_FIELDS = ('name', 'notes')
+
+SPEARMAN = 'spearman'
+KENDALL = 'kendall'
+MATRIX_METRICS = (SPEARMAN, KENDALL)
+
+# The Kendall matrix costs rankings^2 x items^2 / 2 multiply-adds.
+MAX_KENDALL_MATRIX_ITEMS = 2000
+
+
+class SimilarityService:
+    def __init__(self, item_repository: ItemRepository):
+        self.item_repository = item_repository
+
+    def compare_rankings(self, ranking_id: int, other_ranking_id: int, key_field: str = 'name', p: float = 0.9) -> dict:
+        # Kendall tau and Spearman rho/footrule compare the order of the items
+        # both rankings contain; rank-biased overlap weighs the full lists,
+        # top first.
+        self._check_key_field(key_field)
+        if not 0 < p < 1:
+            raise ValueError('p must be between 0 and 1')
+        ranking_ids = list(dict.fromkeys([ranking_id, other_ranking_id]))
+        self._check_rankings(ranking_ids)
+
+        keys = self.item_repository.get_ranked_keys(ranking_ids, key_field)
+        first, second = keys.get(ranking_id, []), keys.get(other_ranking_id, [])
+        rho, footrule = similarity.spearman(first, second)
+        return {
+            'ranking_ids': [ranking_id, other_ranking_id],
+            'key': key_field,
+            'shared_items': len(set(first) & set(second)),
+            'kendall_tau': similarity.kendall_tau(first, second),
+            'spearman_rho': rho,
+            'spearman_footrule': footrule,
+            'rbo': similarity.rank_biased_overlap(first, second, p),
+            'rbo_p': p,
+        }
+
+    def get_similarity_matrix(self, ranking_ids: list[int], metric: str = SPEARMAN, key_field: str = 'name') -> dict:
+        # Pairwise similarity over the union of the rankings' items; an item a
+        # ranking leaves out counts as tied below everything it ranks.
+        if metric not in MATRIX_METRICS:
+            raise ValueError(f"metric must be one of {', '.join(MATRIX_METRICS)}")
+        self._check_key_field(key_field)
+        ranking_ids = list(dict.fromkeys(ranking_ids))
+        self._check_rankings(ranking_ids)
+
+        candidates, matrix = build_rank_matrix(self.item_repository.get_ranked_keys(ranking_ids, key_field), ranking_ids)
+        if metric == KENDALL:
+            if len(candidates) > MAX_KENDALL_MATRIX_ITEMS:
+                raise ValueError(f'kendall supports at most {MAX_KENDALL_MATRIX_ITEMS} distinct items')
+            values = similarity.kendall_tau_matrix(matrix)
+        else:
+            values = similarity.spearman_matrix(matrix)
+
+        return {
+            'metric': metric,
+            'key': key_field,
+            'ranking_ids': ranking_ids,
+            'matrix': [[self._finite(value) for value in row] for row in values.tolist()],
+        }
+
+    def _check_rankings(self, ranking_ids: list[int]):
+        found = self.item_repository.get_ranking_modes(ranking_ids)
+        missing = [ranking_id for ranking_id in ranking_ids if ranking_id not in found]
+        if missing:
+            raise RankingList.DoesNotExist(f"Rankings with ids {missing} do not exist.")
+
+    @staticmethod
+    def _check_key_field(key_field: str):
+        if key_field not in KEY_FIELDS:
+            raise ValueError(f"key must be one of {', '.join(KEY_FIELDS)}")
+
+    @staticmethod
+    def _finite(value: float) -> Optional[float]:
+        # Undefined correlations (a ranking with everything tied) become null.
+        return value if np.isfinite(value) else None
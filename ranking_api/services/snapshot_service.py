@@ -0,0 +1,68 @@
+from typing import Optional
+
+from django.db import transaction
+
+from ranking_api.models import RankEvent, RankingList, RankSnapshot
+from ranking_api.repositories.item_repository import ItemRepository
+from ranking_api.repositories.rank_event_repository import RankEventRepository
+from ranking_api.repositories.rank_snapshot_repository import RankSnapshotRepository
+from ranking_api.services.rank_history_service import apply_event
+
+MAX_SNAPSHOT_NAME_LENGTH = 255
+
+# Automatic snapshots kept per ranking; older ones are pruned as the rank log
+# is checkpointed. Named snapshots are never pruned.
+AUTOMATIC_SNAPSHOT_LIMIT = 100
+
+
+class SnapshotService:
+    def __init__(self, item_repository: ItemRepository, snapshot_repository: RankSnapshotRepository,
+                 event_repository: Optional[RankEventRepository] = None):
+        self.item_repository = item_repository
+        self.snapshot_repository = snapshot_repository
+        self.event_repository = event_repository if event_repository is not None else RankEventRepository()
+
+    def create_snapshot(self, ranking_id: int, name: str) -> RankSnapshot:
+        if not name:
+            raise ValueError('name is required')
+        if len(name) > MAX_SNAPSHOT_NAME_LENGTH:
+            raise ValueError(f'name must be at most {MAX_SNAPSHOT_NAME_LENGTH} characters')
+        with transaction.atomic():
+            if self.item_repository.lock_ranking(ranking_id) is None:
+                raise RankingList.DoesNotExist(f"Ranking with id {ranking_id} does not exist.")
+            return self.snapshot_repository.create_snapshot(
+                ranking_id, name, self.item_repository.get_ranking_version(ranking_id),
+                self.event_repository.get_last_event_id(ranking_id)
+            )
+
+    def take_snapshot(self, ranking_id: int, event: RankEvent):
+        # The undo point for a write the caller has just logged as `event`,
+        # under the ranking lock. The lock keeps the ranking's events in id
+        # order, so its events up to event.id - 1 are exactly those before it.
+        self.snapshot_repository.create_automatic_snapshot(ranking_id, event.id - 1)
+
+    def prune_snapshots(self, ranking_id: int) -> int:
+        return self.snapshot_repository.delete_automatic_snapshots(ranking_id, AUTOMATIC_SNAPSHOT_LIMIT)
+
+    def get_snapshot_state(self, ranking_id: int, snapshot_id: int) -> tuple[list[int], dict[int, tuple]]:
+        # The snapshot's order, replayed from the checkpoint before it, and
+        # (name, notes) for every item that has since been deleted.
+        last_event_id = self.snapshot_repository.get_last_event_id(ranking_id, snapshot_id)
+        if last_event_id is None:
+            raise RankSnapshot.DoesNotExist(f"Snapshot with id {snapshot_id} does not exist in ranking {ranking_id}.")
+
+        checkpoint = self.event_repository.get_checkpoint_through(ranking_id, last_event_id)
+        order = list(checkpoint.item_ids) if checkpoint is not None else []
+        after_event_id = checkpoint.last_event_id if checkpoint is not None else 0
+        for event in self.event_repository.get_events_through(ranking_id, after_event_id, last_event_id):
+            order = apply_event(order, event.kind, event.changes)
+        return order, self.event_repository.get_deleted_items(ranking_id, last_event_id)
+
+    def get_snapshots(self, ranking_id: int, limit: int) -> list[dict]:
+        # Newest first.
+        if ranking_id not in self.item_repository.get_ranking_modes([ranking_id]):
+            raise RankingList.DoesNotExist(f"Ranking with id {ranking_id} does not exist.")
+        return [
+            {**snapshot, 'automatic': snapshot['name'] is None}
+            for snapshot in self.snapshot_repository.get_snapshots(ranking_id, limit)
+        ]
@@ -38,11 +38,13 @@ INSTALLED_APPS = [
     'django.contrib.sessions',
     'django.contrib.messages',
     'django.contrib.staticfiles',
+    'django.contrib.postgres',
     'rest_framework',
     'corsheaders',
 ]
 
 MIDDLEWARE = [
+    'ranking_api.middleware.QueryCountMiddleware',
     'corsheaders.middleware.CorsMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
@@ -51,11 +53,13 @@ MIDDLEWARE = [
     'django.contrib.auth.middleware.AuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
+    'ranking_api.middleware.ProfilingMiddleware',
 ]
 
 CORS_ALLOWED_ORIGINS = [
     "http://localhost:8081",
 ]
+CORS_EXPOSE_HEADERS = ['X-DB-Queries']
 
 ROOT_URLCONF = 'ranking_api.urls'
 
@@ -82,6 +86,15 @@ WSGI_APPLICATION = 'ranking_api.wsgi.application'
 # https://docs.djangoproject.com/en/5.1/ref/settings/#databases
 
 load_dotenv()
+
+# Connection reuse
+# https://docs.djangoproject.com/en/5.1/ref/databases/#connection-management
+# DB_POOL=true hands connections out of psycopg 3's pool (needs `psycopg[pool]`
+# installed in place of psycopg2). Otherwise each worker thread keeps its
+# connection open for DB_CONN_MAX_AGE seconds, health-checked before reuse.
+# Under ASGI every request gets its own connection, so use the pool there.
+DB_POOL = os.getenv('DB_POOL', 'false').lower() == 'true'
+
 DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.postgresql',
@@ -89,11 +102,58 @@ DATABASES = {
         'USER': os.getenv('DB_USER'),
         'PASSWORD': os.getenv('DB_PASSWORD'),
         'HOST': os.getenv('DB_HOST', 'localhost'),
-        'PORT': os.getenv('DB_PORT', '5432')
+        'PORT': os.getenv('DB_PORT', '5432'),
+        # The pool manages connection lifetimes itself, so Django requires 0 here.
+        'CONN_MAX_AGE': 0 if DB_POOL else int(os.getenv('DB_CONN_MAX_AGE', '60')),
+        'CONN_HEALTH_CHECKS': os.getenv('DB_CONN_HEALTH_CHECKS', 'true').lower() == 'true',
+        'OPTIONS': {
+            'pool': {
+                'min_size': int(os.getenv('DB_POOL_MIN_SIZE', '2')),
+                'max_size': int(os.getenv('DB_POOL_MAX_SIZE', '10')),
+                'timeout': float(os.getenv('DB_POOL_TIMEOUT', '10')),
+            },
+        } if DB_POOL else {},
     }
 }
 
 
+# Cache
+# https://docs.djangoproject.com/en/5.1/topics/cache/
+# The 'items' cache backs ItemListCache. LocMemCache evicts least recently used
+# entries once MAX_ENTRIES is reached.
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    },
+    'items': {
+        'BACKEND': os.getenv('ITEM_CACHE_BACKEND', 'django.core.cache.backends.locmem.LocMemCache'),
+        'LOCATION': os.getenv('ITEM_CACHE_LOCATION', 'ranking-items'),
+        'TIMEOUT': int(os.getenv('ITEM_CACHE_TIMEOUT', '300')),
+        'OPTIONS': {
+            'MAX_ENTRIES': int(os.getenv('ITEM_CACHE_MAX_ENTRIES', '1000')),
+        },
+    },
+}
+
+# Per-request query instrumentation (ranking_api.middleware.QueryCountMiddleware).
+# Requests running more queries, or spending longer in the database, than
+# these budgets are logged as warnings.
+QUERY_BUDGET = int(os.getenv('QUERY_BUDGET', '20'))
+QUERY_TIME_BUDGET_MS = float(os.getenv('QUERY_TIME_BUDGET_MS', '200'))
+QUERY_STATS_HEADERS = os.getenv('QUERY_STATS_HEADERS', 'true').lower() == 'true'
+
+# Opt-in profiling (ranking_api.middleware.ProfilingMiddleware). With
+# PROFILING_ENABLED, staff users, or requests sending PROFILING_TOKEN in an
+# X-Profile header or ?profile= parameter, get their request run under
+# cProfile, with stats written to PROFILING_DIR. LAYER_TIMING_SAMPLE_RATE is
+# the fraction of requests that report per-layer wall time in Server-Timing.
+PROFILING_ENABLED = os.getenv('PROFILING_ENABLED', 'false').lower() == 'true'
+PROFILING_TOKEN = os.getenv('PROFILING_TOKEN', '')
+PROFILING_DIR = os.getenv('PROFILING_DIR', str(BASE_DIR / 'profiles'))
+LAYER_TIMING_SAMPLE_RATE = float(os.getenv('LAYER_TIMING_SAMPLE_RATE', '0'))
+
+
 # Password validation
 # https://docs.djangoproject.com/en/5.1/ref/settings/#auth-password-validators
 
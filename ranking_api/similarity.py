@@ -0,0 +1,122 @@
+from typing import Hashable, Optional, Sequence
+
+import numpy as np
+
+# Items per block when building pairwise sign vectors for kendall_tau_matrix;
+# bounds the (rankings x block x n) temporary.
+KENDALL_BLOCK_SIZE = 16
+
+
+def count_inversions(values: Sequence) -> int:
+    # Pairs i < j with values[i] > values[j], counted while merge-sorting: O(n log n).
+    values = list(values)
+    inversions = 0
+    width = 1
+    while width < len(values):
+        merged = []
+        for start in range(0, len(values), 2 * width):
+            left = values[start:start + width]
+            right = values[start + width:start + 2 * width]
+            i = j = 0
+            while i < len(left) and j < len(right):
+                if right[j] < left[i]:
+                    # right[j] jumps every remaining left value.
+                    inversions += len(left) - i
+                    merged.append(right[j])
+                    j += 1
+                else:
+                    merged.append(left[i])
+                    i += 1
+            merged.extend(left[i:])
+            merged.extend(right[j:])
+        values = merged
+        width *= 2
+    return inversions
+
+
+def unique_in_order(keys: Sequence[Hashable]) -> list:
+    # A key listed twice keeps its best position.
+    return list(dict.fromkeys(keys))
+
+
+def shared_positions(first: Sequence[Hashable], second: Sequence[Hashable]) -> tuple[np.ndarray, np.ndarray]:
+    # 0-based positions of the items both rankings contain, re-ranked among
+    # those items only, in the first ranking's order.
+    first, second = unique_in_order(first), unique_in_order(second)
+    shared = set(first) & set(second)
+    second_position = {key: position for position, key in enumerate(key for key in second if key in shared)}
+    second_order = np.array([second_position[key] for key in first if key in shared], dtype=np.int64)
+    return np.arange(len(second_order)), second_order
+
+
+def kendall_tau(first: Sequence[Hashable], second: Sequence[Hashable]) -> Optional[float]:
+    # Over the shared items; None when fewer than two are shared.
+    _, second_order = shared_positions(first, second)
+    size = len(second_order)
+    if size < 2:
+        return None
+    discordant = count_inversions(second_order.tolist())
+    return 1 - 4 * discordant / (size * (size - 1))
+
+
+def spearman(first: Sequence[Hashable], second: Sequence[Hashable]) -> tuple[Optional[float], int]:
+    # (rho, footrule) over the shared items; rho is None when fewer than two are shared.
+    first_order, second_order = shared_positions(first, second)
+    size = len(first_order)
+    distances = np.abs(first_order - second_order)
+    footrule = int(distances.sum())
+    if size < 2:
+        return None, footrule
+    rho = 1 - 6 * int((distances ** 2).sum()) / (size * (size ** 2 - 1))
+    return rho, footrule
+
+
+def rank_biased_overlap(first: Sequence[Hashable], second: Sequence[Hashable], p: float = 0.9) -> float:
+    # Extrapolated RBO (Webber, Moffat & Zobel, 2010) for lists of any length
+    # and overlap; top-weighted, with p the persistence of a reader going down
+    # the lists. 1 for identical lists, 0 for disjoint ones.
+    short, long = sorted((unique_in_order(first), unique_in_order(second)), key=len)
+    s, l = len(short), len(long)
+    if not s:
+        return 1.0 if not l else 0.0
+
+    # An item joins the overlap at the depth where the later of its two
+    # positions is reached (items past the short list's end never count).
+    long_position = {key: position for position, key in enumerate(long)}
+    joins = np.array([
+        max(position, long_position[key]) for position, key in enumerate(short) if key in long_position
+    ], dtype=np.int64)
+    overlap = np.cumsum(np.bincount(joins, minlength=l)[:l])
+
+    depths = np.arange(1, l + 1)
+    weights = p ** depths
+    overlap_s, overlap_l = overlap[s - 1], overlap[l - 1]
+    total = (overlap / depths * weights).sum()
+    total += (overlap_s * (depths[s:] - s) / (s * depths[s:]) * weights[s:]).sum()
+    return float((1 - p) / p * total + ((overlap_l - overlap_s) / l + overlap_s / s) * p ** l)
+
+
+def spearman_matrix(matrix: np.ndarray) -> np.ndarray:
+    # Pairwise Spearman rho between the rows of a rank matrix (Pearson on the
+    # positions, which already average ties). NaN where a row is constant.
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.corrcoef(matrix) if len(matrix) > 1 else np.ones((len(matrix), len(matrix)))
+
+
+def kendall_tau_matrix(matrix: np.ndarray) -> np.ndarray:
+    # Pairwise Kendall tau-b between the rows of a rank matrix. Every ranking
+    # becomes a vector of signs over item pairs, so tau-b is a normalised dot
+    # product and all of them fall out of one Gram matrix, built a block of
+    # items at a time. NaN where a row ties everything.
+    rankings, size = matrix.shape
+    gram = np.zeros((rankings, rankings))
+    for start in range(0, size, KENDALL_BLOCK_SIZE):
+        block = matrix[:, start:start + KENDALL_BLOCK_SIZE]
+        signs = np.sign(block[:, :, None] - matrix[:, None, :])
+        # Keep each pair once: j > i.
+        signs *= np.arange(size)[None, :] > np.arange(start, start + block.shape[1])[:, None]
+        signs = signs.reshape(rankings, -1)
+        gram += signs @ signs.T
+    norms = np.sqrt(np.diag(gram))
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return gram / np.outer(norms, norms)
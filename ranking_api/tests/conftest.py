@@ -0,0 +1,12 @@
+import pytest
+from django.core.cache import caches
+
+from ranking_api.cache import item_list_cache
+
+
+@pytest.fixture(autouse=True)
+def clear_caches():
+    # Cached item lists are keyed on ranking ids, which the test database reuses.
+    for cache in caches.all():
+        cache.clear()
+    item_list_cache.reset_stats()
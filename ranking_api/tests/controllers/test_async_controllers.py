@@ -0,0 +1,180 @@
+from django.test import TestCase
+from django.urls import reverse
+
+from ranking_api.models import Item, RankingList
+
+
+class TestAsyncItemEndpoints(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.ranking = RankingList.objects.create(title='Cities')
+        cls.items = Item.objects.bulk_create(
+            Item(ranking=cls.ranking, name=f'City {rank}', rank=rank) for rank in range(1, 6)
+        )
+        cls.sparse_ranking = RankingList.objects.create(title='Sparse', ordering_mode=RankingList.SPARSE)
+        cls.sparse_items = Item.objects.bulk_create(
+            Item(ranking=cls.sparse_ranking, name=name, notes='', rank=index << 20)
+            for index, name in enumerate(['Rome', 'Oslo', 'Lima'], start=1)
+        )
+
+    async def test_get_ranking_items(self):
+        response = await self.async_client.get(
+            reverse('async-ranking-items', kwargs={'ranking_id': self.ranking.id})
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([item['name'] for item in response.json()['items']], [f'City {rank}' for rank in range(1, 6)])
+        self.assertIn('ETag', response)
+
+    async def test_get_ranking_items_sparse_positions(self):
+        response = await self.async_client.get(
+            reverse('async-ranking-items', kwargs={'ranking_id': self.sparse_ranking.id})
+        )
+
+        self.assertEqual([item['rank'] for item in response.json()['items']], [1, 2, 3])
+
+    async def test_get_ranking_items_not_found(self):
+        response = await self.async_client.get(reverse('async-ranking-items', kwargs={'ranking_id': 999}))
+
+        self.assertEqual(response.status_code, 404)
+        self.assertEqual(response.json(), {'error': 'Ranking not found'})
+
+    async def test_get_ranking_items_not_modified(self):
+        url = reverse('async-ranking-items', kwargs={'ranking_id': self.ranking.id})
+        etag = (await self.async_client.get(url))['ETag']
+
+        response = await self.async_client.get(url, headers={'If-None-Match': etag})
+
+        self.assertEqual(response.status_code, 304)
+
+    async def test_get_ranking_items_pages(self):
+        url = reverse('async-ranking-items', kwargs={'ranking_id': self.sparse_ranking.id})
+
+        first = (await self.async_client.get(url, {'limit': 2})).json()
+        second = (await self.async_client.get(url, {'limit': 2, 'cursor': first['next_cursor']})).json()
+
+        self.assertEqual([item['rank'] for item in first['items']], [1, 2])
+        self.assertEqual([(item['name'], item['rank']) for item in second['items']], [('Lima', 3)])
+        self.assertIsNone(second['next_cursor'])
+
+    async def test_get_ranking_items_invalid_limit(self):
+        response = await self.async_client.get(
+            reverse('async-ranking-items', kwargs={'ranking_id': self.ranking.id}),
+            {'limit': 'abc'}
+        )
+
+        self.assertEqual(response.status_code, 400)
+
+    async def test_get_ranking_items_stream(self):
+        response = await self.async_client.get(
+            reverse('async-ranking-items', kwargs={'ranking_id': self.sparse_ranking.id}),
+            {'stream': 'true'}
+        )
+
+        self.assertTrue(response.streaming)
+        body = b''.join([chunk async for chunk in response.streaming_content])
+        self.assertEqual(
+            body,
+            b'{"items": [' + b', '.join(
+                b'{"id": %d, "name": "%s", "notes": "", "rank": %d, "ranking_id": %d}'
+                % (item.id, item.name.encode(), position, self.sparse_ranking.id)
+                for position, item in enumerate(self.sparse_items, start=1)
+            ) + b']}'
+        )
+
+    async def test_get_ranking_items_top(self):
+        response = await self.async_client.get(
+            reverse('async-ranking-items', kwargs={'ranking_id': self.ranking.id}),
+            {'top': 2}
+        )
+
+        self.assertEqual([item['name'] for item in response.json()['items']], ['City 1', 'City 2'])
+
+    async def test_get_ranking_items_rank_range_sparse(self):
+        response = await self.async_client.get(
+            reverse('async-ranking-items', kwargs={'ranking_id': self.sparse_ranking.id}),
+            {'rank_from': 2, 'rank_to': 3}
+        )
+
+        self.assertEqual([(item['name'], item['rank']) for item in response.json()['items']], [('Oslo', 2), ('Lima', 3)])
+
+    async def test_get_ranking_item(self):
+        response = await self.async_client.get(
+            reverse('async-ranking-item', kwargs={'item_id': self.sparse_items[2].id})
+        )
+
+        self.assertEqual(response.json(), {
+            'id': self.sparse_items[2].id,
+            'name': 'Lima',
+            'notes': '',
+            'rank': 3,
+            'ranking_id': self.sparse_ranking.id,
+        })
+
+    async def test_get_ranking_item_not_found(self):
+        response = await self.async_client.get(reverse('async-ranking-item', kwargs={'item_id': 999}))
+
+        self.assertEqual(response.status_code, 404)
+
+    async def test_writes_not_allowed(self):
+        response = await self.async_client.post(
+            reverse('async-ranking-items', kwargs={'ranking_id': self.ranking.id}),
+            {'name': 'Lisbon'}
+        )
+
+        self.assertEqual(response.status_code, 405)
+        self.assertEqual(response['Allow'], 'GET, HEAD, OPTIONS')
+
+    def test_get_ranking_items_query_count(self):
+        # Same queries as the sync endpoint: ETag lookup, ordering mode, item rows.
+        with self.assertNumQueries(3):
+            self.client.get(reverse('async-ranking-items', kwargs={'ranking_id': self.ranking.id}))
+
+
+class TestAsyncRankingEndpoints(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.rankings = [
+            RankingList.objects.create(title=title, description=f'{title} ranking')
+            for title in ['Movies', 'Music', 'Books']
+        ]
+
+    async def test_get_all_rankings(self):
+        response = await self.async_client.get(reverse('async-rankings-list'))
+
+        self.assertEqual([ranking['title'] for ranking in response.json()['rankings']], ['Movies', 'Music', 'Books'])
+
+    async def test_get_rankings_page(self):
+        url = reverse('async-rankings-list')
+
+        first = (await self.async_client.get(url, {'title': 'M', 'limit': 1})).json()
+        second = (await self.async_client.get(url, {'title': 'M', 'limit': 1, 'cursor': first['next_cursor']})).json()
+
+        self.assertEqual([ranking['title'] for ranking in first['rankings']], ['Movies'])
+        self.assertEqual([ranking['title'] for ranking in second['rankings']], ['Music'])
+        self.assertIsNone(second['next_cursor'])
+
+    async def test_get_rankings_page_invalid_cursor(self):
+        response = await self.async_client.get(reverse('async-rankings-list'), {'cursor': 'nope'})
+
+        self.assertEqual(response.status_code, 400)
+
+    async def test_get_ranking(self):
+        response = await self.async_client.get(
+            reverse('async-ranking-detail', kwargs={'ranking_id': self.rankings[1].id})
+        )
+
+        self.assertEqual(response.json(), {
+            'id': self.rankings[1].id,
+            'title': 'Music',
+            'description': 'Music ranking',
+        })
+        self.assertEqual(response['ETag'], f'"{self.rankings[1].id}-1"')
+
+    async def test_get_ranking_not_found(self):
+        response = await self.async_client.get(reverse('async-ranking-detail', kwargs={'ranking_id': 999}))
+
+        self.assertEqual(response.status_code, 404)
+        self.assertNotIn('ETag', response)
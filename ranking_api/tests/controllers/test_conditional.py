@@ -0,0 +1,56 @@
+from django.test import TestCase
+from django.urls import reverse
+
+from ranking_api.models import Item, RankingList
+
+
+class TestConditionalRankingReads(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.ranking = RankingList.objects.create(title='Cities')
+        Item.objects.create(ranking=cls.ranking, name='Chicago', rank=1)
+
+    def test_items_not_modified(self):
+        url = reverse('ranking-items', kwargs={'ranking_id': self.ranking.id})
+        etag = self.client.get(url)['ETag']
+
+        with self.assertNumQueries(1):
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response['ETag'], etag)
+        self.assertEqual(response.content, b'')
+
+    def test_items_modified_after_write(self):
+        url = reverse('ranking-items', kwargs={'ranking_id': self.ranking.id})
+        etag = self.client.get(url)['ETag']
+
+        self.client.post(url, data={'name': 'Boston'})
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response['ETag'], etag)
+
+    def test_ranking_not_modified_since(self):
+        url = reverse('ranking-detail', kwargs={'ranking_id': self.ranking.id})
+        last_modified = self.client.get(url)['Last-Modified']
+
+        response = self.client.get(url, HTTP_IF_MODIFIED_SINCE=last_modified)
+
+        self.assertEqual(response.status_code, 304)
+
+    def test_ranking_modified_after_update(self):
+        url = reverse('ranking-detail', kwargs={'ranking_id': self.ranking.id})
+        etag = self.client.get(url)['ETag']
+
+        self.client.put(url, data={'title': 'Towns'}, content_type='application/json')
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['title'], 'Towns')
+
+    def test_missing_ranking_has_no_validators(self):
+        response = self.client.get(reverse('ranking-detail', kwargs={'ranking_id': 999}))
+
+        self.assertEqual(response.status_code, 404)
+        self.assertFalse(response.has_header('ETag'))
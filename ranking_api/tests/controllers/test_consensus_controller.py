@@ -0,0 +1,72 @@
+from django.test import TestCase
+from django.urls import reverse
+from unittest.mock import patch
+
+from ranking_api.controllers.consensus_controller import MAX_CONSENSUS_RANKINGS
+from ranking_api.models import Item, RankingList
+from ranking_api.services import ConsensusService
+
+
+@patch.object(ConsensusService, 'get_consensus')
+class TestGetConsensus(TestCase):
+    def post(self, data):
+        return self.client.post(reverse('rankings-consensus'), data=data, content_type='application/json')
+
+    def test_consensus(self, mock_get_consensus):
+        mock_get_consensus.return_value = {'method': 'kemeny', 'rankings': 2, 'items': [], 'disagreements': 0}
+
+        response = self.post({'ranking_ids': [1, "2"], 'method': 'kemeny'})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['method'], 'kemeny')
+        mock_get_consensus.assert_called_once_with([1, 2], 'kemeny')
+
+    def test_defaults_to_borda(self, mock_get_consensus):
+        mock_get_consensus.return_value = {}
+
+        self.post({'ranking_ids': [1]})
+
+        mock_get_consensus.assert_called_once_with([1], 'borda')
+
+    def test_invalid_ranking_ids(self, mock_get_consensus):
+        for ranking_ids in (None, [], ['one'], list(range(MAX_CONSENSUS_RANKINGS + 1))):
+            response = self.post({'ranking_ids': ranking_ids})
+
+            self.assertEqual(response.status_code, 400)
+        mock_get_consensus.assert_not_called()
+
+    def test_invalid_method(self, mock_get_consensus):
+        mock_get_consensus.side_effect = ValueError('method must be one of borda, kemeny')
+
+        response = self.post({'ranking_ids': [1], 'method': 'median'})
+
+        self.assertEqual(response.status_code, 400)
+
+    def test_missing_rankings(self, mock_get_consensus):
+        mock_get_consensus.side_effect = RankingList.DoesNotExist('Rankings with ids [9] do not exist.')
+
+        response = self.post({'ranking_ids': [9]})
+
+        self.assertEqual(response.status_code, 404)
+
+
+class TestConsensusEndToEnd(TestCase):
+    def test_consensus_over_stored_rankings(self):
+        orders = [["Paris", "London", "Rome"], ["London", "Paris", "Rome"], ["Paris", "Rome"]]
+        rankings = []
+        for order in orders:
+            ranking = RankingList.objects.create(title="Cities")
+            Item.objects.bulk_create(
+                Item(ranking=ranking, name=name, rank=rank) for rank, name in enumerate(order, start=1)
+            )
+            rankings.append(ranking.id)
+
+        # ranking lookup, item names
+        with self.assertNumQueries(2):
+            response = self.client.post(
+                reverse('rankings-consensus'),
+                data={'ranking_ids': rankings},
+                content_type='application/json'
+            )
+
+        self.assertEqual([item['name'] for item in response.json()['items']], ["Paris", "London", "Rome"])
@@ -0,0 +1,106 @@
+from datetime import datetime, timezone
+from django.test import TestCase
+from django.urls import reverse
+from unittest.mock import patch
+
+from ranking_api.models import Item, RankCheckpoint, RankEvent, RankingList
+from ranking_api.services import RankHistoryService
+
+
+@patch.object(RankHistoryService, 'get_order_at')
+class TestGetRankingHistory(TestCase):
+    def get(self, params):
+        return self.client.get(reverse('ranking-history', kwargs={'ranking_id': 1}), params)
+
+    def test_history_at(self, mock_get_order_at):
+        mock_get_order_at.return_value = {'items': []}
+
+        response = self.get({'at': '2024-05-01T12:00:00+00:00'})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), {'items': []})
+        mock_get_order_at.assert_called_once_with(1, datetime(2024, 5, 1, 12, tzinfo=timezone.utc))
+
+    def test_naive_time_is_made_aware(self, mock_get_order_at):
+        mock_get_order_at.return_value = {}
+
+        self.get({'at': '2024-05-01T12:00:00'})
+
+        self.assertIsNotNone(mock_get_order_at.call_args.args[1].tzinfo)
+
+    def test_invalid_time(self, mock_get_order_at):
+        for at in ('yesterday', '2024-13-01T00:00:00'):
+            response = self.get({'at': at})
+
+            self.assertEqual(response.status_code, 400)
+        mock_get_order_at.assert_not_called()
+
+    def test_before_history(self, mock_get_order_at):
+        mock_get_order_at.side_effect = ValueError("History for ranking 1 starts at 2024-05-01")
+
+        response = self.get({})
+
+        self.assertEqual(response.status_code, 400)
+
+    def test_missing_ranking(self, mock_get_order_at):
+        mock_get_order_at.side_effect = RankingList.DoesNotExist("Ranking with id 1 does not exist.")
+
+        response = self.get({})
+
+        self.assertEqual(response.status_code, 404)
+
+
+class TestRankingHistoryEndToEnd(TestCase):
+    def setUp(self):
+        self.ranking = RankingList.objects.create(title='Cities')
+        self.url = reverse('ranking-history', kwargs={'ranking_id': self.ranking.id})
+
+    def add(self, name, rank=None):
+        data = {'name': name} if rank is None else {'name': name, 'rank': rank}
+        self.client.post(reverse('ranking-items', kwargs={'ranking_id': self.ranking.id}), data=data)
+        return Item.objects.get(ranking=self.ranking, name=name)
+
+    def ids_at(self, at):
+        response = self.client.get(self.url, {'at': at.isoformat()})
+        self.assertEqual(response.status_code, 200)
+        return [item['id'] for item in response.json()['items']]
+
+    def test_replays_each_past_order(self):
+        snapshots = []
+        lisbon = self.add('Lisbon')
+        snapshots.append(datetime.now(timezone.utc))
+        oslo = self.add('Oslo', rank=1)
+        rome = self.add('Rome')
+        snapshots.append(datetime.now(timezone.utc))
+        self.client.post(reverse('ranking-item-rank', kwargs={'item_id': rome.id}), data={'rank': 1})
+        snapshots.append(datetime.now(timezone.utc))
+        self.client.delete(reverse('ranking-item', kwargs={'item_id': lisbon.id}))
+        snapshots.append(datetime.now(timezone.utc))
+
+        # Lisbon is gone by now, but past orders still list its id.
+        self.assertEqual(
+            [self.ids_at(at) for at in snapshots],
+            [
+                [lisbon.id],
+                [oslo.id, lisbon.id, rome.id],
+                [rome.id, oslo.id, lisbon.id],
+                [rome.id, oslo.id],
+            ]
+        )
+        self.assertEqual(RankEvent.objects.filter(ranking=self.ranking).count(), 5)
+
+    def test_checkpoints_bound_the_replay(self):
+        with patch('ranking_api.services.item_service.CHECKPOINT_INTERVAL', 3):
+            for index in range(7):
+                self.add(f'City {index}', rank=1)
+
+        self.assertEqual(
+            list(RankCheckpoint.objects.filter(ranking=self.ranking).values_list('item_ids', flat=True)),
+            [
+                list(Item.objects.filter(name__in=['City 2', 'City 1', 'City 0']).order_by('-name').values_list('id', flat=True)),
+                list(Item.objects.filter(name__in=[f'City {index}' for index in range(6)]).order_by('-name').values_list('id', flat=True)),
+            ]
+        )
+        response = self.client.get(self.url)
+        self.assertEqual(response.json()['events_replayed'], 1)
+        self.assertEqual([item['name'] for item in response.json()['items']], [f'City {index}' for index in range(6, -1, -1)])
@@ -7,43 +7,256 @@ from ranking_api.models import Item, RankingList
 
 
 @patch.object(RankingService, 'get_ranking')
-@patch.object(ItemService, 'get_all_items')
+@patch.object(ItemService, 'get_item_rows')
 class TestGetAllRankingItems(TestCase):
 
-    def test_get_ranking_items_success(self, mock_get_all_items, mock_get_ranking):
+    def test_get_ranking_items_success(self, mock_get_item_rows, mock_get_ranking):
         ranking_id = 1
         mock_get_ranking.return_value = MagicMock()
-        mock_get_all_items.return_value = []
+        mock_get_item_rows.return_value = []
 
         response = self.client.get(reverse('ranking-items', kwargs={'ranking_id': ranking_id}))
 
         self.assertEqual(response.status_code, 200)
-        mock_get_ranking.assert_called_once_with(ranking_id)
-        mock_get_all_items.assert_called_once_with(ranking_id)
+        mock_get_item_rows.assert_called_once_with(ranking_id, None)
+        # Existence is implied by the cached/loaded rows, so no separate ranking lookup.
+        mock_get_ranking.assert_not_called()
 
 
-    def test_get_ranking_items_empty(self, mock_get_all_items, mock_get_ranking):
+    def test_get_ranking_items_empty(self, mock_get_item_rows, mock_get_ranking):
         ranking_id = 1
         mock_get_ranking.return_value = MagicMock()
-        mock_get_all_items.return_value = []
+        mock_get_item_rows.return_value = []
 
         response = self.client.get(reverse('ranking-items', kwargs={'ranking_id': ranking_id}))
 
         self.assertEqual(response.status_code, 200)
         data = json.loads(response.content)
         self.assertEqual(data['items'], [])
-        mock_get_all_items.assert_called_once_with(ranking_id)
+        mock_get_item_rows.assert_called_once_with(ranking_id, None)
 
 
-    def test_get_ranking_items_ranking_not_found(self, mock_get_item, mock_get_ranking):
+    def test_get_ranking_items_ranking_not_found(self, mock_get_item_rows, mock_get_ranking):
         ranking_id = 100
-        mock_get_ranking.return_value = None
+        mock_get_item_rows.return_value = None
 
         response = self.client.get(reverse('ranking-items', kwargs={'ranking_id': ranking_id}))
 
         self.assertEqual(response.status_code, 404)
         self.assertEqual(response.content, b'{"error": "Ranking not found"}')
-        mock_get_ranking.assert_called_once_with(ranking_id)
+        mock_get_item_rows.assert_called_once_with(ranking_id, None)
+
+@patch.object(RankingService, 'get_ranking')
+@patch.object(ItemService, 'iter_item_rows')
+class TestStreamRankingItems(TestCase):
+    def test_stream_ranking_items(self, mock_iter_item_rows, mock_get_ranking):
+        mock_get_ranking.return_value = MagicMock()
+        rows = [
+            {'id': 1, 'name': 'London', 'notes': '', 'rank': 1, 'ranking_id': 1},
+            {'id': 2, 'name': 'Paris', 'notes': None, 'rank': 2, 'ranking_id': 1},
+        ]
+        mock_iter_item_rows.return_value = iter(rows)
+
+        response = self.client.get(
+            reverse('ranking-items', kwargs={'ranking_id': 1}),
+            {'stream': 'true'}
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.streaming)
+        self.assertEqual(response['Content-Type'], 'application/json')
+        self.assertEqual(json.loads(b''.join(response.streaming_content)), {'items': rows})
+        mock_iter_item_rows.assert_called_once_with(1)
+
+    def test_stream_ranking_items_ranking_not_found(self, mock_iter_item_rows, mock_get_ranking):
+        mock_get_ranking.return_value = None
+
+        response = self.client.get(
+            reverse('ranking-items', kwargs={'ranking_id': 100}),
+            {'stream': 'true'}
+        )
+
+        self.assertEqual(response.status_code, 404)
+        mock_iter_item_rows.assert_not_called()
+
+@patch.object(RankingService, 'get_ranking')
+@patch.object(ItemService, 'get_items_page')
+class TestGetRankingItemsPage(TestCase):
+    def test_get_ranking_items_page(self, mock_get_items_page, mock_get_ranking):
+        mock_get_ranking.return_value = MagicMock()
+        mock_get_items_page.return_value = (
+            [{'id': 1, 'name': 'London', 'notes': '', 'rank': 1, 'ranking_id': 1}],
+            'next-page'
+        )
+
+        response = self.client.get(
+            reverse('ranking-items', kwargs={'ranking_id': 1}),
+            {'limit': 1}
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), {
+            'items': [{'id': 1, 'name': 'London', 'notes': '', 'rank': 1, 'ranking_id': 1}],
+            'next_cursor': 'next-page'
+        })
+        mock_get_items_page.assert_called_once_with(1, 1, cursor=None)
+
+    def test_get_ranking_items_page_with_cursor(self, mock_get_items_page, mock_get_ranking):
+        mock_get_ranking.return_value = MagicMock()
+        mock_get_items_page.return_value = ([], None)
+
+        response = self.client.get(
+            reverse('ranking-items', kwargs={'ranking_id': 1}),
+            {'cursor': 'abc'}
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), {'items': [], 'next_cursor': None})
+        mock_get_items_page.assert_called_once_with(1, 100, cursor='abc')
+
+    def test_get_ranking_items_page_invalid_limit(self, mock_get_items_page, mock_get_ranking):
+        mock_get_ranking.return_value = MagicMock()
+
+        response = self.client.get(
+            reverse('ranking-items', kwargs={'ranking_id': 1}),
+            {'limit': 'all'}
+        )
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json(), {'error': 'limit must be an integer'})
+        mock_get_items_page.assert_not_called()
+
+    def test_get_ranking_items_page_invalid_cursor(self, mock_get_items_page, mock_get_ranking):
+        mock_get_ranking.return_value = MagicMock()
+        mock_get_items_page.side_effect = ValueError('Invalid cursor')
+
+        response = self.client.get(
+            reverse('ranking-items', kwargs={'ranking_id': 1}),
+            {'cursor': 'garbage'}
+        )
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json(), {'error': 'Invalid cursor'})
+
+@patch.object(ItemService, 'get_items_in_rank_range')
+class TestGetRankingItemsInRankRange(TestCase):
+    def get(self, params, ranking_id=1):
+        return self.client.get(reverse('ranking-items', kwargs={'ranking_id': ranking_id}), params)
+
+    def test_top(self, mock_get_items_in_rank_range):
+        mock_get_items_in_rank_range.return_value = [{'id': 1, 'rank': 1}]
+
+        response = self.get({'top': 10})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), {'items': [{'id': 1, 'rank': 1}]})
+        mock_get_items_in_rank_range.assert_called_once_with(1, 1, 10)
+
+    def test_rank_range(self, mock_get_items_in_rank_range):
+        mock_get_items_in_rank_range.return_value = []
+
+        self.get({'rank_from': 11, 'rank_to': 20})
+
+        mock_get_items_in_rank_range.assert_called_once_with(1, 11, 20)
+
+    def test_invalid_range(self, mock_get_items_in_rank_range):
+        response = self.get({'rank_from': 5, 'rank_to': 1})
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json(), {'error': 'rank_to must not be less than rank_from'})
+        mock_get_items_in_rank_range.assert_not_called()
+
+    def test_ranking_not_found(self, mock_get_items_in_rank_range):
+        mock_get_items_in_rank_range.return_value = None
+
+        response = self.get({'top': 10}, ranking_id=999)
+
+        self.assertEqual(response.status_code, 404)
+
+@patch.object(RankingService, 'get_ranking')
+@patch.object(ItemService, 'search_items')
+class TestSearchItems(TestCase):
+    def test_global_search(self, mock_search_items, mock_get_ranking):
+        mock_search_items.return_value = ([{'id': 1, 'name': 'Paris', 'score': 0.6}], 'next')
+
+        response = self.client.get(reverse('items-search'), {'q': ' paris ', 'limit': 20})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), {'items': [{'id': 1, 'name': 'Paris', 'score': 0.6}], 'next_cursor': 'next'})
+        mock_search_items.assert_called_once_with('paris', 20, ranking_id=None, cursor=None)
+        mock_get_ranking.assert_not_called()
+
+    def test_ranking_search(self, mock_search_items, mock_get_ranking):
+        mock_get_ranking.return_value = MagicMock()
+        mock_search_items.return_value = ([], None)
+
+        self.client.get(reverse('ranking-items-search', kwargs={'ranking_id': 3}), {'q': 'paris', 'cursor': 'abc'})
+
+        mock_search_items.assert_called_once_with('paris', 100, ranking_id=3, cursor='abc')
+
+    def test_ranking_not_found(self, mock_search_items, mock_get_ranking):
+        mock_get_ranking.return_value = None
+
+        response = self.client.get(reverse('ranking-items-search', kwargs={'ranking_id': 999}), {'q': 'paris'})
+
+        self.assertEqual(response.status_code, 404)
+        mock_search_items.assert_not_called()
+
+    def test_missing_query(self, mock_search_items, mock_get_ranking):
+        response = self.client.get(reverse('items-search'), {'q': '  '})
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json(), {'error': 'q is required'})
+        mock_search_items.assert_not_called()
+
+    def test_query_too_long(self, mock_search_items, mock_get_ranking):
+        response = self.client.get(reverse('items-search'), {'q': 'a' * 201})
+
+        self.assertEqual(response.status_code, 400)
+        mock_search_items.assert_not_called()
+
+    def test_invalid_cursor(self, mock_search_items, mock_get_ranking):
+        mock_search_items.side_effect = ValueError('Invalid cursor')
+
+        response = self.client.get(reverse('items-search'), {'q': 'paris', 'cursor': 'bad'})
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json(), {'error': 'Invalid cursor'})
+
+@patch.object(ItemService, 'get_item_neighbors')
+class TestGetItemNeighbors(TestCase):
+    def get(self, params, item_id=7):
+        return self.client.get(reverse('ranking-item-neighbors', kwargs={'item_id': item_id}), params)
+
+    def test_neighbors(self, mock_get_item_neighbors):
+        mock_get_item_neighbors.return_value = {'rank': 4, 'total': 10, 'items': [{'id': 7, 'rank': 4}]}
+
+        response = self.get({'radius': 2})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), {'item_id': 7, 'rank': 4, 'total': 10, 'items': [{'id': 7, 'rank': 4}]})
+        mock_get_item_neighbors.assert_called_once_with(7, 2)
+
+    def test_default_radius(self, mock_get_item_neighbors):
+        mock_get_item_neighbors.return_value = {'rank': 1, 'total': 1, 'items': []}
+
+        self.get({})
+
+        mock_get_item_neighbors.assert_called_once_with(7, 5)
+
+    def test_invalid_radius(self, mock_get_item_neighbors):
+        response = self.get({'radius': -1})
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json(), {'error': 'radius must not be negative'})
+        mock_get_item_neighbors.assert_not_called()
+
+    def test_item_not_found(self, mock_get_item_neighbors):
+        mock_get_item_neighbors.return_value = None
+
+        response = self.get({}, item_id=999)
+
+        self.assertEqual(response.status_code, 404)
 
 @patch.object(RankingService, 'get_ranking')
 @patch.object(ItemService, 'get_item')
@@ -57,7 +270,7 @@ class TestGetRankingItem(TestCase):
         mock_item.name = 'London'
         mock_item.notes = "some notes"
         mock_item.rank = 1
-        mock_item.ranking.id = ranking_id
+        mock_item.ranking_id = ranking_id
         mock_get_item.return_value = mock_item
 
         response = self.client.get(reverse('ranking-item', kwargs={
@@ -80,7 +293,7 @@ class TestGetRankingItem(TestCase):
         mock_item.name = 'London'
         mock_item.notes = ""
         mock_item.rank = 1
-        mock_item.ranking.id = ranking_id
+        mock_item.ranking_id = ranking_id
         mock_get_item.return_value = mock_item
 
         response = self.client.get(reverse('ranking-item', kwargs={
@@ -124,6 +337,7 @@ class TestCreateRankingItem(TestCase):
 
         self.assertEqual(response.status_code, 201)
         self.assertEqual(response.json(), {
+            'id': None,
             'name': 'London',
             'notes': 'some notes',
             'rank': 1,
@@ -144,6 +358,7 @@ class TestCreateRankingItem(TestCase):
 
         self.assertEqual(response.status_code, 201)
         self.assertEqual(response.json(), {
+            'id': None,
             'name': 'Batman',
             'notes': None,
             'rank': 1,
@@ -167,6 +382,25 @@ class TestCreateRankingItem(TestCase):
 
         mock_create_item.assert_not_called()
 
+    # rank must be a number
+    def test_create_item_invalid_rank(self, mock_create_item):
+        ranking = RankingList.objects.create(title='Cities')
+
+        response = self.client.post(
+            reverse('ranking-items', kwargs={'ranking_id': ranking.id}),
+            data={
+                'name': "London",
+                'rank': "first"
+            }
+        )
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json(), {
+            'error': 'rank must be an integer'
+        })
+
+        mock_create_item.assert_not_called()
+
     # database error
     def test_create_item_db_error(self, mock_create_item):
         ranking = RankingList.objects.create(title='Error Test')
@@ -193,6 +427,105 @@ class TestCreateRankingItem(TestCase):
             rank = None
         )
 
+@patch.object(ItemService, 'create_items')
+class TestCreateRankingItems(TestCase):
+    def post(self, data, ranking_id=1):
+        return self.client.post(
+            reverse('ranking-items-bulk', kwargs={'ranking_id': ranking_id}),
+            data=data,
+            content_type='application/json'
+        )
+
+    def test_create_items_success(self, mock_create_items):
+        mock_create_items.return_value = [
+            Item(id=5, name="Lisbon", notes="", rank=1, ranking_id=1),
+            Item(id=6, name="Porto", notes="Coast", rank=3, ranking_id=1),
+        ]
+
+        response = self.post({'items': [{'name': "Lisbon", 'rank': "1"}, {'name': "Porto", 'notes': "Coast"}]})
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual([item['id'] for item in response.json()['items']], [5, 6])
+        mock_create_items.assert_called_once_with(1, [
+            {'name': "Lisbon", 'notes': None, 'rank': 1},
+            {'name': "Porto", 'notes': "Coast", 'rank': None},
+        ])
+
+    def test_create_items_empty_list(self, mock_create_items):
+        response = self.post({'items': []})
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json(), {'error': 'items must be a non-empty list'})
+        mock_create_items.assert_not_called()
+
+    def test_create_items_too_many(self, mock_create_items):
+        with patch('ranking_api.controllers.item_controller.MAX_BULK_ITEMS', 2):
+            response = self.post({'items': [{'name': "a"}, {'name': "b"}, {'name': "c"}]})
+
+        self.assertEqual(response.status_code, 400)
+        mock_create_items.assert_not_called()
+
+    def test_create_items_invalid_rank(self, mock_create_items):
+        response = self.post({'items': [{'name': "a", 'rank': "first"}]})
+
+        self.assertEqual(response.status_code, 400)
+        mock_create_items.assert_not_called()
+
+    def test_create_items_missing_name(self, mock_create_items):
+        response = self.post({'items': [{'name': "a"}, {'notes': "no name"}]})
+
+        self.assertEqual(response.status_code, 400)
+        mock_create_items.assert_not_called()
+
+    def test_create_items_blank_name(self, mock_create_items):
+        response = self.post({'items': [{'name': ""}]})
+
+        self.assertEqual(response.json(), {'error': 'Name is required'})
+
+    def test_create_items_ranking_not_found(self, mock_create_items):
+        mock_create_items.side_effect = RankingList.DoesNotExist("Ranking with id 1 does not exist.")
+
+        response = self.post({'items': [{'name': "a"}]})
+
+        self.assertEqual(response.status_code, 404)
+
+@patch.object(ItemService, 'delete_items')
+class TestDeleteRankingItems(TestCase):
+    def delete(self, data, ranking_id=1):
+        return self.client.delete(
+            reverse('ranking-items-bulk', kwargs={'ranking_id': ranking_id}),
+            data=data,
+            content_type='application/json'
+        )
+
+    def test_delete_items_success(self, mock_delete_items):
+        mock_delete_items.return_value = 2
+
+        response = self.delete({'item_ids': [3, "4"]})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), {'success': True, 'deleted': 2})
+        mock_delete_items.assert_called_once_with(1, [3, 4])
+
+    def test_delete_items_empty_list(self, mock_delete_items):
+        response = self.delete({'item_ids': []})
+
+        self.assertEqual(response.status_code, 400)
+        mock_delete_items.assert_not_called()
+
+    def test_delete_items_invalid_id(self, mock_delete_items):
+        response = self.delete({'item_ids': [1, "two"]})
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json(), {'error': 'item_ids must be integers'})
+
+    def test_delete_items_ranking_not_found(self, mock_delete_items):
+        mock_delete_items.side_effect = RankingList.DoesNotExist("Ranking with id 1 does not exist.")
+
+        response = self.delete({'item_ids': [1]})
+
+        self.assertEqual(response.status_code, 404)
+
 @patch.object(ItemService, 'delete_item')
 class TestDeleteRankingItem(TestCase):
     def test_delete_item_success(self, mock_delete_item):
@@ -242,6 +575,7 @@ class TestPatchRankingItem(TestCase):
             'name': 'Updated Name',
             'notes': 'Updated Notes',
             'rank': 2,
+            'ranking_id': ranking.id,
             'ranking': ranking.id
         }
         mock_patch_item.assert_called_once_with(item_id, name='Updated Name', notes='Updated Notes')
@@ -274,4 +608,151 @@ class TestPatchRankingItem(TestCase):
 
         assert response.status_code == 404
         assert response.json() == {'error': 'Item with id 999 not found.'}
-        mock_patch_item.assert_called_once_with(item_id, name='Something New', notes=None)
\ No newline at end of file
+        mock_patch_item.assert_called_once_with(item_id, name='Something New', notes=None)
+@patch.object(ItemService, 'update_item_rank')
+class TestUpdateItemRank(TestCase):
+    def test_update_item_rank_success(self, mock_update_item_rank):
+        mock_update_item_rank.return_value = Item(id=1, name='London', notes='', rank=3, ranking_id=2)
+
+        response = self.client.post(
+            reverse('ranking-item-rank', kwargs={'item_id': 1}),
+            data={'rank': 3},
+            content_type='application/json',
+        )
+
+        assert response.status_code == 200
+        assert response.json() == {'id': 1, 'name': 'London', 'notes': '', 'rank': 3, 'ranking_id': 2}
+        mock_update_item_rank.assert_called_once_with(1, 3)
+
+    def test_update_item_rank_invalid_rank(self, mock_update_item_rank):
+        response = self.client.post(
+            reverse('ranking-item-rank', kwargs={'item_id': 1}),
+            data={'rank': 'first'},
+            content_type='application/json',
+        )
+
+        assert response.status_code == 400
+        assert response.json() == {'error': 'rank must be an integer'}
+        mock_update_item_rank.assert_not_called()
+
+    def test_update_item_rank_not_found(self, mock_update_item_rank):
+        mock_update_item_rank.side_effect = Item.DoesNotExist("Item with id 999 does not exist.")
+
+        response = self.client.post(
+            reverse('ranking-item-rank', kwargs={'item_id': 999}),
+            data={'rank': 1},
+            content_type='application/json',
+        )
+
+        assert response.status_code == 404
+        assert response.json() == {'error': 'Item with id 999 does not exist.'}
+
+@patch.object(RankingService, 'get_ranking')
+@patch.object(ItemService, 'update_item_ranks')
+class TestUpdateItemRanks(TestCase):
+    def test_update_item_ranks_success(self, mock_update_item_ranks, mock_get_ranking):
+        mock_get_ranking.return_value = MagicMock()
+        mock_update_item_ranks.return_value = 3
+
+        response = self.client.post(
+            reverse('ranking-item-update-ranks', kwargs={'ranking_id': 1}),
+            data={'moves': [{'item_id': 4, 'rank': 1}, {'item_id': 2, 'rank': 3}]},
+            content_type='application/json',
+        )
+
+        assert response.status_code == 200
+        assert response.json() == {'success': True, 'updated': 3}
+        mock_update_item_ranks.assert_called_once_with(1, [(4, 1), (2, 3)])
+
+    def test_update_item_ranks_ranking_not_found(self, mock_update_item_ranks, mock_get_ranking):
+        mock_get_ranking.return_value = None
+
+        response = self.client.post(
+            reverse('ranking-item-update-ranks', kwargs={'ranking_id': 100}),
+            data={'moves': [{'item_id': 4, 'rank': 1}]},
+            content_type='application/json',
+        )
+
+        assert response.status_code == 404
+        mock_update_item_ranks.assert_not_called()
+
+    def test_update_item_ranks_missing_moves(self, mock_update_item_ranks, mock_get_ranking):
+        mock_get_ranking.return_value = MagicMock()
+
+        response = self.client.post(
+            reverse('ranking-item-update-ranks', kwargs={'ranking_id': 1}),
+            data={'moves': []},
+            content_type='application/json',
+        )
+
+        assert response.status_code == 400
+        assert response.json() == {'error': 'moves must be a non-empty list'}
+        mock_update_item_ranks.assert_not_called()
+
+    def test_update_item_ranks_malformed_move(self, mock_update_item_ranks, mock_get_ranking):
+        mock_get_ranking.return_value = MagicMock()
+
+        response = self.client.post(
+            reverse('ranking-item-update-ranks', kwargs={'ranking_id': 1}),
+            data={'moves': [{'item_id': 4}]},
+            content_type='application/json',
+        )
+
+        assert response.status_code == 400
+        assert response.json() == {'error': 'Each move needs an integer item_id and rank'}
+        mock_update_item_ranks.assert_not_called()
+
+    def test_update_item_ranks_unknown_item(self, mock_update_item_ranks, mock_get_ranking):
+        mock_get_ranking.return_value = MagicMock()
+        mock_update_item_ranks.side_effect = Item.DoesNotExist("Item with id 9 does not exist in ranking 1.")
+
+        response = self.client.post(
+            reverse('ranking-item-update-ranks', kwargs={'ranking_id': 1}),
+            data={'moves': [{'item_id': 9, 'rank': 1}]},
+            content_type='application/json',
+        )
+
+        assert response.status_code == 404
+        assert response.json() == {'error': 'Item with id 9 does not exist in ranking 1.'}
+
+
+class TestExportRankingItems(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.ranking = RankingList.objects.create(title='Cities', ordering_mode=RankingList.SPARSE)
+        Item.objects.create(ranking=cls.ranking, name='London', notes='Rainy', rank=2 << 20)
+        Item.objects.create(ranking=cls.ranking, name='Paris', rank=1 << 20)
+
+    def export(self, params):
+        return self.client.get(reverse('ranking-items-export', kwargs={'ranking_id': self.ranking.id}), params)
+
+    def test_export_csv(self):
+        response = self.export({})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['Content-Type'], 'text/csv')
+        self.assertEqual(response['Content-Disposition'], f'attachment; filename="ranking-{self.ranking.id}.csv"')
+        self.assertEqual(
+            b''.join(response.streaming_content).decode(),
+            'rank,name,notes\r\n1,Paris,\r\n2,London,Rainy\r\n'
+        )
+
+    def test_export_ndjson(self):
+        response = self.export({'type': 'ndjson'})
+
+        self.assertEqual(response['Content-Type'], 'application/x-ndjson')
+        self.assertEqual(
+            [json.loads(line) for line in b''.join(response.streaming_content).decode().splitlines()],
+            [{'rank': 1, 'name': 'Paris', 'notes': None}, {'rank': 2, 'name': 'London', 'notes': 'Rainy'}]
+        )
+
+    def test_unknown_type(self):
+        response = self.export({'type': 'xml'})
+
+        self.assertEqual(response.status_code, 400)
+
+    def test_missing_ranking(self):
+        response = self.client.get(reverse('ranking-items-export', kwargs={'ranking_id': 999}))
+
+        self.assertEqual(response.status_code, 404)
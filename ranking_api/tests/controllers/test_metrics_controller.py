@@ -0,0 +1,30 @@
+from django.test import TestCase
+from django.urls import reverse
+from unittest.mock import patch
+
+from ranking_api.cache import item_list_cache
+
+
+class TestGetMetrics(TestCase):
+
+    @patch('ranking_api.controllers.metrics_controller.get_pool_stats')
+    def test_get_metrics(self, mock_get_pool_stats):
+        mock_get_pool_stats.return_value = {'alias': 'default', 'pooled': True, 'checked_out': 3}
+        item_list_cache.get_or_load(1, 1, lambda: [])
+
+        response = self.client.get(reverse('metrics'))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), {
+            'database': {'alias': 'default', 'pooled': True, 'checked_out': 3},
+            'item_cache': {'hits': 0, 'misses': 1},
+        })
+
+    @patch('ranking_api.controllers.metrics_controller.get_pool_stats')
+    def test_get_metrics_error(self, mock_get_pool_stats):
+        mock_get_pool_stats.side_effect = Exception('pool closed')
+
+        response = self.client.get(reverse('metrics'))
+
+        self.assertEqual(response.status_code, 500)
+        self.assertEqual(response.json(), {'error': 'pool closed'})
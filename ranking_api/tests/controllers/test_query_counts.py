@@ -0,0 +1,248 @@
+from django.test import TestCase
+from django.urls import reverse
+
+from ranking_api.models import Item, RankingList
+from ranking_api.tests.query_budget import QueryBudgetMixin
+
+
+class TestItemEndpointQueryCounts(TestCase):
+    # Query counts must not depend on how many items a ranking holds.
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.ranking = RankingList.objects.create(title='Cities', item_count=50)
+        cls.items = Item.objects.bulk_create(
+            Item(ranking=cls.ranking, name=f'City {rank}', rank=rank) for rank in range(1, 51)
+        )
+
+    def test_get_ranking_items(self):
+        # ETag lookup, ordering mode, item rows
+        with self.assertNumQueries(3):
+            response = self.client.get(reverse('ranking-items', kwargs={'ranking_id': self.ranking.id}))
+
+        self.assertEqual(len(response.json()['items']), 50)
+
+    def test_get_ranking_items_cached(self):
+        url = reverse('ranking-items', kwargs={'ranking_id': self.ranking.id})
+        self.client.get(url)
+
+        # only the ETag lookup
+        with self.assertNumQueries(1):
+            response = self.client.get(url)
+
+        self.assertEqual(len(response.json()['items']), 50)
+
+    def test_get_ranking_items_page(self):
+        with self.assertNumQueries(4):
+            response = self.client.get(
+                reverse('ranking-items', kwargs={'ranking_id': self.ranking.id}),
+                {'limit': 20}
+            )
+
+        self.assertEqual(len(response.json()['items']), 20)
+
+    def test_get_ranking_items_top(self):
+        # ETag lookup, ordering mode, rank range
+        with self.assertNumQueries(3) as context:
+            response = self.client.get(
+                reverse('ranking-items', kwargs={'ranking_id': self.ranking.id}),
+                {'top': 10}
+            )
+
+        self.assertEqual([item['rank'] for item in response.json()['items']], list(range(1, 11)))
+        self.assertIn('LIMIT 10', context.captured_queries[-1]['sql'])
+
+    def test_get_ranking_item(self):
+        with self.assertNumQueries(1):
+            response = self.client.get(reverse('ranking-item', kwargs={'item_id': self.items[0].id}))
+
+        self.assertEqual(response.json()['ranking_id'], self.ranking.id)
+
+    def test_get_item_neighbors(self):
+        # item with its ranking, rank range
+        with self.assertNumQueries(2):
+            response = self.client.get(
+                reverse('ranking-item-neighbors', kwargs={'item_id': self.items[24].id}),
+                {'radius': 3}
+            )
+
+        self.assertEqual(response.json()['rank'], 25)
+        self.assertEqual(response.json()['total'], 50)
+        self.assertEqual([item['rank'] for item in response.json()['items']], list(range(22, 29)))
+
+    def test_create_ranking_item(self):
+        # savepoint, ranking lock, max rank, insert, rank event, events since checkpoint,
+        # version bump, release
+        with self.assertNumQueries(8):
+            response = self.client.post(
+                reverse('ranking-items', kwargs={'ranking_id': self.ranking.id}),
+                data={'name': 'Lisbon'}
+            )
+
+        self.assertEqual(response.status_code, 201)
+
+    def test_create_ranking_items(self):
+        # savepoint, ranking lock, max rank, shift, insert, rank event, events since
+        # checkpoint, version bump, release
+        with self.assertNumQueries(9):
+            response = self.client.post(
+                reverse('ranking-items-bulk', kwargs={'ranking_id': self.ranking.id}),
+                data={'items': [{'name': f'New {index}', 'rank': index % 3 + 1} for index in range(200)]},
+                content_type='application/json',
+            )
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(
+            list(Item.objects.filter(ranking=self.ranking).order_by('rank').values_list('rank', flat=True)),
+            list(range(1, 251))
+        )
+
+    def test_delete_ranking_items(self):
+        # savepoint, ranking lock, deleted items' details, delete, compaction,
+        # rank event, automatic snapshot, events since checkpoint, version bump,
+        # release
+        with self.assertNumQueries(10):
+            response = self.client.delete(
+                reverse('ranking-items-bulk', kwargs={'ranking_id': self.ranking.id}),
+                data={'item_ids': [item.id for item in self.items[::2]]},
+                content_type='application/json',
+            )
+
+        self.assertEqual(response.json()['deleted'], 25)
+        self.assertEqual(
+            list(Item.objects.filter(ranking=self.ranking).order_by('rank').values_list('name', 'rank')),
+            [(f'City {rank}', rank // 2) for rank in range(2, 51, 2)]
+        )
+
+    def test_patch_ranking_item(self):
+        with self.assertNumQueries(3):
+            response = self.client.patch(
+                reverse('ranking-item', kwargs={'item_id': self.items[0].id}),
+                data={'notes': 'Windy'},
+                content_type='application/json',
+            )
+
+        self.assertEqual(response.json()['ranking_id'], self.ranking.id)
+
+
+class TestEndpointQueryBudgets(QueryBudgetMixin, TestCase):
+    # Upper bounds per endpoint, as seen by QueryCountMiddleware. The rankings
+    # hold enough items that a per-item query would blow every budget.
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.rankings = RankingList.objects.bulk_create(
+            RankingList(title=f'Ranking {index}', item_count=30) for index in range(3)
+        )
+        cls.items = Item.objects.bulk_create(
+            Item(ranking=ranking, name=f'Item {rank}', rank=rank)
+            for ranking in cls.rankings for rank in range(1, 31)
+        )
+        cls.ranking = cls.rankings[0]
+
+    def test_get_all_rankings(self):
+        response = self.client.get(reverse('rankings-list'))
+
+        self.assertEqual(len(response.json()['rankings']), 3)
+        self.assertQueryBudget(response, 1)
+
+    def test_get_rankings_page(self):
+        response = self.client.get(reverse('rankings-list'), {'limit': 2})
+
+        self.assertQueryBudget(response, 1)
+
+    def test_get_ranking(self):
+        response = self.client.get(reverse('ranking-detail', kwargs={'ranking_id': self.ranking.id}))
+
+        self.assertQueryBudget(response, 2)
+
+    def test_create_ranking(self):
+        response = self.client.post(reverse('rankings-list'), {'title': 'New'})
+
+        self.assertEqual(response.status_code, 201)
+        self.assertQueryBudget(response, 1)
+
+    def test_update_ranking(self):
+        response = self.client.put(
+            reverse('ranking-detail', kwargs={'ranking_id': self.ranking.id}),
+            data={'title': 'Renamed'},
+            content_type='application/json',
+        )
+
+        self.assertQueryBudget(response, 3)
+
+    def test_delete_ranking(self):
+        response = self.client.delete(reverse('ranking-detail', kwargs={'ranking_id': self.ranking.id}))
+
+        self.assertQueryBudget(response, 6)
+
+    def test_get_ranking_items(self):
+        response = self.client.get(reverse('ranking-items', kwargs={'ranking_id': self.ranking.id}))
+
+        self.assertEqual(len(response.json()['items']), 30)
+        self.assertQueryBudget(response, 3)
+
+    def test_search_items(self):
+        response = self.client.get(reverse('items-search'), {'q': 'Item'})
+
+        self.assertQueryBudget(response, 3)
+
+    def test_update_item_rank(self):
+        response = self.client.post(
+            reverse('ranking-item-rank', kwargs={'item_id': self.items[0].id}),
+            data={'rank': 30},
+            content_type='application/json',
+        )
+
+        self.assertEqual(response.json()['rank'], 30)
+        self.assertQueryBudget(response, 10)
+
+    def test_update_item_ranks(self):
+        response = self.client.post(
+            reverse('ranking-item-update-ranks', kwargs={'ranking_id': self.ranking.id}),
+            data={'moves': [{'item_id': item.id, 'rank': 31 - item.rank} for item in self.items[:30]]},
+            content_type='application/json',
+        )
+
+        self.assertEqual(response.json()['updated'], 30)
+        self.assertQueryBudget(response, 10)
+
+    def test_delete_ranking_item(self):
+        response = self.client.delete(reverse('ranking-item', kwargs={'item_id': self.items[0].id}))
+
+        self.assertQueryBudget(response, 12)
+
+    def test_consensus(self):
+        response = self.client.post(
+            reverse('rankings-consensus'),
+            data={'ranking_ids': [ranking.id for ranking in self.rankings]},
+            content_type='application/json',
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertQueryBudget(response, 2)
+
+    def test_similarity_matrix(self):
+        response = self.client.post(
+            reverse('rankings-similarity-matrix'),
+            data={'ranking_ids': [ranking.id for ranking in self.rankings]},
+            content_type='application/json',
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertQueryBudget(response, 2)
+
+    def test_ranking_history(self):
+        response = self.client.get(reverse('ranking-history', kwargs={'ranking_id': self.ranking.id}))
+
+        self.assertQueryBudget(response, 4)
+
+    def test_create_snapshot(self):
+        response = self.client.post(
+            reverse('ranking-snapshots', kwargs={'ranking_id': self.ranking.id}),
+            data={'name': 'Before'},
+            content_type='application/json',
+        )
+
+        self.assertEqual(response.status_code, 201)
+        self.assertQueryBudget(response, 6)
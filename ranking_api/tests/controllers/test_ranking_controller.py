@@ -5,9 +5,9 @@ from ranking_api.services.ranking_service import RankingService
 from ranking_api.models import RankingList
 
 
-@patch.object(RankingService, 'get_all_rankings')
+@patch.object(RankingService, 'get_rankings_page')
 class TestGetAllRankingsEndpoint(TestCase):
-    def test_get_all_rankings_success(self, mock_get_all_rankings):
+    def test_get_all_rankings_success(self, mock_get_rankings_page):
         mock_ranking1 = MagicMock()
         mock_ranking1.id = 1
         mock_ranking1.title = "Best Movies"
@@ -18,7 +18,7 @@ class TestGetAllRankingsEndpoint(TestCase):
         mock_ranking2.title = "Best Books"
         mock_ranking2.description = ""
 
-        mock_get_all_rankings.return_value = [mock_ranking1, mock_ranking2]
+        mock_get_rankings_page.return_value = ([mock_ranking1, mock_ranking2], None)
 
         response = self.client.get(reverse('rankings-list'))
 
@@ -35,27 +35,63 @@ class TestGetAllRankingsEndpoint(TestCase):
                     'title': 'Best Books',
                     'description': ""
                 }
-            ]
+            ],
+            'next_cursor': None
         })
-        mock_get_all_rankings.assert_called_once()
+        # No parameters still means one bounded page.
+        mock_get_rankings_page.assert_called_once_with(100, cursor=None, title_prefix=None)
 
-    def test_get_all_rankings_empty(self, mock_get_all_rankings):
-        mock_get_all_rankings.return_value = []
+    def test_get_all_rankings_empty(self, mock_get_rankings_page):
+        mock_get_rankings_page.return_value = ([], None)
 
         response = self.client.get(reverse('rankings-list'))
 
         self.assertEqual(response.status_code, 200)
-        self.assertEqual(response.json(), {'rankings': []})
-        mock_get_all_rankings.assert_called_once()
+        self.assertEqual(response.json(), {'rankings': [], 'next_cursor': None})
+        mock_get_rankings_page.assert_called_once()
 
-    def test_get_all_rankings_error(self, mock_get_all_rankings):
-        mock_get_all_rankings.side_effect = Exception("Database error")
+    def test_get_all_rankings_error(self, mock_get_rankings_page):
+        mock_get_rankings_page.side_effect = Exception("Database error")
 
         response = self.client.get(reverse('rankings-list'))
 
         self.assertEqual(response.status_code, 500)
         self.assertEqual(response.json(), {'error': 'Database error'})
-        mock_get_all_rankings.assert_called_once()
+        mock_get_rankings_page.assert_called_once()
+
+
+@patch.object(RankingService, 'get_rankings_page')
+class TestGetRankingsPageEndpoint(TestCase):
+    def test_get_rankings_page(self, mock_get_rankings_page):
+        mock_get_rankings_page.return_value = (
+            [RankingList(id=1, title="Best Movies", description="")],
+            'next-page'
+        )
+
+        response = self.client.get(reverse('rankings-list'), {'limit': 1, 'title': 'Best'})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), {
+            'rankings': [{'id': 1, 'title': 'Best Movies', 'description': ''}],
+            'next_cursor': 'next-page'
+        })
+        mock_get_rankings_page.assert_called_once_with(1, cursor=None, title_prefix='Best')
+
+    def test_get_rankings_page_defaults(self, mock_get_rankings_page):
+        mock_get_rankings_page.return_value = ([], None)
+
+        response = self.client.get(reverse('rankings-list'), {'cursor': 'abc'})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), {'rankings': [], 'next_cursor': None})
+        mock_get_rankings_page.assert_called_once_with(100, cursor='abc', title_prefix=None)
+
+    def test_get_rankings_page_invalid_limit(self, mock_get_rankings_page):
+        response = self.client.get(reverse('rankings-list'), {'limit': '0'})
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json(), {'error': 'limit must be at least 1'})
+        mock_get_rankings_page.assert_not_called()
 
 
 @patch.object(RankingService, 'get_ranking')
@@ -117,7 +153,8 @@ class TestCreateRankingEndpoint(TestCase):
         })
         mock_create_ranking.assert_called_once_with(
             title='Best Books',
-            description='Must-read books'
+            description='Must-read books',
+            ordering_mode=None
         )
 
     def test_create_ranking_missing_description(self, mock_create_ranking):
@@ -135,7 +172,8 @@ class TestCreateRankingEndpoint(TestCase):
         })
         mock_create_ranking.assert_called_once_with(
             title='Best Books',
-            description=None
+            description=None,
+            ordering_mode=None
         )
 
     def test_create_ranking_missing_title(self, mock_create_ranking):
@@ -149,6 +187,33 @@ class TestCreateRankingEndpoint(TestCase):
         })
         mock_create_ranking.assert_not_called()
 
+    def test_create_sparse_ranking(self, mock_create_ranking):
+        mock_create_ranking.return_value = RankingList(title="Best Books", ordering_mode=RankingList.SPARSE)
+
+        response = self.client.post(reverse('rankings-list'), {
+            'title': 'Best Books',
+            'ordering_mode': 'sparse'
+        })
+
+        self.assertEqual(response.status_code, 201)
+        mock_create_ranking.assert_called_once_with(
+            title='Best Books',
+            description=None,
+            ordering_mode='sparse'
+        )
+
+    def test_create_ranking_invalid_ordering_mode(self, mock_create_ranking):
+        response = self.client.post(reverse('rankings-list'), {
+            'title': 'Best Books',
+            'ordering_mode': 'random'
+        })
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json(), {
+            'error': 'ordering_mode must be dense or sparse'
+        })
+        mock_create_ranking.assert_not_called()
+
     def test_create_ranking_error(self, mock_create_ranking):
         mock_create_ranking.side_effect = Exception('Database error')
 
@@ -163,7 +228,8 @@ class TestCreateRankingEndpoint(TestCase):
         })
         mock_create_ranking.assert_called_once_with(
             title='Best Books',
-            description='Must-read books'
+            description='Must-read books',
+            ordering_mode=None
         )
 
 @patch.object(RankingService, 'delete_ranking')
@@ -0,0 +1,93 @@
+from django.test import TestCase
+from django.urls import reverse
+from unittest.mock import patch
+
+from ranking_api.controllers.similarity_controller import MAX_SIMILARITY_RANKINGS
+from ranking_api.models import Item, RankingList
+from ranking_api.services import SimilarityService
+
+
+@patch.object(SimilarityService, 'compare_rankings')
+class TestCompareRankings(TestCase):
+    def get(self, params, ranking_id=1, other_ranking_id=2):
+        return self.client.get(
+            reverse('rankings-similarity', kwargs={'ranking_id': ranking_id, 'other_ranking_id': other_ranking_id}),
+            params
+        )
+
+    def test_compare(self, mock_compare_rankings):
+        mock_compare_rankings.return_value = {'kendall_tau': 0.5}
+
+        response = self.get({'key': 'notes', 'p': '0.8'})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), {'kendall_tau': 0.5})
+        mock_compare_rankings.assert_called_once_with(1, 2, key_field='notes', p=0.8)
+
+    def test_defaults(self, mock_compare_rankings):
+        mock_compare_rankings.return_value = {}
+
+        self.get({})
+
+        mock_compare_rankings.assert_called_once_with(1, 2, key_field='name', p=0.9)
+
+    def test_invalid_p(self, mock_compare_rankings):
+        response = self.get({'p': 'high'})
+
+        self.assertEqual(response.status_code, 400)
+        mock_compare_rankings.assert_not_called()
+
+    def test_missing_ranking(self, mock_compare_rankings):
+        mock_compare_rankings.side_effect = RankingList.DoesNotExist('Rankings with ids [2] do not exist.')
+
+        response = self.get({})
+
+        self.assertEqual(response.status_code, 404)
+
+
+@patch.object(SimilarityService, 'get_similarity_matrix')
+class TestGetSimilarityMatrix(TestCase):
+    def post(self, data):
+        return self.client.post(reverse('rankings-similarity-matrix'), data=data, content_type='application/json')
+
+    def test_matrix(self, mock_get_similarity_matrix):
+        mock_get_similarity_matrix.return_value = {'matrix': [[1.0]]}
+
+        response = self.post({'ranking_ids': [1, "2"], 'metric': 'kendall'})
+
+        self.assertEqual(response.status_code, 200)
+        mock_get_similarity_matrix.assert_called_once_with([1, 2], metric='kendall', key_field='name')
+
+    def test_invalid_ranking_ids(self, mock_get_similarity_matrix):
+        for ranking_ids in (None, [], [{}], list(range(MAX_SIMILARITY_RANKINGS + 1))):
+            response = self.post({'ranking_ids': ranking_ids})
+
+            self.assertEqual(response.status_code, 400)
+        mock_get_similarity_matrix.assert_not_called()
+
+    def test_invalid_metric(self, mock_get_similarity_matrix):
+        mock_get_similarity_matrix.side_effect = ValueError('metric must be one of spearman, kendall')
+
+        response = self.post({'ranking_ids': [1], 'metric': 'rbo'})
+
+        self.assertEqual(response.status_code, 400)
+
+
+class TestSimilarityEndToEnd(TestCase):
+    def test_compare_stored_rankings(self):
+        rankings = []
+        for order in (["Paris", "London", "Rome"], ["London", "Paris", "Rome"]):
+            ranking = RankingList.objects.create(title="Cities")
+            Item.objects.bulk_create(
+                Item(ranking=ranking, name=name, rank=rank) for rank, name in enumerate(order, start=1)
+            )
+            rankings.append(ranking.id)
+
+        # ranking lookup, item keys
+        with self.assertNumQueries(2):
+            response = self.client.get(
+                reverse('rankings-similarity', kwargs={'ranking_id': rankings[0], 'other_ranking_id': rankings[1]})
+            )
+
+        self.assertEqual(response.json()['shared_items'], 3)
+        self.assertAlmostEqual(response.json()['kendall_tau'], 1 / 3)
@@ -0,0 +1,150 @@
+from django.test import TestCase
+from django.urls import reverse
+from unittest.mock import patch
+
+from ranking_api.models import Item, RankCheckpoint, RankEvent, RankingList, RankSnapshot
+from ranking_api.services import ItemService, SnapshotService
+
+
+class TestSnapshotEndpoints(TestCase):
+    @patch.object(SnapshotService, 'get_snapshots')
+    def test_get_snapshots(self, mock_get_snapshots):
+        mock_get_snapshots.return_value = [{'id': 3, 'name': None, 'automatic': True}]
+
+        response = self.client.get(reverse('ranking-snapshots', kwargs={'ranking_id': 1}), {'limit': 5})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), {'snapshots': [{'id': 3, 'name': None, 'automatic': True}]})
+        mock_get_snapshots.assert_called_once_with(1, 5)
+
+    @patch.object(SnapshotService, 'get_snapshots')
+    def test_get_snapshots_missing_ranking(self, mock_get_snapshots):
+        mock_get_snapshots.side_effect = RankingList.DoesNotExist("Ranking with id 1 does not exist.")
+
+        response = self.client.get(reverse('ranking-snapshots', kwargs={'ranking_id': 1}))
+
+        self.assertEqual(response.status_code, 404)
+
+    @patch.object(SnapshotService, 'create_snapshot')
+    def test_create_snapshot_without_name(self, mock_create_snapshot):
+        mock_create_snapshot.side_effect = ValueError('name is required')
+
+        response = self.client.post(reverse('ranking-snapshots', kwargs={'ranking_id': 1}), {})
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json(), {'error': 'name is required'})
+
+    @patch.object(ItemService, 'restore_snapshot')
+    def test_restore_without_deleted_item_details(self, mock_restore_snapshot):
+        mock_restore_snapshot.side_effect = ValueError(
+            "Snapshot 2 can't be restored: no details were kept for deleted items [7]."
+        )
+
+        response = self.client.post(
+            reverse('ranking-snapshot-restore', kwargs={'ranking_id': 1, 'snapshot_id': 2})
+        )
+
+        self.assertEqual(response.status_code, 409)
+
+    @patch.object(ItemService, 'restore_snapshot')
+    def test_restore_missing_snapshot(self, mock_restore_snapshot):
+        mock_restore_snapshot.side_effect = RankSnapshot.DoesNotExist("Snapshot with id 2 does not exist in ranking 1.")
+
+        response = self.client.post(
+            reverse('ranking-snapshot-restore', kwargs={'ranking_id': 1, 'snapshot_id': 2})
+        )
+
+        self.assertEqual(response.status_code, 404)
+
+
+class TestSnapshotsEndToEnd(TestCase):
+    def setUp(self):
+        self.ranking = RankingList.objects.create(title='Cities', item_count=200)
+        self.items = Item.objects.bulk_create(
+            Item(ranking=self.ranking, name=f'City {rank}', rank=rank) for rank in range(1, 201)
+        )
+        # The items weren't added through the service, so the rank log starts
+        # from a baseline checkpoint, as migration 0012 gave existing rankings.
+        RankCheckpoint.objects.create(ranking=self.ranking, last_event_id=0, item_ids=[item.id for item in self.items])
+
+    def order(self):
+        return list(Item.objects.filter(ranking=self.ranking).order_by('rank').values_list('id', 'rank'))
+
+    def move(self, item, rank):
+        self.client.post(reverse('ranking-item-rank', kwargs={'item_id': item.id}), data={'rank': rank})
+
+    def restore(self, snapshot_id):
+        return self.client.post(
+            reverse('ranking-snapshot-restore', kwargs={'ranking_id': self.ranking.id, 'snapshot_id': snapshot_id})
+        )
+
+    def test_restore_named_snapshot_after_moves_and_deletes(self):
+        original = self.order()
+        response = self.client.post(reverse('ranking-snapshots', kwargs={'ranking_id': self.ranking.id}), {'name': 'start'})
+        self.assertEqual(response.status_code, 201)
+        named_id = response.json()['id']
+
+        self.move(self.items[150], 1)
+        self.move(self.items[3], 120)
+        self.client.delete(reverse('ranking-item', kwargs={'item_id': self.items[10].id}))
+        self.client.post(reverse('ranking-items', kwargs={'ranking_id': self.ranking.id}), data={'name': 'Lisbon'})
+
+        response = self.restore(named_id)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['restored'], 1)
+        self.assertEqual(response.json()['deleted'], 1)
+        self.assertEqual(self.order(), original)
+        self.assertEqual(Item.objects.get(id=self.items[10].id).name, 'City 11')
+        self.assertEqual(RankingList.objects.get(id=self.ranking.id).item_count, 200)
+
+    def test_snapshots_point_into_the_rank_log(self):
+        for index in range(5):
+            self.move(self.items[index * 30], 200)
+
+        event_ids = list(RankEvent.objects.filter(ranking=self.ranking).order_by('id').values_list('id', flat=True))
+        # Each automatic snapshot is the log just before its move, not a copy of the order.
+        self.assertEqual(
+            list(RankSnapshot.objects.filter(ranking=self.ranking).order_by('id').values_list('last_event_id', flat=True)),
+            [event_id - 1 for event_id in event_ids]
+        )
+
+    @patch('ranking_api.services.snapshot_service.AUTOMATIC_SNAPSHOT_LIMIT', 3)
+    @patch('ranking_api.services.item_service.CHECKPOINT_INTERVAL', 5)
+    def test_automatic_snapshots_are_pruned_at_checkpoints(self):
+        self.client.post(reverse('ranking-snapshots', kwargs={'ranking_id': self.ranking.id}), {'name': 'start'})
+        for index in range(5):
+            self.move(self.items[index], 200)
+
+        snapshots = self.client.get(reverse('ranking-snapshots', kwargs={'ranking_id': self.ranking.id})).json()['snapshots']
+        self.assertEqual([snapshot['automatic'] for snapshot in snapshots], [True, True, True, False])
+
+    @patch('ranking_api.services.item_service.CHECKPOINT_INTERVAL', 4)
+    def test_checkpoint_lands_after_the_whole_restore(self):
+        response = self.client.post(reverse('ranking-snapshots', kwargs={'ranking_id': self.ranking.id}), {'name': 'start'})
+        for index in range(3):
+            self.move(self.items[index], 200)
+
+        # The restore logs the 4th and 5th events; the 4th reaches the interval.
+        self.restore(response.json()['id'])
+
+        history = self.client.get(reverse('ranking-history', kwargs={'ranking_id': self.ranking.id})).json()
+        self.assertEqual([item['id'] for item in history['items']], [item_id for item_id, _ in self.order()])
+        self.assertEqual(
+            RankCheckpoint.objects.filter(ranking=self.ranking).latest('last_event_id').last_event_id,
+            RankEvent.objects.filter(ranking=self.ranking).latest('id').id
+        )
+
+    def test_undo_by_restoring_automatic_snapshots(self):
+        orders = []
+        for index in range(4):
+            orders.append(self.order())
+            self.move(self.items[index], 200 - index)
+
+        snapshots = self.client.get(reverse('ranking-snapshots', kwargs={'ranking_id': self.ranking.id})).json()['snapshots']
+        self.assertTrue(all(snapshot['automatic'] for snapshot in snapshots))
+
+        # Newest first: each automatic snapshot is the order before one move.
+        for snapshot, order in zip(snapshots, orders[::-1]):
+            self.restore(snapshot['id'])
+            self.assertEqual(self.order(), order)
@@ -0,0 +1,13 @@
+class QueryBudgetMixin:
+    # For TestCases: checks a response against an endpoint's query budget
+    # using the X-DB-Queries header QueryCountMiddleware sets, i.e. the same
+    # count production requests report.
+
+    def assertQueryBudget(self, response, budget: int):
+        self.assertIn('X-DB-Queries', response, 'QueryCountMiddleware is not installed')
+        queries = int(response['X-DB-Queries'])
+        self.assertLessEqual(
+            queries, budget,
+            f"{response.request['REQUEST_METHOD']} {response.request['PATH_INFO']} ran {queries} queries; "
+            f"its budget is {budget}"
+        )
@@ -1,4 +1,6 @@
 import pytest
+from django.db.models import F
+from asgiref.sync import async_to_sync
 from ranking_api.models import Item, RankingList
 from ranking_api.repositories.item_repository import ItemRepository
 
@@ -31,6 +33,154 @@ class TestItemRepository:
             assert retrieved_items[2].name == "Rome"
             assert retrieved_items[3].name == "Berlin"
 
+    class TestGetItemRows:
+        def test_rows_in_rank_order(self, repository, travel_ranking, travel_items):
+            rows = repository.get_all_item_rows(travel_ranking.id)
+
+            assert [row['name'] for row in rows] == ["London", "Paris", "Rome", "Berlin"]
+            assert rows[0] == {
+                'id': travel_items[0].id,
+                'name': "London",
+                'notes': "The capital of England",
+                'rank': 1,
+                'ranking_id': travel_ranking.id,
+            }
+
+        def test_iter_rows_in_rank_order(self, repository, travel_ranking, travel_items):
+            rows = repository.iter_item_rows(travel_ranking.id, chunk_size=2)
+
+            assert [row['name'] for row in rows] == ["London", "Paris", "Rome", "Berlin"]
+
+    class TestGetItemRowsPage:
+        def test_first_page(self, repository, travel_ranking, travel_items):
+            page = repository.get_item_rows_page(travel_ranking.id, 2)
+
+            assert [row['name'] for row in page] == ["London", "Paris"]
+
+        def test_page_after_cursor(self, repository, travel_ranking, travel_items):
+            paris = travel_items[1]
+
+            page = repository.get_item_rows_page(travel_ranking.id, 2, after=(paris.rank, paris.id))
+
+            assert [row['name'] for row in page] == ["Rome", "Berlin"]
+
+        def test_page_stays_within_ranking(self, repository, travel_ranking, travel_items):
+            other_ranking = RankingList.objects.create(title="Other")
+            Item.objects.create(ranking=other_ranking, name="Chicago", rank=5)
+            rome = travel_items[3]
+
+            page = repository.get_item_rows_page(travel_ranking.id, 5, after=(rome.rank, rome.id))
+
+            assert [row['name'] for row in page] == ["Berlin"]
+
+    class TestGetItemRowsInRankRange:
+        def test_range(self, repository, travel_ranking, travel_items):
+            rows = repository.get_item_rows_in_rank_range(travel_ranking.id, 2, 3)
+
+            assert [(row['name'], row['rank']) for row in rows] == [("Paris", 2), ("Rome", 3)]
+
+        def test_range_past_the_end(self, repository, travel_ranking, travel_items):
+            rows = repository.get_item_rows_in_rank_range(travel_ranking.id, 4, 10)
+
+            assert [row['name'] for row in rows] == ["Berlin"]
+
+        def test_positions(self, repository, travel_ranking, travel_items):
+            Item.objects.filter(ranking=travel_ranking).update(rank=F('rank') * 100)
+
+            rows = repository.get_item_rows_at_positions(travel_ranking.id, 1, 2)
+
+            assert [(row['name'], row['rank']) for row in rows] == [("Paris", 200), ("Rome", 300)]
+
+    class TestGetItemRowsAround:
+        def test_window(self, repository, travel_ranking, travel_items):
+            Item.objects.filter(ranking=travel_ranking).update(rank=F('rank') * 100)
+
+            before, after = repository.get_item_rows_around(travel_ranking.id, 300, 1)
+
+            assert [(row['name'], row['rank']) for row in before] == [("Paris", 200)]
+            assert [(row['name'], row['rank']) for row in after] == [("Rome", 300), ("Berlin", 400)]
+
+        def test_window_at_the_top(self, repository, travel_ranking, travel_items):
+            before, after = repository.get_item_rows_around(travel_ranking.id, 1, 2)
+
+            assert before == []
+            assert [row['name'] for row in after] == ["London", "Paris", "Rome"]
+
+    class TestSearchItemRows:
+        def test_matches_name_and_notes(self, repository, travel_ranking, travel_items):
+            rows = repository.search_item_rows("capital france", 10)
+
+            assert [row['name'] for row in rows] == ["Paris"]
+            assert rows[0]['score'] > 0
+
+        def test_name_matches_rank_first(self, repository, travel_ranking, travel_items):
+            Item.objects.create(ranking=travel_ranking, name="Oxford", notes="An hour from London", rank=5)
+
+            rows = repository.search_item_rows("london", 10)
+
+            assert [row['name'] for row in rows] == ["London", "Oxford"]
+
+        def test_scoped_to_ranking(self, repository, travel_ranking, travel_items):
+            other_ranking = RankingList.objects.create(title="Other")
+            Item.objects.create(ranking=other_ranking, name="Rome", notes="The capital of Italy", rank=1)
+
+            rows = repository.search_item_rows("rome", 10, ranking_id=travel_ranking.id)
+
+            assert [row['id'] for row in rows] == [travel_items[3].id]
+
+        def test_keyset_pages(self, repository, travel_ranking, travel_items):
+            first_page = repository.search_item_rows("capital", 2)
+            last = first_page[-1]
+            second_page = repository.search_item_rows("capital", 2, after=(last['score'], last['id']))
+
+            assert len(first_page) == len(second_page) == 2
+            assert {row['id'] for row in first_page + second_page} == {item.id for item in travel_items}
+
+        def test_no_match(self, repository, travel_ranking, travel_items):
+            assert repository.search_item_rows("tokyo", 10) == []
+
+    class TestGetRankedKeys:
+        def test_names_in_rank_order(self, repository, travel_ranking, travel_items):
+            other_ranking = RankingList.objects.create(title="Other")
+            Item.objects.create(ranking=other_ranking, name="Chicago", rank=1)
+
+            rows = repository.get_ranked_keys([other_ranking.id, travel_ranking.id])
+
+            assert rows == {
+                travel_ranking.id: ["London", "Paris", "Rome", "Berlin"],
+                other_ranking.id: ["Chicago"],
+            }
+
+        def test_other_key_field_skips_blank_keys(self, repository, travel_ranking, travel_items):
+            Item.objects.filter(id=travel_items[1].id).update(notes=None)
+            Item.objects.filter(id=travel_items[3].id).update(notes="")
+
+            rows = repository.get_ranked_keys([travel_ranking.id], key_field='notes')
+
+            assert rows == {travel_ranking.id: ["The capital of England", "The capital of Germany"]}
+
+    class TestTouchRanking:
+        def test_bumps_version_and_item_count(self, repository, travel_ranking):
+            repository.touch_ranking(travel_ranking.id, item_delta=3)
+            repository.touch_ranking(travel_ranking.id, item_delta=-1)
+
+            travel_ranking.refresh_from_db()
+            assert travel_ranking.version == 3
+            assert travel_ranking.item_count == 2
+
+        def test_leaves_item_count_alone_without_delta(self, repository, travel_ranking):
+            repository.touch_ranking(travel_ranking.id)
+
+            travel_ranking.refresh_from_db()
+            assert travel_ranking.version == 2
+            assert travel_ranking.item_count == 0
+
+        def test_get_item_count(self, repository, travel_ranking):
+            repository.touch_ranking(travel_ranking.id, item_delta=2)
+
+            assert repository.get_item_count(travel_ranking.id) == 2
+            assert repository.get_item_count(travel_ranking.id + 1000) is None
+
     class TestCreateItem:
         def test_create_item_success(self, repository, cities_ranking, cities_item):
             item_name = "Ann Arbor"
@@ -67,6 +217,144 @@ class TestItemRepository:
             assert created_item2.name == item2_name
             assert created_item2.rank == 3
 
+    class TestSparseRanks:
+        def test_get_ordering_mode(self, repository, travel_ranking):
+            assert repository.get_ordering_mode(travel_ranking.id) == RankingList.DENSE
+            assert repository.get_ordering_mode(999) is None
+
+        def test_count_items_before(self, repository, travel_ranking, travel_items):
+            assert repository.count_items_before(travel_ranking.id, 1) == 0
+            assert repository.count_items_before(travel_ranking.id, 3) == 2
+
+        def test_get_item_positions(self, repository, travel_ranking, travel_items):
+            london, paris, berlin, rome = travel_items
+            Item.objects.filter(ranking=travel_ranking).update(rank=F('rank') * 10)
+            other = Item.objects.create(ranking=RankingList.objects.create(title="Other"), name="Oslo", rank=35)
+
+            positions = repository.get_item_positions([london.id, berlin.id, rome.id, other.id])
+
+            assert positions == {london.id: 1, rome.id: 3, berlin.id: 4, other.id: 1}
+
+        def test_neighbor_ranks_at_top(self, repository, travel_ranking, travel_items):
+            assert repository.get_neighbor_ranks(travel_ranking.id, 1) == (None, 1)
+
+        def test_neighbor_ranks_in_middle(self, repository, travel_ranking, travel_items):
+            assert repository.get_neighbor_ranks(travel_ranking.id, 3) == (2, 3)
+
+        def test_neighbor_ranks_append(self, repository, travel_ranking, travel_items):
+            assert repository.get_neighbor_ranks(travel_ranking.id) == (4, None)
+            assert repository.get_neighbor_ranks(travel_ranking.id, 50) == (4, None)
+
+        def test_neighbor_ranks_excludes_item(self, repository, travel_ranking, travel_items):
+            paris = travel_items[1]
+
+            assert repository.get_neighbor_ranks(travel_ranking.id, 2, exclude_item_id=paris.id) == (1, 3)
+
+        def test_neighbor_ranks_empty_ranking(self, repository, travel_ranking):
+            assert repository.get_neighbor_ranks(travel_ranking.id, 1) == (None, None)
+            assert repository.get_neighbor_ranks(travel_ranking.id) == (None, None)
+
+        def test_touch_ranking(self, repository, travel_ranking):
+            repository.touch_ranking(travel_ranking.id)
+
+            refreshed = RankingList.objects.get(id=travel_ranking.id)
+            assert refreshed.version == 2
+            assert refreshed.updated_at > travel_ranking.updated_at
+
+        def test_set_rank(self, repository, cities_item):
+            repository.set_rank(cities_item.id, 512)
+
+            assert Item.objects.get(id=cities_item.id).rank == 512
+
+        def test_respace_ranks(self, repository, travel_ranking, travel_items):
+            repository.respace_ranks(travel_ranking.id, 10)
+
+            assert list(
+                Item.objects.filter(ranking=travel_ranking).order_by('rank').values_list('name', 'rank')
+            ) == [("London", 10), ("Paris", 20), ("Rome", 30), ("Berlin", 40)]
+
+    class TestBulkCreateItems:
+        def test_bulk_create_items(self, repository, travel_ranking):
+            created = repository.bulk_create_items(travel_ranking.id, [
+                {'name': "Lisbon", 'notes': "Hilly", 'rank': 1},
+                {'name': "Madrid", 'notes': None, 'rank': 2},
+            ], batch_size=1)
+
+            assert all(item.id is not None for item in created)
+            assert list(Item.objects.filter(ranking=travel_ranking).order_by('rank').values_list('name', 'notes')) == [
+                ("Lisbon", "Hilly"),
+                ("Madrid", ""),
+            ]
+
+    class TestShiftRanksForBulkInsert:
+        def test_each_range_moves_by_its_offset(self, repository, travel_ranking, travel_items):
+            updated = repository.shift_ranks_for_bulk_insert(travel_ranking.id, [(2, 1), (4, 3)])
+
+            assert updated == 3
+            assert list(Item.objects.filter(ranking=travel_ranking).order_by('rank').values_list('name', 'rank')) == [
+                ("London", 1),
+                ("Paris", 3),
+                ("Rome", 4),
+                ("Berlin", 7),
+            ]
+
+        def test_no_shifts(self, repository, travel_ranking, travel_items):
+            assert repository.shift_ranks_for_bulk_insert(travel_ranking.id, []) == 0
+
+    class TestMoveItem:
+        def ranked_names(self, ranking):
+            return list(Item.objects.filter(ranking=ranking).order_by('rank').values_list('name', 'rank'))
+
+        def test_move_up(self, repository, travel_ranking, travel_items):
+            berlin = travel_items[2]
+
+            repository.move_item(travel_ranking.id, berlin.id, 4, 2)
+
+            assert self.ranked_names(travel_ranking) == [("London", 1), ("Berlin", 2), ("Paris", 3), ("Rome", 4)]
+
+        def test_move_down(self, repository, travel_ranking, travel_items):
+            london = travel_items[0]
+
+            repository.move_item(travel_ranking.id, london.id, 1, 3)
+
+            assert self.ranked_names(travel_ranking) == [("Paris", 1), ("Rome", 2), ("London", 3), ("Berlin", 4)]
+
+        def test_get_max_rank(self, repository, travel_ranking, travel_items):
+            assert repository.get_max_rank(travel_ranking.id) == 4
+
+        def test_get_max_rank_empty_ranking(self, repository, travel_ranking):
+            assert repository.get_max_rank(travel_ranking.id) is None
+
+    class TestApplyRanks:
+        def test_get_ranked_item_ids(self, repository, travel_ranking, travel_items):
+            london, paris, berlin, rome = travel_items
+
+            assert repository.get_ranked_item_ids(travel_ranking.id) == [
+                (london.id, 1), (paris.id, 2), (rome.id, 3), (berlin.id, 4)
+            ]
+
+        def test_apply_ranks(self, repository, travel_ranking, travel_items):
+            london, paris, berlin, rome = travel_items
+
+            updated = repository.apply_ranks(travel_ranking.id, {berlin.id: 1, london.id: 2, paris.id: 3, rome.id: 4})
+
+            assert updated == 4
+            assert [item.name for item in repository.get_all_items(travel_ranking.id)] == [
+                "Berlin", "London", "Paris", "Rome"
+            ]
+
+        def test_apply_ranks_ignores_other_rankings(self, repository, travel_ranking, travel_items):
+            other_ranking = RankingList.objects.create(title="Other")
+            other_item = Item.objects.create(ranking=other_ranking, name="Chicago", rank=1)
+
+            updated = repository.apply_ranks(travel_ranking.id, {other_item.id: 5})
+
+            assert updated == 0
+            assert Item.objects.get(id=other_item.id).rank == 1
+
+        def test_apply_no_ranks(self, repository, travel_ranking):
+            assert repository.apply_ranks(travel_ranking.id, {}) == 0
+
     class TestDeleteItem:
         def test_delete_item_success(self, repository, cities_ranking, cities_item):
             response = repository.delete_item(cities_item.id)
@@ -81,6 +369,72 @@ class TestItemRepository:
 
             assert response is False
 
+    class TestDeleteItems:
+        def test_deletes_only_from_ranking(self, repository, travel_ranking, travel_items):
+            other_ranking = RankingList.objects.create(title="Other")
+            other_item = Item.objects.create(ranking=other_ranking, name="Chicago", rank=1)
+
+            deleted = repository.delete_items(travel_ranking.id, [travel_items[0].id, travel_items[2].id, other_item.id])
+
+            assert deleted == 2
+            assert list(Item.objects.filter(ranking=travel_ranking).values_list('name', flat=True).order_by('rank')) == [
+                "Paris",
+                "Rome",
+            ]
+            assert Item.objects.filter(id=other_item.id).exists()
+
+    class TestCompactRanks:
+        def test_renumbers_survivors(self, repository, travel_ranking, travel_items):
+            Item.objects.filter(id__in=[travel_items[0].id, travel_items[3].id]).delete()
+
+            updated = repository.compact_ranks(travel_ranking.id)
+
+            assert updated == 2
+            assert list(Item.objects.filter(ranking=travel_ranking).order_by('rank').values_list('name', 'rank')) == [
+                ("Paris", 1),
+                ("Berlin", 2),
+            ]
+
+        def test_dense_ranking_is_untouched(self, repository, travel_ranking, travel_items):
+            assert repository.compact_ranks(travel_ranking.id) == 0
+
+        def test_other_rankings_are_untouched(self, repository, travel_ranking, travel_items):
+            other_ranking = RankingList.objects.create(title="Other")
+            other_item = Item.objects.create(ranking=other_ranking, name="Chicago", rank=9)
+
+            repository.compact_ranks(travel_ranking.id)
+
+            assert Item.objects.get(id=other_item.id).rank == 9
+
+    class TestImportItems:
+        def test_rows_are_appended_in_order(self, repository, travel_ranking, travel_items):
+            rows = iter([("Oslo", None), ("Tab\tand\\slash", "Line\nbreak")])
+
+            imported = repository.import_items(travel_ranking.id, rows, 5, 1)
+
+            assert imported == 2
+            assert list(
+                Item.objects.filter(ranking=travel_ranking, rank__gte=5).order_by('rank').values_list('name', 'notes', 'rank')
+            ) == [("Oslo", None, 5), ("Tab\tand\\slash", "Line\nbreak", 6)]
+
+        def test_ranks_step_by_gap(self, repository, travel_ranking):
+            repository.import_items(travel_ranking.id, [("a", None), ("b", None)], 1 << 20, 1 << 20)
+
+            assert list(Item.objects.filter(ranking=travel_ranking).order_by('rank').values_list('rank', flat=True)) == [
+                1 << 20, 2 << 20
+            ]
+
+        def test_nothing_to_import(self, repository, travel_ranking):
+            assert repository.import_items(travel_ranking.id, [], 1, 1) == 0
+
+        def test_error_reading_rows_is_raised(self, repository, travel_ranking):
+            def rows():
+                yield "a", None
+                raise ValueError("Bad row 2")
+
+            with pytest.raises(ValueError, match="Bad row 2"):
+                repository.import_items(travel_ranking.id, rows(), 1, 1)
+
     class TestPatchItem:
         def test_patch_name_only(self, repository, cities_item):
             updated_item = repository.patch_item(item_id=cities_item.id, name="New York")
@@ -113,6 +467,41 @@ class TestItemRepository:
 
             assert updated_item is None
 
+    class TestAsyncReads:
+        def test_aget_item(self, repository, cities_item):
+            item = async_to_sync(repository.aget_item)(cities_item.id)
+
+            assert item.name == "Chicago"
+            assert item.ranking.title == "Cities"
+
+        def test_aget_non_existent_item(self, repository):
+            assert async_to_sync(repository.aget_item)(999) is None
+
+        def test_aget_all_item_rows(self, repository, travel_ranking, travel_items):
+            rows = async_to_sync(repository.aget_all_item_rows)(travel_ranking.id)
+
+            assert rows == repository.get_all_item_rows(travel_ranking.id)
+
+        def test_aiter_item_rows(self, repository, travel_ranking, travel_items):
+            async def collect():
+                return [row['name'] async for row in repository.aiter_item_rows(travel_ranking.id, chunk_size=3)]
+
+            assert async_to_sync(collect)() == ["London", "Paris", "Rome", "Berlin"]
+
+        def test_aget_item_rows_page(self, repository, travel_ranking, travel_items):
+            paris = travel_items[1]
+
+            page = async_to_sync(repository.aget_item_rows_page)(travel_ranking.id, 1, after=(paris.rank, paris.id))
+
+            assert [row['name'] for row in page] == ["Rome"]
+
+        def test_aget_ordering_mode(self, repository, travel_ranking):
+            assert async_to_sync(repository.aget_ordering_mode)(travel_ranking.id) == RankingList.DENSE
+            assert async_to_sync(repository.aget_ordering_mode)(999) is None
+
+        def test_acount_items_before(self, repository, travel_ranking, travel_items):
+            assert async_to_sync(repository.acount_items_before)(travel_ranking.id, travel_items[2].rank) == 3
+
 
 @pytest.fixture
 def repository():
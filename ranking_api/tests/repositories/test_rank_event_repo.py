@@ -0,0 +1,121 @@
+import pytest
+from datetime import timedelta
+from django.utils import timezone
+from ranking_api.models import Item, RankCheckpoint, RankEvent, RankingList
+from ranking_api.repositories.rank_event_repository import RankEventRepository
+
+@pytest.mark.django_db
+class TestRankEventRepository:
+    class TestRecordEvent:
+        def test_event_is_stored(self, repository, travel_ranking):
+            event = repository.record_event(travel_ranking.id, RankEvent.MOVE, [[1, 2]])
+
+            stored = RankEvent.objects.get(id=event.id)
+            assert stored.ranking_id == travel_ranking.id
+            assert stored.kind == RankEvent.MOVE
+            assert stored.changes == [[1, 2]]
+
+    class TestCountEventsSinceCheckpoint:
+        def test_counts_every_event_without_a_checkpoint(self, repository, travel_ranking):
+            for _ in range(3):
+                repository.record_event(travel_ranking.id, RankEvent.DELETE, [])
+
+            assert repository.count_events_since_checkpoint(travel_ranking.id) == 3
+
+        def test_counts_from_latest_checkpoint(self, repository, travel_ranking):
+            events = [repository.record_event(travel_ranking.id, RankEvent.DELETE, []) for _ in range(5)]
+            repository.create_checkpoint(travel_ranking.id, events[1].id)
+            repository.create_checkpoint(travel_ranking.id, events[3].id)
+
+            assert repository.count_events_since_checkpoint(travel_ranking.id) == 1
+
+        def test_ignores_other_rankings(self, repository, travel_ranking):
+            other = RankingList.objects.create(title="Other")
+            repository.record_event(other.id, RankEvent.DELETE, [])
+
+            assert repository.count_events_since_checkpoint(travel_ranking.id) == 0
+
+    class TestCreateCheckpoint:
+        def test_stores_item_ids_in_rank_order(self, repository, travel_ranking, travel_items):
+            checkpoint = repository.create_checkpoint(travel_ranking.id, 7)
+
+            assert checkpoint.last_event_id == 7
+            assert checkpoint.item_ids == [item.id for item in travel_items]
+
+        def test_takes_the_event_time(self, repository, travel_ranking):
+            event = repository.record_event(travel_ranking.id, RankEvent.IMPORT, [])
+
+            checkpoint = repository.create_checkpoint(travel_ranking.id, event.id, event.created_at)
+
+            assert RankCheckpoint.objects.get(id=checkpoint.id).created_at == event.created_at
+
+    class TestGetCheckpointThrough:
+        def test_latest_checkpoint_at_or_before_event(self, repository, travel_ranking):
+            first = RankCheckpoint.objects.create(ranking=travel_ranking, last_event_id=0, item_ids=[])
+            second = RankCheckpoint.objects.create(ranking=travel_ranking, last_event_id=5, item_ids=[])
+            RankCheckpoint.objects.create(ranking=travel_ranking, last_event_id=9, item_ids=[])
+
+            assert repository.get_checkpoint_through(travel_ranking.id, 4) == first
+            assert repository.get_checkpoint_through(travel_ranking.id, 5) == second
+
+    class TestGetCheckpointAt:
+        def test_latest_checkpoint_before(self, repository, travel_ranking):
+            now = timezone.now()
+            old = RankCheckpoint.objects.create(
+                ranking=travel_ranking, last_event_id=1, item_ids=[], created_at=now - timedelta(hours=2)
+            )
+            RankCheckpoint.objects.create(
+                ranking=travel_ranking, last_event_id=2, item_ids=[], created_at=now
+            )
+
+            assert repository.get_checkpoint_at(travel_ranking.id, now - timedelta(hours=1)) == old
+            assert repository.get_first_checkpoint(travel_ranking.id) == old
+
+        def test_none_before_first_checkpoint(self, repository, travel_ranking):
+            repository.create_checkpoint(travel_ranking.id, 0)
+
+            assert repository.get_checkpoint_at(travel_ranking.id, timezone.now() - timedelta(hours=1)) is None
+
+    class TestGetEvents:
+        def test_events_after_id_up_to_time(self, repository, travel_ranking):
+            now = timezone.now()
+            first = repository.record_event(travel_ranking.id, RankEvent.DELETE, [1])
+            second = repository.record_event(travel_ranking.id, RankEvent.DELETE, [2])
+            RankEvent.objects.create(
+                ranking=travel_ranking, kind=RankEvent.DELETE, changes=[3], created_at=now + timedelta(hours=1)
+            )
+
+            events = repository.get_events(travel_ranking.id, first.id, now + timedelta(minutes=1))
+
+            assert events == [second]
+
+        def test_events_between_ids(self, repository, travel_ranking):
+            events = [repository.record_event(travel_ranking.id, RankEvent.DELETE, [index]) for index in range(4)]
+
+            assert repository.get_events_through(travel_ranking.id, events[0].id, events[2].id) == events[1:3]
+
+    class TestGetDeletedItems:
+        def test_items_deleted_after_event(self, repository, travel_ranking):
+            first = repository.record_event(travel_ranking.id, RankEvent.DELETE, [1], [[1, "London", None]])
+            repository.record_event(travel_ranking.id, RankEvent.MOVE, [[2, 1]])
+            repository.record_event(travel_ranking.id, RankEvent.DELETE, [2, 3], [[2, "Paris", "Spring"], [3, "Rome", None]])
+
+            assert repository.get_deleted_items(travel_ranking.id, first.id) == {
+                2: ("Paris", "Spring"), 3: ("Rome", None)
+            }
+
+
+@pytest.fixture
+def repository():
+    return RankEventRepository()
+
+@pytest.fixture
+def travel_ranking():
+    return RankingList.objects.create(title="Travel")
+
+@pytest.fixture
+def travel_items(travel_ranking):
+    return [
+        Item.objects.create(name=name, ranking=travel_ranking, rank=rank)
+        for rank, name in enumerate(["London", "Paris", "Rome"], start=1)
+    ]
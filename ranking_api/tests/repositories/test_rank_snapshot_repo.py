@@ -0,0 +1,52 @@
+import pytest
+from ranking_api.models import RankingList, RankSnapshot
+from ranking_api.repositories.rank_snapshot_repository import RankSnapshotRepository
+
+@pytest.mark.django_db
+class TestRankSnapshotRepository:
+    class TestCreateAutomaticSnapshot:
+        def test_takes_the_ranking_version(self, repository, ranking):
+            RankingList.objects.filter(id=ranking.id).update(version=7)
+
+            repository.create_automatic_snapshot(ranking.id, 42)
+
+            snapshot = RankSnapshot.objects.get(ranking=ranking)
+            assert (snapshot.name, snapshot.ranking_version, snapshot.last_event_id) == (None, 7, 42)
+
+    class TestGetLastEventId:
+        def test_snapshot_position(self, repository, ranking):
+            snapshot = repository.create_snapshot(ranking.id, "first", 1, 5)
+
+            assert repository.get_last_event_id(ranking.id, snapshot.id) == 5
+
+        def test_other_ranking(self, repository, ranking):
+            other = RankingList.objects.create(title="Other")
+            snapshot = repository.create_snapshot(other.id, None, 1, 5)
+
+            assert repository.get_last_event_id(ranking.id, snapshot.id) is None
+
+    class TestDeleteAutomaticSnapshots:
+        def test_keeps_newest_and_named(self, repository, ranking):
+            named = repository.create_snapshot(ranking.id, "first", 1, 0)
+            automatic = [repository.create_snapshot(ranking.id, None, 1, event_id) for event_id in range(4)]
+
+            assert repository.delete_automatic_snapshots(ranking.id, keep=2) == 2
+
+            assert list(RankSnapshot.objects.order_by('id').values_list('id', flat=True)) == [
+                named.id, automatic[2].id, automatic[3].id
+            ]
+
+        def test_fewer_than_keep(self, repository, ranking):
+            repository.create_snapshot(ranking.id, None, 1, 0)
+
+            assert repository.delete_automatic_snapshots(ranking.id, keep=2) == 0
+            assert RankSnapshot.objects.count() == 1
+
+
+@pytest.fixture
+def repository():
+    return RankSnapshotRepository()
+
+@pytest.fixture
+def ranking():
+    return RankingList.objects.create(title="Travel")
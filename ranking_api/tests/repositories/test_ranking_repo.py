@@ -1,4 +1,5 @@
 import pytest
+from asgiref.sync import async_to_sync
 
 from ranking_api.models import RankingList
 from ranking_api.repositories.ranking_repository import RankingRepository
@@ -18,19 +19,45 @@ class TestRankingRepository:
 
             assert retrieved_ranking is None
 
-    class TestGetAllRankings:
-        def test_get_all_rankings_success(self, repository, ranking_list):
-            retrieved_rankings = repository.get_all_rankings()
+    class TestGetVersion:
+        def test_get_version(self, repository, ranking):
+            version, updated_at = repository.get_version(ranking.id)
 
-            assert len(retrieved_rankings) == 3
-            assert retrieved_rankings[0].title == ranking_list[0].title
-            assert retrieved_rankings[1].title == ranking_list[1].title
-            assert retrieved_rankings[2].title == ranking_list[2].title
+            assert version == 1
+            assert updated_at == ranking.updated_at
 
-        def test_get_all_rankings_empty(self, repository):
-            retrieved_rankings = repository.get_all_rankings()
+        def test_get_version_missing_ranking(self, repository):
+            assert repository.get_version(999) is None
 
-            assert len(retrieved_rankings) == 0
+        def test_update_bumps_version(self, repository, ranking):
+            updated_ranking = repository.update_ranking(ranking.id, "New Title")
+
+            assert updated_ranking.version == 2
+            assert repository.get_version(ranking.id)[0] == 2
+
+    class TestGetRankingsPage:
+        def test_pages_are_ordered_by_id(self, repository, ranking_list):
+            first_page = repository.get_rankings_page(2)
+            second_page = repository.get_rankings_page(2, after_id=first_page[-1].id)
+
+            assert first_page == ranking_list[:2]
+            assert second_page == ranking_list[2:]
+
+        def test_title_prefix_filter(self, repository, ranking_list):
+            page = repository.get_rankings_page(10, title_prefix="Re")
+
+            assert [ranking.title for ranking in page] == ["Restaurants"]
+
+        def test_prefix_pages_are_ordered_by_title_then_id(self, repository):
+            rankings = [RankingList.objects.create(title=title) for title in ["Books b", "Books a", "Books a", "Films"]]
+
+            first_page = repository.get_rankings_page(2, title_prefix="Books")
+            second_page = repository.get_rankings_page(
+                2, after_id=first_page[-1].id, title_prefix="Books", after_title=first_page[-1].title
+            )
+
+            assert first_page == [rankings[1], rankings[2]]
+            assert second_page == [rankings[0]]
 
     class TestCreateRanking:
         def test_create_ranking(self, repository):
@@ -69,6 +96,16 @@ class TestRankingRepository:
             assert db_ranking.title == "Test Ranking"
             assert db_ranking.description == ""
 
+        def test_create_ranking_defaults_to_dense(self, repository):
+            ranking = repository.create_ranking(title="Test Ranking")
+
+            assert ranking.ordering_mode == RankingList.DENSE
+
+        def test_create_sparse_ranking(self, repository):
+            ranking = repository.create_ranking(title="Test Ranking", ordering_mode=RankingList.SPARSE)
+
+            assert RankingList.objects.get(id=ranking.id).ordering_mode == RankingList.SPARSE
+
     class TestDeleteRanking:
         def test_delete_ranking_success(self, repository, ranking):
             response = repository.delete_ranking(ranking.id)
@@ -135,6 +172,22 @@ class TestRankingRepository:
             assert db_ranking.title == new_title
             assert db_ranking.description == ""
 
+        def test_update_keeps_item_count(self, repository, ranking, monkeypatch):
+            # An item write lands between the update's read and its save.
+            get = RankingList.objects.get
+
+            def get_then_add_items(**kwargs):
+                loaded = get(**kwargs)
+                RankingList.objects.filter(id=ranking.id).update(item_count=3)
+                return loaded
+
+            monkeypatch.setattr(RankingList.objects, 'get', get_then_add_items)
+
+            updated_ranking = repository.update_ranking(ranking.id, "New Title")
+
+            assert updated_ranking.item_count == 3
+            assert RankingList.objects.get(id=ranking.id).item_count == 3
+
         def test_update_non_existent_ranking(self, repository):
             non_existent_id = 999
 
@@ -146,6 +199,21 @@ class TestRankingRepository:
 
             assert updated_ranking is None
 
+    class TestAsyncReads:
+        def test_aget_ranking(self, repository, ranking):
+            assert async_to_sync(repository.aget_ranking)(ranking.id) == ranking
+
+        def test_aget_non_existent_ranking(self, repository):
+            assert async_to_sync(repository.aget_ranking)(999) is None
+
+        def test_aget_version(self, repository, ranking):
+            assert async_to_sync(repository.aget_version)(ranking.id) == repository.get_version(ranking.id)
+
+        def test_aget_rankings_page(self, repository, ranking_list):
+            page = async_to_sync(repository.aget_rankings_page)(2, after_id=ranking_list[0].id)
+
+            assert page == ranking_list[1:]
+
 
 @pytest.fixture
 def repository():
@@ -0,0 +1,63 @@
+import random
+import threading
+
+import pytest
+from django.db import connection, connections
+
+from ranking_api.models import Item, RankingList
+from ranking_api.repositories.item_repository import ItemRepository
+from ranking_api.services.item_service import ItemService
+
+THREADS = 8
+OPERATIONS_PER_THREAD = 25
+
+
+def run_concurrently(worker):
+    errors = []
+
+    def target(seed):
+        try:
+            worker(random.Random(seed))
+        except Exception as e:
+            errors.append(e)
+        finally:
+            connections.close_all()
+
+    threads = [threading.Thread(target=target, args=(seed,)) for seed in range(THREADS)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert errors == []
+
+
+# SQLite has no row locks and fails concurrent writers with "database is locked",
+# so this only runs against a database with SELECT ... FOR UPDATE.
+@pytest.mark.skipif(not connection.features.has_select_for_update, reason="needs row-level locking")
+@pytest.mark.django_db(transaction=True)
+class TestConcurrentRankMutations:
+    def test_ranks_stay_a_dense_permutation(self):
+        ranking = RankingList.objects.create(title="Stress")
+        other_ranking = RankingList.objects.create(title="Other")
+        service = ItemService(item_repository=ItemRepository())
+        for index in range(10):
+            service.create_item(f"seed {index}", ranking.id)
+
+        def worker(rng):
+            for index in range(OPERATIONS_PER_THREAD):
+                operation = rng.choice(['append', 'insert', 'move', 'other'])
+                if operation == 'append':
+                    service.create_item(f"append {index}", ranking.id)
+                elif operation == 'insert':
+                    service.create_item(f"insert {index}", ranking.id, rank=rng.randint(1, 10))
+                elif operation == 'move':
+                    item_id = rng.choice(list(Item.objects.filter(ranking=ranking).values_list('id', flat=True)))
+                    service.update_item_rank(item_id, rng.randint(1, 10))
+                else:
+                    service.create_item(f"other {index}", other_ranking.id, rank=1)
+
+        run_concurrently(worker)
+
+        for checked_ranking in (ranking, other_ranking):
+            ranks = list(Item.objects.filter(ranking=checked_ranking).order_by('rank').values_list('rank', flat=True))
+            assert ranks == list(range(1, len(ranks) + 1))
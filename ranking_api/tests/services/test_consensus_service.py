@@ -0,0 +1,66 @@
+import pytest
+from unittest.mock import Mock
+
+from ranking_api.models import RankingList
+from ranking_api.repositories.item_repository import ItemRepository
+from ranking_api.services.consensus_service import ConsensusService, MAX_KEMENY_CANDIDATES
+
+
+class BaseTestConsensusService:
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        self.mock_item_repository = Mock(spec=ItemRepository)
+        self.mock_item_repository.get_ranking_modes.return_value = {1: RankingList.DENSE, 2: RankingList.SPARSE}
+        self.consensus_service = ConsensusService(item_repository=self.mock_item_repository)
+
+
+class TestGetConsensus(BaseTestConsensusService):
+    def test_borda(self, ranked_names):
+        self.mock_item_repository.get_ranked_keys.return_value = ranked_names
+
+        result = self.consensus_service.get_consensus([1, 2, 1])
+
+        assert result == {
+            'method': 'borda',
+            'rankings': 2,
+            'items': [
+                {'rank': 1, 'name': "Paris", 'score': 4.0},
+                {'rank': 2, 'name': "London", 'score': 1.0},
+                {'rank': 3, 'name': "Rome", 'score': 1.0},
+            ],
+        }
+        self.mock_item_repository.get_ranked_keys.assert_called_once_with([1, 2])
+
+    def test_kemeny(self, ranked_names):
+        self.mock_item_repository.get_ranked_keys.return_value = ranked_names
+
+        result = self.consensus_service.get_consensus([1, 2], method='kemeny')
+
+        assert [item['name'] for item in result['items']] == ["Paris", "London", "Rome"]
+        assert result['disagreements'] == 1
+
+    def test_missing_rankings(self):
+        with pytest.raises(RankingList.DoesNotExist, match=r"Rankings with ids \[3\] do not exist."):
+            self.consensus_service.get_consensus([1, 3])
+
+        self.mock_item_repository.get_ranked_keys.assert_not_called()
+
+    def test_unknown_method(self):
+        with pytest.raises(ValueError, match="method must be one of borda, kemeny"):
+            self.consensus_service.get_consensus([1], method='median')
+
+    def test_kemeny_candidate_limit(self):
+        self.mock_item_repository.get_ranked_keys.return_value = {
+            1: [f"item {index}" for index in range(MAX_KEMENY_CANDIDATES + 1)]
+        }
+
+        with pytest.raises(ValueError, match="kemeny supports at most"):
+            self.consensus_service.get_consensus([1], method='kemeny')
+
+
+@pytest.fixture
+def ranked_names():
+    return {
+        1: ["Paris", "London", "Rome"],
+        2: ["Paris", "Rome", "London"],
+    }
@@ -1,15 +1,35 @@
 import pytest
+from asgiref.sync import async_to_sync
 from unittest.mock import Mock
-from ranking_api.models.item import Item, RankingList
+from ranking_api.cache import ItemListCache
+from ranking_api.models import Item, RankEvent, RankingList, RankSnapshot
+from ranking_api.pagination import decode_cursor, encode_cursor
 from ranking_api.repositories.item_repository import ItemRepository
-from ranking_api.services.item_service import ItemService
+from ranking_api.repositories.rank_event_repository import RankEventRepository
+from ranking_api.services.item_service import CHECKPOINT_INTERVAL, ItemService
+from ranking_api.services.snapshot_service import SnapshotService
 
 
 class BaseTestItemService:
     @pytest.fixture(autouse=True)
     def setup(self):
         self.mock_item_repository = Mock(spec=ItemRepository)
-        self.item_service = ItemService(item_repository=self.mock_item_repository)
+        self.mock_item_cache = Mock(spec=ItemListCache)
+        self.mock_item_cache.get_or_load.side_effect = lambda ranking_id, version, load: load()
+        self.mock_item_cache.aget_or_load.side_effect = self._aload_through
+        self.mock_event_repository = Mock(spec=RankEventRepository)
+        self.mock_event_repository.count_events_since_checkpoint.return_value = 0
+        self.mock_snapshot_service = Mock(spec=SnapshotService)
+        self.item_service = ItemService(
+            item_repository=self.mock_item_repository,
+            item_cache=self.mock_item_cache,
+            event_repository=self.mock_event_repository,
+            snapshot_service=self.mock_snapshot_service,
+        )
+
+    @staticmethod
+    async def _aload_through(ranking_id, version, load):
+        return await load()
 
 class TestGetItem(BaseTestItemService):
     def test_get_item_success(self, fake_item):
@@ -53,8 +73,207 @@ class TestGetAllItems(BaseTestItemService):
         assert retrieved_items is None
         self.mock_item_repository.get_all_items.assert_called_once_with(non_existent_ranking_id)
 
+class TestGetItemRows(BaseTestItemService):
+    def test_get_item_rows(self, fake_item_rows):
+        self.mock_item_repository.get_all_item_rows.return_value = fake_item_rows
+
+        rows = self.item_service.get_item_rows(1)
+
+        assert rows == fake_item_rows
+        self.mock_item_repository.get_all_item_rows.assert_called_once_with(1)
+
+    def test_get_item_rows_goes_through_cache(self, fake_item_rows):
+        self.mock_item_cache.get_or_load.side_effect = None
+        self.mock_item_cache.get_or_load.return_value = fake_item_rows
+        self.mock_item_repository.get_ranking_version.return_value = 4
+
+        assert self.item_service.get_item_rows(1) == fake_item_rows
+        assert self.mock_item_cache.get_or_load.call_args.args[:2] == (1, 4)
+        self.mock_item_repository.get_all_item_rows.assert_not_called()
+
+    def test_get_item_rows_with_known_version(self, fake_item_rows):
+        self.mock_item_cache.get_or_load.side_effect = None
+        self.mock_item_cache.get_or_load.return_value = fake_item_rows
+
+        assert self.item_service.get_item_rows(1, version=7) == fake_item_rows
+        assert self.mock_item_cache.get_or_load.call_args.args[:2] == (1, 7)
+        self.mock_item_repository.get_ranking_version.assert_not_called()
+
+    def test_get_item_rows_missing_ranking(self):
+        self.mock_item_repository.get_ranking_version.return_value = None
+
+        assert self.item_service.get_item_rows(1) is None
+        self.mock_item_cache.get_or_load.assert_not_called()
+        self.mock_item_repository.get_all_item_rows.assert_not_called()
+
+    def test_get_item_rows_sparse(self, fake_item_rows):
+        for row in fake_item_rows:
+            row['rank'] <<= 20
+        self.mock_item_repository.get_all_item_rows.return_value = fake_item_rows
+        self.mock_item_repository.get_ordering_mode.return_value = RankingList.SPARSE
+
+        rows = self.item_service.get_item_rows(1)
+
+        assert [row['rank'] for row in rows] == [1, 2, 3]
+
+    def test_iter_item_rows(self, fake_item_rows):
+        self.mock_item_repository.iter_item_rows.return_value = iter(fake_item_rows)
+
+        assert list(self.item_service.iter_item_rows(1)) == fake_item_rows
+        self.mock_item_repository.iter_item_rows.assert_called_once_with(1)
+
+    def test_iter_item_rows_sparse(self, fake_item_rows):
+        for row in fake_item_rows:
+            row['rank'] <<= 20
+        self.mock_item_repository.iter_item_rows.return_value = iter(fake_item_rows)
+        self.mock_item_repository.get_ordering_mode.return_value = RankingList.SPARSE
+
+        rows = self.item_service.iter_item_rows(1)
+
+        assert [row['rank'] for row in rows] == [1, 2, 3]
+
+class TestGetItemsPage(BaseTestItemService):
+    def test_first_page_with_more_items(self, fake_item_rows):
+        self.mock_item_repository.get_item_rows_page.return_value = fake_item_rows
+
+        page, next_cursor = self.item_service.get_items_page(1, 2)
+
+        assert page == fake_item_rows[:2]
+        assert decode_cursor(next_cursor) == {'rank': 2, 'id': 2, 'position': 2}
+        self.mock_item_repository.get_item_rows_page.assert_called_once_with(1, 3, None)
+
+    def test_last_page(self, fake_item_rows):
+        self.mock_item_repository.get_item_rows_page.return_value = fake_item_rows[2:]
+        cursor = encode_cursor({'rank': 2, 'id': 2, 'position': 2})
+
+        page, next_cursor = self.item_service.get_items_page(1, 2, cursor)
+
+        assert page == fake_item_rows[2:]
+        assert next_cursor is None
+        self.mock_item_repository.get_item_rows_page.assert_called_once_with(1, 3, (2, 2))
+
+    def test_sparse_positions_continue_from_cursor(self, fake_item_rows):
+        self.mock_item_repository.get_item_rows_page.return_value = fake_item_rows[:2]
+        self.mock_item_repository.get_ordering_mode.return_value = RankingList.SPARSE
+        cursor = encode_cursor({'rank': 0, 'id': 0, 'position': 10})
+
+        page, _ = self.item_service.get_items_page(1, 2, cursor)
+
+        assert [row['rank'] for row in page] == [11, 12]
+
+    def test_invalid_cursor(self):
+        with pytest.raises(ValueError, match='Invalid cursor'):
+            self.item_service.get_items_page(1, 2, encode_cursor({'rank': 'x'}))
+
+        self.mock_item_repository.get_item_rows_page.assert_not_called()
+
+class TestGetItemsInRankRange(BaseTestItemService):
+    def test_dense_ranking_uses_rank_range(self, fake_item_rows):
+        self.mock_item_repository.get_ordering_mode.return_value = RankingList.DENSE
+        self.mock_item_repository.get_item_rows_in_rank_range.return_value = fake_item_rows
+
+        assert self.item_service.get_items_in_rank_range(1, 1, 3) == fake_item_rows
+        self.mock_item_repository.get_item_rows_in_rank_range.assert_called_once_with(1, 1, 3)
+        self.mock_item_repository.get_item_rows_at_positions.assert_not_called()
+
+    def test_sparse_ranking_uses_positions(self, fake_item_rows):
+        self.mock_item_repository.get_ordering_mode.return_value = RankingList.SPARSE
+        self.mock_item_repository.get_item_rows_at_positions.return_value = [
+            {**row, 'rank': row['rank'] << 20} for row in fake_item_rows
+        ]
+
+        rows = self.item_service.get_items_in_rank_range(1, 11, 13)
+
+        assert [row['rank'] for row in rows] == [11, 12, 13]
+        self.mock_item_repository.get_item_rows_at_positions.assert_called_once_with(1, 10, 3)
+
+    def test_missing_ranking(self):
+        self.mock_item_repository.get_ordering_mode.return_value = None
+
+        assert self.item_service.get_items_in_rank_range(999, 1, 10) is None
+
+class TestGetItemNeighbors(BaseTestItemService):
+    def test_dense_item_uses_rank_range(self, fake_item_rows):
+        ranking = RankingList(id=1, title="dense", item_count=40)
+        self.mock_item_repository.get_item.return_value = Item(id=2, rank=20, ranking=ranking)
+        self.mock_item_repository.get_item_rows_in_rank_range.return_value = fake_item_rows
+
+        neighbors = self.item_service.get_item_neighbors(2, 1)
+
+        assert neighbors == {'rank': 20, 'total': 40, 'items': fake_item_rows}
+        self.mock_item_repository.get_item_rows_in_rank_range.assert_called_once_with(1, 19, 21)
+        self.mock_item_repository.count_items_in_ranking.assert_not_called()
+
+    def test_dense_window_starts_at_first_rank(self):
+        self.mock_item_repository.get_item.return_value = Item(id=2, rank=2, ranking=RankingList(id=1))
+        self.mock_item_repository.get_item_rows_in_rank_range.return_value = []
+
+        self.item_service.get_item_neighbors(2, 5)
+
+        self.mock_item_repository.get_item_rows_in_rank_range.assert_called_once_with(1, 1, 7)
+
+    def test_sparse_item_uses_positions(self, fake_sparse_item, fake_item_rows):
+        fake_sparse_item.ranking.item_count = 9
+        self.mock_item_repository.get_item.return_value = fake_sparse_item
+        self.mock_item_repository.count_items_before.return_value = 4
+        before = [{**row, 'rank': row['rank'] << 20} for row in fake_item_rows[:2]][::-1]
+        after = [{**fake_item_rows[2], 'rank': 3 << 20}]
+        self.mock_item_repository.get_item_rows_around.return_value = before, after
+
+        neighbors = self.item_service.get_item_neighbors(fake_sparse_item.id, 2)
+
+        assert neighbors['rank'] == 5
+        assert neighbors['total'] == 9
+        assert [(row['id'], row['rank']) for row in neighbors['items']] == [(1, 3), (2, 4), (3, 5)]
+        self.mock_item_repository.get_item_rows_around.assert_called_once_with(1, 3 << 20, 2)
+
+    def test_missing_item(self):
+        self.mock_item_repository.get_item.return_value = None
+
+        assert self.item_service.get_item_neighbors(999, 5) is None
+
+class TestSearchItems(BaseTestItemService):
+    def test_first_page(self, fake_item_rows):
+        rows = [{**row, 'score': 1.0 / row['id']} for row in fake_item_rows]
+        self.mock_item_repository.search_item_rows.return_value = rows
+        self.mock_item_repository.get_ranking_modes.return_value = {1: RankingList.DENSE}
+
+        items, next_cursor = self.item_service.search_items("test", 2)
+
+        assert [item['id'] for item in items] == [1, 2]
+        assert decode_cursor(next_cursor) == {'score': 0.5, 'id': 2}
+        self.mock_item_repository.search_item_rows.assert_called_once_with("test", 3, None, None)
+        self.mock_item_repository.get_item_positions.assert_not_called()
+
+    def test_next_page(self):
+        self.mock_item_repository.search_item_rows.return_value = []
+
+        items, next_cursor = self.item_service.search_items("test", 2, 4, encode_cursor({'score': 0.5, 'id': 2}))
+
+        assert (items, next_cursor) == ([], None)
+        self.mock_item_repository.search_item_rows.assert_called_once_with("test", 3, 4, (0.5, 2))
+        self.mock_item_repository.get_ranking_modes.assert_not_called()
+
+    def test_sparse_hits_get_positions(self, fake_item_rows):
+        rows = [{**row, 'ranking_id': row['id'], 'rank': 5 << 20, 'score': 1.0} for row in fake_item_rows[:2]]
+        self.mock_item_repository.search_item_rows.return_value = rows
+        self.mock_item_repository.get_ranking_modes.return_value = {1: RankingList.SPARSE, 2: RankingList.DENSE}
+        self.mock_item_repository.get_item_positions.return_value = {1: 5}
+
+        items, _ = self.item_service.search_items("test", 10)
+
+        assert [item['rank'] for item in items] == [5, 5 << 20]
+        self.mock_item_repository.get_item_positions.assert_called_once_with([1])
+        self.mock_item_repository.count_items_before.assert_not_called()
+
+    def test_invalid_cursor(self):
+        with pytest.raises(ValueError, match="Invalid cursor"):
+            self.item_service.search_items("test", 2, cursor=encode_cursor({'rank': 1}))
+
+@pytest.mark.django_db
 class TestCreateItem(BaseTestItemService):
     def test_create_item_with_name_success(self, fake_ranking):
+        self.mock_item_repository.get_max_rank.return_value = 3
         fake_item_name_only = Item(name="test", ranking_id=fake_ranking.id, rank=1)
         self.mock_item_repository.create_item.return_value = fake_item_name_only
 
@@ -62,8 +281,10 @@ class TestCreateItem(BaseTestItemService):
         assert created_item.name == fake_item_name_only.name
         assert created_item.notes == fake_item_name_only.notes
         self.mock_item_repository.create_item.assert_called_once_with(fake_item_name_only.name, fake_ranking.id, fake_item_name_only.notes, fake_item_name_only.rank)
+        self.mock_item_repository.touch_ranking.assert_called_once_with(fake_ranking.id, 1)
 
     def test_create_item_with_notes_success(self, fake_ranking, fake_item):
+        self.mock_item_repository.get_max_rank.return_value = 3
         self.mock_item_repository.create_item.return_value = fake_item
 
         created_item = self.item_service.create_item(fake_item.name, fake_ranking.id, fake_item.notes, fake_item.rank)
@@ -71,23 +292,200 @@ class TestCreateItem(BaseTestItemService):
         assert created_item.notes == fake_item.notes
         self.mock_item_repository.create_item.assert_called_once_with(fake_item.name, fake_ranking.id, fake_item.notes, fake_item.rank)
 
+    def test_create_item_appends_after_highest_rank(self):
+        self.mock_item_repository.get_max_rank.return_value = 7
+
+        self.item_service.create_item("test", 1)
+
+        self.mock_item_repository.create_item.assert_called_once_with("test", 1, None, 8)
+        self.mock_item_repository.shift_ranks_for_insert.assert_not_called()
+
+    def test_create_first_item(self):
+        self.mock_item_repository.get_max_rank.return_value = None
+
+        self.item_service.create_item("test", 1)
+
+        self.mock_item_repository.create_item.assert_called_once_with("test", 1, None, 1)
+
+    def test_create_item_inserts_and_shifts(self):
+        self.mock_item_repository.get_max_rank.return_value = 3
+
+        self.item_service.create_item("test", 1, rank=2)
+
+        self.mock_item_repository.shift_ranks_for_insert.assert_called_once_with(1, 2)
+        self.mock_item_repository.create_item.assert_called_once_with("test", 1, None, 2)
+
+    @pytest.mark.parametrize("rank, expected", [(50, 4), (4, 4), (0, 1), (-2, 1)])
+    def test_create_item_out_of_range_rank_is_clamped(self, rank, expected):
+        self.mock_item_repository.get_max_rank.return_value = 3
+
+        self.item_service.create_item("test", 1, rank=rank)
+
+        self.mock_item_repository.create_item.assert_called_once_with("test", 1, None, expected)
+        if expected > 3:
+            self.mock_item_repository.shift_ranks_for_insert.assert_not_called()
+        else:
+            self.mock_item_repository.shift_ranks_for_insert.assert_called_once_with(1, expected)
+
+    def test_create_item_missing_ranking(self):
+        self.mock_item_repository.lock_ranking.return_value = None
+
+        with pytest.raises(RankingList.DoesNotExist, match="Ranking with id 1 does not exist."):
+            self.item_service.create_item("test", 1)
+
+        self.mock_item_repository.create_item.assert_not_called()
+
+@pytest.mark.django_db
+class TestCreateItems(BaseTestItemService):
+    @pytest.fixture(autouse=True)
+    def bulk_create(self, setup):
+        self.mock_item_repository.bulk_create_items.side_effect = lambda ranking_id, items: [
+            Item(id=index, ranking_id=ranking_id, **item) for index, item in enumerate(items, start=100)
+        ]
+
+    def created_ranks(self):
+        (_, items), _ = self.mock_item_repository.bulk_create_items.call_args
+        return [(item['name'], item['rank']) for item in items]
+
+    def test_ranks_are_computed_in_memory(self):
+        self.mock_item_repository.get_max_rank.return_value = 3
+
+        created = self.item_service.create_items(1, [
+            {'name': "a", 'rank': 2},
+            {'name': "b"},
+            {'name': "c", 'rank': 2},
+            {'name': "d", 'rank': 1},
+        ])
+
+        # d, old 1, a, c, old 2, old 3, b
+        assert self.created_ranks() == [("d", 1), ("a", 3), ("c", 4), ("b", 7)]
+        assert [(item.name, item.rank) for item in created] == [("d", 1), ("a", 3), ("c", 4), ("b", 7)]
+        self.mock_item_repository.shift_ranks_for_bulk_insert.assert_called_once_with(1, [(1, 1), (2, 3)])
+        self.mock_item_repository.touch_ranking.assert_called_once_with(1, 4)
+
+    def test_append_only_needs_no_shift(self):
+        self.mock_item_repository.get_max_rank.return_value = None
+
+        self.item_service.create_items(1, [{'name': "a"}, {'name': "b", 'rank': 50}, {'name': "c"}])
+
+        assert self.created_ranks() == [("a", 1), ("b", 2), ("c", 3)]
+        self.mock_item_repository.shift_ranks_for_bulk_insert.assert_called_once_with(1, [])
+
+    def test_out_of_range_ranks_are_clamped(self):
+        self.mock_item_repository.get_max_rank.return_value = 2
+
+        self.item_service.create_items(1, [{'name': "a", 'rank': -5}, {'name': "b", 'rank': 9}])
+
+        assert self.created_ranks() == [("a", 1), ("b", 4)]
+        self.mock_item_repository.shift_ranks_for_bulk_insert.assert_called_once_with(1, [(1, 1)])
+
+    def test_sparse_ranking_spreads_items_across_gaps(self):
+        self.mock_item_repository.lock_ranking.return_value = RankingList.SPARSE
+        self.mock_item_repository.get_item_count.return_value = 2
+        self.mock_item_repository.get_neighbor_ranks.side_effect = lambda ranking_id, position: {
+            1: (None, 1 << 20),
+            3: (2 << 20, None),
+        }[position]
+
+        created = self.item_service.create_items(1, [{'name': "a", 'rank': 1}, {'name': "b"}, {'name': "c", 'rank': 1}])
+
+        third = (1 << 20) // 3
+        assert self.created_ranks() == [("a", third), ("c", 2 * third), ("b", (3 << 20))]
+        assert [item.rank for item in created] == [1, 2, 5]
+        self.mock_item_repository.count_items_in_ranking.assert_not_called()
+        self.mock_item_repository.shift_ranks_for_bulk_insert.assert_not_called()
+        self.mock_item_repository.respace_ranks.assert_not_called()
+
+    def test_sparse_ranking_respaces_when_gap_is_too_narrow(self):
+        self.mock_item_repository.lock_ranking.return_value = RankingList.SPARSE
+        self.mock_item_repository.get_item_count.return_value = 2
+        self.mock_item_repository.get_neighbor_ranks.side_effect = [(1, 2), (1 << 20, 2 << 20)]
+
+        self.item_service.create_items(1, [{'name': "a", 'rank': 2}])
+
+        self.mock_item_repository.respace_ranks.assert_called_once_with(1, 1 << 20)
+        assert self.created_ranks() == [("a", 3 << 19)]
+
+    def test_missing_ranking(self):
+        self.mock_item_repository.lock_ranking.return_value = None
+
+        with pytest.raises(RankingList.DoesNotExist):
+            self.item_service.create_items(1, [{'name': "a"}])
+
+        self.mock_item_repository.bulk_create_items.assert_not_called()
+
+@pytest.mark.django_db
 class TestDeleteItem(BaseTestItemService):
     def test_delete_item_success(self):
         item_id = 1
+        self.mock_item_repository.get_ranking_id.return_value = 5
 
         self.item_service.delete_item(item_id)
 
         self.mock_item_repository.delete_item.assert_called_once_with(item_id)
+        self.mock_item_repository.touch_ranking.assert_called_once_with(5, -1)
 
     def test_delete_item_not_found(self):
         item_id = 999
-        self.mock_item_repository.delete_item.return_value = False
+        self.mock_item_repository.get_ranking_id.return_value = None
         exception_string = "Item with id " + str(item_id) + " does not exist."
 
         with pytest.raises(Exception, match=exception_string):
             self.item_service.delete_item(item_id)
 
-        self.mock_item_repository.delete_item.assert_called_once_with(item_id)
+        self.mock_item_repository.delete_item.assert_not_called()
+        self.mock_item_repository.touch_ranking.assert_not_called()
+
+    def test_delete_item_closes_the_gap(self):
+        self.mock_item_repository.get_ranking_id.return_value = 5
+        self.mock_item_repository.lock_ranking.return_value = RankingList.DENSE
+
+        self.item_service.delete_item(1)
+
+        self.mock_item_repository.compact_ranks.assert_called_once_with(5)
+
+    def test_delete_sparse_item_keeps_keys(self):
+        self.mock_item_repository.get_ranking_id.return_value = 5
+        self.mock_item_repository.lock_ranking.return_value = RankingList.SPARSE
+
+        self.item_service.delete_item(1)
+
+        self.mock_item_repository.compact_ranks.assert_not_called()
+
+@pytest.mark.django_db
+class TestDeleteItems(BaseTestItemService):
+    def test_delete_items_compacts_once(self):
+        self.mock_item_repository.lock_ranking.return_value = RankingList.DENSE
+        self.mock_item_repository.delete_items.return_value = 3
+
+        deleted = self.item_service.delete_items(1, [4, 5, 6])
+
+        assert deleted == 3
+        self.mock_item_repository.delete_items.assert_called_once_with(1, [4, 5, 6])
+        self.mock_item_repository.compact_ranks.assert_called_once_with(1)
+        self.mock_item_repository.touch_ranking.assert_called_once_with(1, -3)
+
+    def test_delete_items_sparse(self):
+        self.mock_item_repository.lock_ranking.return_value = RankingList.SPARSE
+        self.mock_item_repository.delete_items.return_value = 2
+
+        assert self.item_service.delete_items(1, [4, 5]) == 2
+        self.mock_item_repository.compact_ranks.assert_not_called()
+
+    def test_delete_items_none_matched(self):
+        self.mock_item_repository.delete_items.return_value = 0
+
+        assert self.item_service.delete_items(1, [999]) == 0
+        self.mock_item_repository.compact_ranks.assert_not_called()
+        self.mock_item_repository.touch_ranking.assert_not_called()
+
+    def test_delete_items_missing_ranking(self):
+        self.mock_item_repository.lock_ranking.return_value = None
+
+        with pytest.raises(RankingList.DoesNotExist):
+            self.item_service.delete_items(1, [4])
+
+        self.mock_item_repository.delete_items.assert_not_called()
 
 class TestPatchItem(BaseTestItemService):
     def test_patch_item_success_with_name_and_notes(self, fake_item):
@@ -135,6 +533,380 @@ class TestPatchItem(BaseTestItemService):
             fake_item.id, name="Doesn't", notes="Matter"
         )
 
+@pytest.mark.django_db
+class TestUpdateItemRank(BaseTestItemService):
+    def test_update_item_rank_not_found(self):
+        self.mock_item_repository.get_ranking_id.return_value = None
+
+        with pytest.raises(Item.DoesNotExist, match="Item with id 999 does not exist."):
+            self.item_service.update_item_rank(999, 1)
+
+        self.mock_item_repository.lock_ranking.assert_not_called()
+
+    def test_update_item_rank_moves_in_one_statement(self):
+        fake_item = Item(id=3, name="test item", rank=4, ranking=RankingList(id=1, title="test", item_count=5))
+        self.mock_item_repository.get_ranking_id.return_value = 1
+        self.mock_item_repository.get_item.return_value = fake_item
+
+        updated_item = self.item_service.update_item_rank(fake_item.id, 2)
+
+        assert updated_item.rank == 2
+        self.mock_item_repository.lock_ranking.assert_called_once_with(1)
+        self.mock_item_repository.move_item.assert_called_once_with(1, 3, 4, 2)
+
+    def test_update_item_rank_item_moved_to_another_ranking(self):
+        fake_item = Item(id=3, name="test item", rank=4, ranking=RankingList(id=2, title="test"))
+        self.mock_item_repository.get_ranking_id.return_value = 1
+        self.mock_item_repository.get_item.return_value = fake_item
+
+        with pytest.raises(Item.DoesNotExist):
+            self.item_service.update_item_rank(fake_item.id, 2)
+
+        self.mock_item_repository.move_item.assert_not_called()
+
+    def test_update_item_rank_unchanged(self):
+        fake_item = Item(id=3, name="test item", rank=4, ranking=RankingList(id=1, title="test", item_count=5))
+        self.mock_item_repository.get_ranking_id.return_value = 1
+        self.mock_item_repository.get_item.return_value = fake_item
+
+        self.item_service.update_item_rank(fake_item.id, fake_item.rank)
+
+        self.mock_item_repository.move_item.assert_not_called()
+
+    @pytest.mark.parametrize('new_rank, expected', [(100, 5), (-3, 1), (0, 1)])
+    def test_update_item_rank_out_of_range_is_clamped(self, new_rank, expected):
+        fake_item = Item(id=3, name="test item", rank=4, ranking=RankingList(id=1, title="test", item_count=5))
+        self.mock_item_repository.get_ranking_id.return_value = 1
+        self.mock_item_repository.get_item.return_value = fake_item
+
+        updated_item = self.item_service.update_item_rank(fake_item.id, new_rank)
+
+        assert updated_item.rank == expected
+        self.mock_item_repository.move_item.assert_called_once_with(1, 3, 4, expected)
+
+    def test_update_item_rank_clamped_to_current_rank(self):
+        fake_item = Item(id=3, name="test item", rank=5, ranking=RankingList(id=1, title="test", item_count=5))
+        self.mock_item_repository.get_ranking_id.return_value = 1
+        self.mock_item_repository.get_item.return_value = fake_item
+
+        self.item_service.update_item_rank(fake_item.id, 100)
+
+        self.mock_item_repository.move_item.assert_not_called()
+
+@pytest.mark.django_db
+class TestUpdateItemRanks(BaseTestItemService):
+    def test_moves_are_written_in_one_update(self):
+        self.mock_item_repository.get_ranked_item_ids.return_value = [(10, 1), (11, 2), (12, 3), (13, 4)]
+
+        updated = self.item_service.update_item_ranks(1, [(13, 1), (10, 2)])
+
+        # 13 to the top gives 13, 10, 11, 12; then 10 to second place changes nothing further
+        assert updated == 4
+        self.mock_item_repository.apply_ranks.assert_called_once_with(1, {13: 1, 10: 2, 11: 3, 12: 4})
+
+    def test_only_changed_ranks_are_written(self):
+        self.mock_item_repository.get_ranked_item_ids.return_value = [(10, 1), (11, 2), (12, 3), (13, 4)]
+
+        updated = self.item_service.update_item_ranks(1, [(12, 2)])
+
+        assert updated == 2
+        self.mock_item_repository.apply_ranks.assert_called_once_with(1, {12: 2, 11: 3})
+
+    def test_out_of_range_rank_moves_to_bottom(self):
+        self.mock_item_repository.get_ranked_item_ids.return_value = [(10, 1), (11, 2)]
+
+        self.item_service.update_item_ranks(1, [(10, 50)])
+
+        self.mock_item_repository.apply_ranks.assert_called_once_with(1, {11: 1, 10: 2})
+
+    def test_sparse_ranking_rekeys_only_moved_items(self):
+        self.mock_item_repository.get_ranked_item_ids.return_value = [(10, 100), (11, 200), (12, 300), (13, 400)]
+        self.mock_item_repository.lock_ranking.return_value = RankingList.SPARSE
+
+        assert self.item_service.update_item_ranks(1, [(13, 1), (10, 4)]) == 2
+
+        self.mock_item_repository.apply_ranks.assert_called_once_with(1, {13: 100, 10: 300 + (1 << 20)})
+
+    def test_sparse_run_of_moves_shares_a_gap(self):
+        self.mock_item_repository.get_ranked_item_ids.return_value = [(10, 100), (11, 200), (12, 300), (13, 400)]
+        self.mock_item_repository.lock_ranking.return_value = RankingList.SPARSE
+
+        self.item_service.update_item_ranks(1, [(12, 2), (13, 3)])
+
+        self.mock_item_repository.apply_ranks.assert_called_once_with(1, {12: 133, 13: 166})
+
+    def test_sparse_ranking_is_respaced_when_a_gap_is_exhausted(self):
+        self.mock_item_repository.get_ranked_item_ids.return_value = [(10, 5), (11, 6), (12, 9)]
+        self.mock_item_repository.lock_ranking.return_value = RankingList.SPARSE
+
+        self.item_service.update_item_ranks(1, [(12, 2)])
+
+        self.mock_item_repository.apply_ranks.assert_called_once_with(
+            1, {10: 1 << 20, 12: 2 << 20, 11: 3 << 20}
+        )
+
+    def test_item_from_another_ranking(self):
+        self.mock_item_repository.get_ranked_item_ids.return_value = [(10, 1)]
+
+        with pytest.raises(Item.DoesNotExist, match="Item with id 99 does not exist in ranking 1."):
+            self.item_service.update_item_ranks(1, [(99, 1)])
+
+        self.mock_item_repository.apply_ranks.assert_not_called()
+
+@pytest.mark.django_db
+class TestSparseRanking(BaseTestItemService):
+    def test_get_all_items_returns_dense_positions(self, fake_items_list):
+        fake_items_list[0].rank = 1 << 20
+        fake_items_list[1].rank = 3 << 20
+        self.mock_item_repository.get_all_items.return_value = fake_items_list
+        self.mock_item_repository.get_ordering_mode.return_value = RankingList.SPARSE
+
+        retrieved_items = self.item_service.get_all_items(1)
+
+        assert [item.rank for item in retrieved_items] == [1, 2]
+
+    def test_get_item_returns_dense_position(self, fake_sparse_item):
+        self.mock_item_repository.get_item.return_value = fake_sparse_item
+        self.mock_item_repository.count_items_before.return_value = 4
+
+        retrieved_item = self.item_service.get_item(fake_sparse_item.id)
+
+        assert retrieved_item.rank == 5
+        self.mock_item_repository.count_items_before.assert_called_once_with(fake_sparse_item.ranking_id, 3 << 20)
+
+    def test_create_item_between_neighbours(self):
+        self.mock_item_repository.lock_ranking.return_value = RankingList.SPARSE
+        self.mock_item_repository.get_neighbor_ranks.return_value = (100, 200)
+        self.mock_item_repository.create_item.return_value = Item(name="test", rank=150)
+        self.mock_item_repository.count_items_before.return_value = 1
+
+        created_item = self.item_service.create_item("test", 1, rank=2)
+
+        assert created_item.rank == 2
+        self.mock_item_repository.create_item.assert_called_once_with("test", 1, None, 150)
+        self.mock_item_repository.shift_ranks_for_insert.assert_not_called()
+        self.mock_item_repository.respace_ranks.assert_not_called()
+
+    def test_create_item_appends_after_last(self):
+        self.mock_item_repository.lock_ranking.return_value = RankingList.SPARSE
+        self.mock_item_repository.get_neighbor_ranks.return_value = (1 << 20, None)
+        self.mock_item_repository.create_item.return_value = Item(name="test", rank=2 << 20)
+        self.mock_item_repository.count_items_before.return_value = 1
+
+        self.item_service.create_item("test", 1)
+
+        self.mock_item_repository.get_neighbor_ranks.assert_called_once_with(1, None, None)
+        self.mock_item_repository.create_item.assert_called_once_with("test", 1, None, 2 << 20)
+
+    def test_create_item_respaces_when_gap_is_exhausted(self):
+        self.mock_item_repository.lock_ranking.return_value = RankingList.SPARSE
+        self.mock_item_repository.get_neighbor_ranks.side_effect = [(7, 8), (1 << 20, 2 << 20)]
+        self.mock_item_repository.create_item.return_value = Item(name="test", rank=3 << 19)
+        self.mock_item_repository.count_items_before.return_value = 1
+
+        self.item_service.create_item("test", 1, rank=2)
+
+        self.mock_item_repository.respace_ranks.assert_called_once_with(1, 1 << 20)
+        self.mock_item_repository.create_item.assert_called_once_with("test", 1, None, 3 << 19)
+
+    def test_update_item_rank_touches_only_the_moved_item(self, fake_sparse_item):
+        self.mock_item_repository.get_ranking_id.return_value = fake_sparse_item.ranking_id
+        self.mock_item_repository.get_item.return_value = fake_sparse_item
+        self.mock_item_repository.get_neighbor_ranks.return_value = (None, 1 << 20)
+        self.mock_item_repository.count_items_before.return_value = 0
+
+        updated_item = self.item_service.update_item_rank(fake_sparse_item.id, 1)
+
+        assert updated_item.rank == 1
+        self.mock_item_repository.get_neighbor_ranks.assert_called_once_with(
+            fake_sparse_item.ranking_id, 1, fake_sparse_item.id
+        )
+        self.mock_item_repository.set_rank.assert_called_once_with(fake_sparse_item.id, 1 << 19)
+        self.mock_item_repository.move_item.assert_not_called()
+
+class TestAsyncReads(BaseTestItemService):
+    def test_aget_item_returns_dense_position(self, fake_sparse_item):
+        self.mock_item_repository.aget_item.return_value = fake_sparse_item
+        self.mock_item_repository.acount_items_before.return_value = 2
+
+        item = async_to_sync(self.item_service.aget_item)(fake_sparse_item.id)
+
+        assert item.rank == 3
+        self.mock_item_repository.acount_items_before.assert_awaited_once_with(1, 3 << 20)
+
+    def test_aget_item_not_found(self):
+        self.mock_item_repository.aget_item.return_value = None
+
+        assert async_to_sync(self.item_service.aget_item)(999) is None
+
+    def test_aget_item_rows_sparse(self, fake_item_rows):
+        self.mock_item_repository.aget_ordering_mode.return_value = RankingList.SPARSE
+        self.mock_item_repository.aget_all_item_rows.return_value = [
+            {**row, 'rank': row['rank'] << 20} for row in fake_item_rows
+        ]
+
+        rows = async_to_sync(self.item_service.aget_item_rows)(1)
+
+        assert rows == fake_item_rows
+        self.mock_item_cache.aget_or_load.assert_awaited_once()
+
+    def test_aget_item_rows_missing_ranking(self):
+        self.mock_item_repository.aget_ranking_version.return_value = None
+
+        assert async_to_sync(self.item_service.aget_item_rows)(999) is None
+        self.mock_item_repository.aget_all_item_rows.assert_not_called()
+
+    def test_aiter_item_rows_sparse(self, fake_item_rows):
+        async def stored_rows(ranking_id):
+            for row in fake_item_rows:
+                yield {**row, 'rank': row['rank'] << 20}
+
+        async def collect():
+            return [row async for row in self.item_service.aiter_item_rows(1)]
+
+        self.mock_item_repository.aget_ordering_mode.return_value = RankingList.SPARSE
+        self.mock_item_repository.aiter_item_rows = stored_rows
+
+        assert async_to_sync(collect)() == fake_item_rows
+
+    def test_aget_items_page_continues_positions(self, fake_item_rows):
+        self.mock_item_repository.aget_item_rows_page.return_value = [
+            {**row, 'rank': row['rank'] << 20} for row in fake_item_rows
+        ]
+        self.mock_item_repository.aget_ordering_mode.return_value = RankingList.SPARSE
+        cursor = encode_cursor({'rank': 5 << 20, 'id': 9, 'position': 5})
+
+        rows, next_cursor = async_to_sync(self.item_service.aget_items_page)(1, 2, cursor)
+
+        assert [row['rank'] for row in rows] == [6, 7]
+        assert decode_cursor(next_cursor) == {'rank': 2 << 20, 'id': 2, 'position': 7}
+        self.mock_item_repository.aget_item_rows_page.assert_awaited_once_with(1, 3, (5 << 20, 9))
+
+@pytest.mark.django_db
+class TestRankEvents(BaseTestItemService):
+    def test_create_item_records_insert(self):
+        self.mock_item_repository.get_max_rank.return_value = 7
+        self.mock_item_repository.create_item.return_value = Item(id=5, name="test", ranking_id=1, rank=8)
+
+        self.item_service.create_item("test", 1)
+
+        self.mock_event_repository.record_event.assert_called_once_with(1, RankEvent.INSERT, [[5, 8]], None)
+        self.mock_event_repository.create_checkpoint.assert_not_called()
+        self.mock_snapshot_service.take_snapshot.assert_not_called()
+
+    def test_update_item_ranks_records_clamped_positions(self):
+        self.mock_item_repository.get_ranked_item_ids.return_value = [(10, 1), (11, 2)]
+
+        self.item_service.update_item_ranks(1, [(10, 50)])
+
+        self.mock_event_repository.record_event.assert_called_once_with(1, RankEvent.MOVE, [[10, 2]], None)
+        self.mock_snapshot_service.take_snapshot.assert_called_once_with(
+            1, self.mock_event_repository.record_event.return_value
+        )
+
+    def test_delete_items_records_delete(self):
+        self.mock_item_repository.delete_items.return_value = 2
+        self.mock_item_repository.get_item_details.return_value = [(3, "c", None), (4, "d", "note")]
+
+        self.item_service.delete_items(1, [3, 4])
+
+        self.mock_event_repository.record_event.assert_called_once_with(
+            1, RankEvent.DELETE, [3, 4], [(3, "c", None), (4, "d", "note")]
+        )
+        self.mock_snapshot_service.take_snapshot.assert_called_once_with(
+            1, self.mock_event_repository.record_event.return_value
+        )
+
+    def test_checkpoint_every_interval(self):
+        event = RankEvent(id=300)
+        self.mock_event_repository.record_event.return_value = event
+        self.mock_event_repository.count_events_since_checkpoint.return_value = CHECKPOINT_INTERVAL
+        self.mock_item_repository.get_ranking_id.return_value = 1
+
+        self.item_service.delete_item(3)
+
+        self.mock_event_repository.create_checkpoint.assert_called_once_with(1, 300, event.created_at)
+        self.mock_snapshot_service.prune_snapshots.assert_called_once_with(1)
+
+@pytest.mark.django_db
+class TestRestoreSnapshot(BaseTestItemService):
+    def test_restore_rewrites_ranks_in_one_update(self):
+        self.mock_item_repository.lock_ranking.return_value = RankingList.DENSE
+        self.mock_snapshot_service.get_snapshot_state.return_value = ([12, 10, 11], {11: ("b", None)})
+        # 11 was deleted and 13 added since the snapshot.
+        self.mock_item_repository.get_ranked_item_ids.return_value = [(10, 1), (12, 2), (13, 3)]
+        self.mock_item_repository.get_item_details.return_value = [(13, "d", None)]
+
+        result = self.item_service.restore_snapshot(1, 5)
+
+        self.mock_item_repository.get_item_details.assert_called_once_with(1, [13])
+        assert self.mock_event_repository.record_event.call_args_list[0].args[1:] == (
+            RankEvent.DELETE, [13, 12, 11], [(13, "d", None)]
+        )
+        self.mock_snapshot_service.take_snapshot.assert_called_once()
+        self.mock_item_repository.delete_items.assert_called_once_with(1, [13])
+        self.mock_item_repository.apply_ranks.assert_called_once_with(1, {12: 1, 10: 2})
+        self.mock_item_repository.recreate_items.assert_called_once_with(1, [(11, "b", None, 3)])
+        self.mock_item_repository.touch_ranking.assert_called_once_with(1, 0)
+        assert result == {'ranking_id': 1, 'snapshot_id': 5, 'moved': 1, 'deleted': 1, 'restored': 1}
+
+    def test_missing_snapshot(self):
+        self.mock_snapshot_service.get_snapshot_state.side_effect = RankSnapshot.DoesNotExist
+
+        with pytest.raises(RankSnapshot.DoesNotExist):
+            self.item_service.restore_snapshot(1, 5)
+
+        self.mock_item_repository.apply_ranks.assert_not_called()
+
+    def test_deleted_item_without_details(self):
+        self.mock_item_repository.lock_ranking.return_value = RankingList.DENSE
+        self.mock_snapshot_service.get_snapshot_state.return_value = ([10, 11], {})
+        self.mock_item_repository.get_ranked_item_ids.return_value = [(10, 1)]
+
+        with pytest.raises(ValueError, match=r"no details were kept for deleted items \[11\]"):
+            self.item_service.restore_snapshot(1, 5)
+
+        self.mock_item_repository.recreate_items.assert_not_called()
+
+    def test_checkpoint_only_after_last_event(self):
+        self.mock_item_repository.lock_ranking.return_value = RankingList.DENSE
+        self.mock_snapshot_service.get_snapshot_state.return_value = ([11, 10], {})
+        self.mock_item_repository.get_ranked_item_ids.return_value = [(10, 1), (11, 2)]
+        delete_event, insert_event = RankEvent(id=8), RankEvent(id=9)
+        self.mock_event_repository.record_event.side_effect = [delete_event, insert_event]
+        self.mock_event_repository.count_events_since_checkpoint.return_value = CHECKPOINT_INTERVAL
+
+        self.item_service.restore_snapshot(1, 5)
+
+        self.mock_event_repository.create_checkpoint.assert_called_once_with(1, 9, insert_event.created_at)
+
+@pytest.mark.django_db
+class TestImportItems(BaseTestItemService):
+    def test_rows_are_appended_after_last_item(self):
+        self.mock_item_repository.lock_ranking.return_value = RankingList.DENSE
+        self.mock_item_repository.get_max_rank.return_value = 4
+        self.mock_item_repository.import_items.return_value = 2
+        event = RankEvent(id=9)
+        self.mock_event_repository.record_event.return_value = event
+        rows = iter([("a", None), ("b", None)])
+
+        assert self.item_service.import_items(1, rows) == 2
+
+        self.mock_item_repository.import_items.assert_called_once_with(1, rows, 5, 1)
+        self.mock_event_repository.record_event.assert_called_once_with(1, RankEvent.IMPORT, [])
+        self.mock_event_repository.create_checkpoint.assert_called_once_with(1, 9, event.created_at)
+        self.mock_item_repository.touch_ranking.assert_called_once_with(1, 2)
+
+    def test_sparse_ranking_uses_gap(self):
+        self.mock_item_repository.lock_ranking.return_value = RankingList.SPARSE
+        self.mock_item_repository.get_max_rank.return_value = None
+        self.mock_item_repository.import_items.return_value = 0
+
+        self.item_service.import_items(1, [])
+
+        self.mock_item_repository.import_items.assert_called_once_with(1, [], 1 << 20, 1 << 20)
+        self.mock_item_repository.touch_ranking.assert_not_called()
+
 @pytest.fixture
 def fake_ranking():
     return RankingList(
@@ -151,6 +923,22 @@ def fake_item(fake_ranking):
         ranking = fake_ranking,
     )
 
+@pytest.fixture
+def fake_sparse_item():
+    return Item(
+        id = 7,
+        name = "sparse item",
+        rank = 3 << 20,
+        ranking = RankingList(id = 1, title = "sparse", ordering_mode = RankingList.SPARSE),
+    )
+
+@pytest.fixture
+def fake_item_rows():
+    return [
+        {'id': i, 'name': f"test item {i}", 'notes': "", 'rank': i, 'ranking_id': 1}
+        for i in range(1, 4)
+    ]
+
 @pytest.fixture
 def fake_items_list(fake_ranking):
     return [
@@ -167,6 +955,3 @@ def fake_items_list(fake_ranking):
             ranking = fake_ranking,
         )
     ]
-
-
-
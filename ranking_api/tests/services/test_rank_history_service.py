@@ -0,0 +1,100 @@
+import pytest
+from datetime import datetime, timezone
+from unittest.mock import Mock
+
+from ranking_api.models import RankCheckpoint, RankEvent, RankingList
+from ranking_api.repositories.item_repository import ItemRepository
+from ranking_api.repositories.rank_event_repository import RankEventRepository
+from ranking_api.services.rank_history_service import RankHistoryService, apply_event
+
+AT = datetime(2024, 5, 1, tzinfo=timezone.utc)
+
+
+class TestApplyEvent:
+    def test_insert(self):
+        assert apply_event([1, 2, 3], RankEvent.INSERT, [[4, 1], [5, 5]]) == [4, 1, 2, 3, 5]
+
+    def test_insert_past_the_end_appends(self):
+        assert apply_event([1, 2], RankEvent.INSERT, [[3, 10]]) == [1, 2, 3]
+
+    def test_moves_apply_in_order(self):
+        assert apply_event([10, 11, 12, 13], RankEvent.MOVE, [[13, 1], [10, 2]]) == [13, 10, 11, 12]
+
+    def test_move_of_unknown_item_is_skipped(self):
+        assert apply_event([1, 2], RankEvent.MOVE, [[9, 1]]) == [1, 2]
+
+    def test_delete_ignores_missing_items(self):
+        assert apply_event([1, 2, 3], RankEvent.DELETE, [2, 9]) == [1, 3]
+
+
+class BaseTestRankHistoryService:
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        self.mock_event_repository = Mock(spec=RankEventRepository)
+        self.mock_item_repository = Mock(spec=ItemRepository)
+        self.mock_item_repository.get_ranking_modes.return_value = {1: RankingList.DENSE}
+        self.mock_item_repository.get_item_names.return_value = {10: "a", 11: "b", 12: "c"}
+        self.rank_history_service = RankHistoryService(
+            rank_event_repository=self.mock_event_repository,
+            item_repository=self.mock_item_repository
+        )
+
+
+class TestGetOrderAt(BaseTestRankHistoryService):
+    def test_replays_events_after_checkpoint(self):
+        self.mock_event_repository.get_checkpoint_at.return_value = RankCheckpoint(
+            ranking_id=1, last_event_id=40, item_ids=[10, 11]
+        )
+        self.mock_event_repository.get_events.return_value = [
+            RankEvent(kind=RankEvent.INSERT, changes=[[12, 1]]),
+            RankEvent(kind=RankEvent.MOVE, changes=[[10, 3]]),
+        ]
+
+        result = self.rank_history_service.get_order_at(1, AT)
+
+        self.mock_event_repository.get_events.assert_called_once_with(1, 40, AT)
+        assert result == {
+            'ranking_id': 1,
+            'at': AT.isoformat(),
+            'items': [
+                {'id': 12, 'name': "c", 'rank': 1},
+                {'id': 11, 'name': "b", 'rank': 2},
+                {'id': 10, 'name': "a", 'rank': 3},
+            ],
+            'events_replayed': 2,
+        }
+
+    def test_deleted_items_have_no_name(self):
+        self.mock_event_repository.get_checkpoint_at.return_value = RankCheckpoint(
+            ranking_id=1, last_event_id=0, item_ids=[10, 99]
+        )
+        self.mock_event_repository.get_events.return_value = []
+
+        result = self.rank_history_service.get_order_at(1, AT)
+
+        assert result['items'][1] == {'id': 99, 'name': None, 'rank': 2}
+
+    def test_no_checkpoint_replays_from_the_start(self):
+        self.mock_event_repository.get_checkpoint_at.return_value = None
+        self.mock_event_repository.get_first_checkpoint.return_value = None
+        self.mock_event_repository.get_events.return_value = [RankEvent(kind=RankEvent.INSERT, changes=[[10, 1]])]
+
+        result = self.rank_history_service.get_order_at(1, AT)
+
+        self.mock_event_repository.get_events.assert_called_once_with(1, 0, AT)
+        assert [item['id'] for item in result['items']] == [10]
+
+    def test_before_baseline(self):
+        self.mock_event_repository.get_checkpoint_at.return_value = None
+        self.mock_event_repository.get_first_checkpoint.return_value = RankCheckpoint(
+            ranking_id=1, last_event_id=0, item_ids=[10], created_at=AT
+        )
+
+        with pytest.raises(ValueError, match="History for ranking 1 starts at 2024-05-01T00:00:00"):
+            self.rank_history_service.get_order_at(1, datetime(2024, 1, 1, tzinfo=timezone.utc))
+
+    def test_missing_ranking(self):
+        self.mock_item_repository.get_ranking_modes.return_value = {}
+
+        with pytest.raises(RankingList.DoesNotExist, match="Ranking with id 1 does not exist."):
+            self.rank_history_service.get_order_at(1, AT)
@@ -1,7 +1,10 @@
+from datetime import datetime, timezone
+
 import pytest
 from unittest.mock import Mock
 
 from ranking_api.models import RankingList
+from ranking_api.pagination import decode_cursor, encode_cursor
 from ranking_api.repositories.ranking_repository import RankingRepository
 from ranking_api.services.ranking_service import RankingService
 
@@ -35,18 +38,54 @@ class TestGetRanking(BaseTestRankingService):
         self.mock_ranking_repository.get_ranking.assert_called_once_with(non_existent_ranking_id)
 
 
-class TestGetAllRankings(BaseTestRankingService):
-    def test_get_all_rankings(self, fake_ranking_list):
-        self.mock_ranking_repository.get_all_rankings.return_value = fake_ranking_list
+class TestGetValidators(BaseTestRankingService):
+    def test_get_validators(self):
+        updated_at = datetime(2025, 3, 1, tzinfo=timezone.utc)
+        self.mock_ranking_repository.get_version.return_value = (4, updated_at)
+
+        assert self.ranking_service.get_validators(7) == ('"7-4"', int(updated_at.timestamp()), 4)
+        self.mock_ranking_repository.get_version.assert_called_once_with(7)
+
+    def test_get_validators_missing_ranking(self):
+        self.mock_ranking_repository.get_version.return_value = None
+
+        assert self.ranking_service.get_validators(7) is None
+
+class TestGetRankingsPage(BaseTestRankingService):
+    def test_first_page_with_more_rankings(self):
+        rankings = [RankingList(id=i, title=f"ranking {i}") for i in range(1, 4)]
+        self.mock_ranking_repository.get_rankings_page.return_value = rankings
+
+        page, next_cursor = self.ranking_service.get_rankings_page(2, title_prefix="ran")
+
+        assert page == rankings[:2]
+        assert decode_cursor(next_cursor) == {'title': "ranking 2", 'id': 2}
+        self.mock_ranking_repository.get_rankings_page.assert_called_once_with(3, None, "ran", None)
+
+    def test_prefix_page_resumes_after_title_and_id(self):
+        self.mock_ranking_repository.get_rankings_page.return_value = []
 
-        retrieved_rankings = self.ranking_service.get_all_rankings()
+        self.ranking_service.get_rankings_page(2, cursor=encode_cursor({'title': "ranking 2", 'id': 2}), title_prefix="ran")
 
-        assert len(retrieved_rankings) == 3
-        assert retrieved_rankings[0].title == fake_ranking_list[0].title
-        assert retrieved_rankings[1].title == fake_ranking_list[1].title
-        assert retrieved_rankings[2].title == fake_ranking_list[2].title
-        self.mock_ranking_repository.get_all_rankings.assert_called_once()
+        self.mock_ranking_repository.get_rankings_page.assert_called_once_with(3, 2, "ran", "ranking 2")
 
+    def test_prefix_page_needs_title_in_cursor(self):
+        with pytest.raises(ValueError, match='Invalid cursor'):
+            self.ranking_service.get_rankings_page(2, cursor=encode_cursor({'id': 2}), title_prefix="ran")
+
+    def test_last_page(self):
+        rankings = [RankingList(id=3, title="ranking 3")]
+        self.mock_ranking_repository.get_rankings_page.return_value = rankings
+
+        page, next_cursor = self.ranking_service.get_rankings_page(2, cursor=encode_cursor({'id': 2}))
+
+        assert page == rankings
+        assert next_cursor is None
+        self.mock_ranking_repository.get_rankings_page.assert_called_once_with(3, 2, None, None)
+
+    def test_invalid_cursor(self):
+        with pytest.raises(ValueError, match='Invalid cursor'):
+            self.ranking_service.get_rankings_page(2, cursor=encode_cursor({}))
 
 class TestCreateRanking(BaseTestRankingService):
     def test_create_ranking_with_title_only(self):
@@ -55,7 +94,7 @@ class TestCreateRanking(BaseTestRankingService):
 
         result = self.ranking_service.create_ranking(title="Test Title")
 
-        self.mock_ranking_repository.create_ranking.assert_called_once_with("Test Title", None)
+        self.mock_ranking_repository.create_ranking.assert_called_once_with("Test Title", None, None)
         assert result == expected_ranking
 
     def test_create_ranking_with_title_and_description(self):
@@ -69,7 +108,8 @@ class TestCreateRanking(BaseTestRankingService):
 
         self.mock_ranking_repository.create_ranking.assert_called_once_with(
             "Test Title",
-            "Test Description"
+            "Test Description",
+            None
         )
         assert result == expected_ranking
 
@@ -138,20 +178,3 @@ def fake_ranking():
         description="test description",
     )
 
-
-@pytest.fixture
-def fake_ranking_list():
-    return [
-        RankingList(
-            title="test title 1",
-            description="test description 1",
-        ),
-        RankingList(
-            title="test title 2",
-            description="test description 2",
-        ),
-        RankingList(
-            title="test title 3",
-            description="test description 3",
-        )
-    ]
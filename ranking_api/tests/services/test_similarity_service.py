@@ -0,0 +1,88 @@
+import pytest
+from unittest.mock import Mock
+
+from ranking_api.models import RankingList
+from ranking_api.repositories.item_repository import ItemRepository
+from ranking_api.services.similarity_service import SimilarityService
+
+
+class BaseTestSimilarityService:
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        self.mock_item_repository = Mock(spec=ItemRepository)
+        self.mock_item_repository.get_ranking_modes.return_value = {
+            1: RankingList.DENSE, 2: RankingList.DENSE, 3: RankingList.SPARSE
+        }
+        self.mock_item_repository.get_ranked_keys.return_value = {
+            1: ["a", "b", "c", "d", "e"],
+            2: ["b", "a", "c", "d", "e"],
+            3: ["e", "d", "c", "b", "a"],
+        }
+        self.similarity_service = SimilarityService(item_repository=self.mock_item_repository)
+
+
+class TestCompareRankings(BaseTestSimilarityService):
+    def test_compare(self):
+        result = self.similarity_service.compare_rankings(1, 2)
+
+        assert result['ranking_ids'] == [1, 2]
+        assert result['shared_items'] == 5
+        assert result['kendall_tau'] == pytest.approx(0.8)
+        assert result['spearman_rho'] == pytest.approx(0.9)
+        assert result['spearman_footrule'] == 2
+        assert 0 < result['rbo'] < 1
+        self.mock_item_repository.get_ranked_keys.assert_called_once_with([1, 2], 'name')
+
+    def test_compare_with_itself(self):
+        result = self.similarity_service.compare_rankings(1, 1, key_field='notes')
+
+        assert result['kendall_tau'] == 1
+        assert result['rbo'] == pytest.approx(1)
+        self.mock_item_repository.get_ranked_keys.assert_called_once_with([1], 'notes')
+
+    def test_empty_ranking(self):
+        self.mock_item_repository.get_ranked_keys.return_value = {1: ["a", "b"]}
+
+        result = self.similarity_service.compare_rankings(1, 2)
+
+        assert result['shared_items'] == 0
+        assert result['kendall_tau'] is None
+        assert result['rbo'] == 0
+
+    @pytest.mark.parametrize('kwargs, message', [
+        ({'key_field': 'rank'}, 'key must be one of name, notes'),
+        ({'p': 1.0}, 'p must be between 0 and 1'),
+    ])
+    def test_invalid_arguments(self, kwargs, message):
+        with pytest.raises(ValueError, match=message):
+            self.similarity_service.compare_rankings(1, 2, **kwargs)
+
+    def test_missing_ranking(self):
+        with pytest.raises(RankingList.DoesNotExist, match=r"Rankings with ids \[4\] do not exist."):
+            self.similarity_service.compare_rankings(1, 4)
+
+
+class TestGetSimilarityMatrix(BaseTestSimilarityService):
+    def test_spearman(self):
+        result = self.similarity_service.get_similarity_matrix([1, 2, 3])
+
+        assert result['metric'] == 'spearman'
+        assert result['ranking_ids'] == [1, 2, 3]
+        assert result['matrix'][0] == pytest.approx([1, 0.9, -1])
+
+    def test_kendall(self):
+        result = self.similarity_service.get_similarity_matrix([1, 2], metric='kendall')
+
+        assert result['matrix'][0] == pytest.approx([1, 0.8])
+        assert result['matrix'][1] == pytest.approx([0.8, 1])
+
+    def test_undefined_values_are_null(self):
+        self.mock_item_repository.get_ranked_keys.return_value = {1: ["a", "b"]}
+
+        result = self.similarity_service.get_similarity_matrix([1, 2], metric='kendall')
+
+        assert result['matrix'][0][1] is None
+
+    def test_unknown_metric(self):
+        with pytest.raises(ValueError, match="metric must be one of spearman, kendall"):
+            self.similarity_service.get_similarity_matrix([1, 2], metric='rbo')
@@ -0,0 +1,93 @@
+import pytest
+from unittest.mock import Mock, patch
+
+from ranking_api.models import RankCheckpoint, RankEvent, RankingList, RankSnapshot
+from ranking_api.repositories.item_repository import ItemRepository
+from ranking_api.repositories.rank_event_repository import RankEventRepository
+from ranking_api.repositories.rank_snapshot_repository import RankSnapshotRepository
+from ranking_api.services.snapshot_service import SnapshotService
+
+
+class BaseTestSnapshotService:
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        self.mock_item_repository = Mock(spec=ItemRepository)
+        self.mock_item_repository.get_ranking_version.return_value = 7
+        self.mock_snapshot_repository = Mock(spec=RankSnapshotRepository)
+        self.mock_event_repository = Mock(spec=RankEventRepository)
+        self.mock_event_repository.get_last_event_id.return_value = 40
+        self.snapshot_service = SnapshotService(
+            item_repository=self.mock_item_repository,
+            snapshot_repository=self.mock_snapshot_repository,
+            event_repository=self.mock_event_repository
+        )
+
+
+class TestTakeSnapshot(BaseTestSnapshotService):
+    def test_points_just_before_the_event(self):
+        self.snapshot_service.take_snapshot(1, RankEvent(id=41))
+
+        self.mock_snapshot_repository.create_automatic_snapshot.assert_called_once_with(1, 40)
+
+    @patch('ranking_api.services.snapshot_service.AUTOMATIC_SNAPSHOT_LIMIT', 3)
+    def test_prune_keeps_the_limit(self):
+        self.snapshot_service.prune_snapshots(1)
+
+        self.mock_snapshot_repository.delete_automatic_snapshots.assert_called_once_with(1, 3)
+
+
+@pytest.mark.django_db
+class TestCreateSnapshot(BaseTestSnapshotService):
+    def test_points_at_the_latest_event(self):
+        self.snapshot_service.create_snapshot(1, "weekly")
+
+        self.mock_snapshot_repository.create_snapshot.assert_called_once_with(1, "weekly", 7, 40)
+
+    def test_name_required(self):
+        with pytest.raises(ValueError, match="name is required"):
+            self.snapshot_service.create_snapshot(1, "")
+
+    def test_missing_ranking(self):
+        self.mock_item_repository.lock_ranking.return_value = None
+
+        with pytest.raises(RankingList.DoesNotExist, match="Ranking with id 1 does not exist."):
+            self.snapshot_service.create_snapshot(1, "weekly")
+
+
+class TestGetSnapshotState(BaseTestSnapshotService):
+    def test_replays_from_checkpoint_to_snapshot(self):
+        self.mock_snapshot_repository.get_last_event_id.return_value = 12
+        self.mock_event_repository.get_checkpoint_through.return_value = RankCheckpoint(last_event_id=10, item_ids=[1, 2, 3])
+        self.mock_event_repository.get_events_through.return_value = [
+            RankEvent(id=11, kind=RankEvent.MOVE, changes=[[3, 1]]),
+            RankEvent(id=12, kind=RankEvent.DELETE, changes=[2]),
+        ]
+        self.mock_event_repository.get_deleted_items.return_value = {3: ("c", None)}
+
+        order, items = self.snapshot_service.get_snapshot_state(1, 5)
+
+        assert order == [3, 1]
+        assert items == {3: ("c", None)}
+        self.mock_event_repository.get_checkpoint_through.assert_called_once_with(1, 12)
+        self.mock_event_repository.get_events_through.assert_called_once_with(1, 10, 12)
+        self.mock_event_repository.get_deleted_items.assert_called_once_with(1, 12)
+
+    def test_without_checkpoint_replays_whole_log(self):
+        self.mock_snapshot_repository.get_last_event_id.return_value = 2
+        self.mock_event_repository.get_checkpoint_through.return_value = None
+        self.mock_event_repository.get_events_through.return_value = [
+            RankEvent(id=1, kind=RankEvent.INSERT, changes=[[1, 1]]),
+            RankEvent(id=2, kind=RankEvent.INSERT, changes=[[2, 1]]),
+        ]
+        self.mock_event_repository.get_deleted_items.return_value = {}
+
+        order, _ = self.snapshot_service.get_snapshot_state(1, 5)
+
+        assert order == [2, 1]
+        self.mock_event_repository.get_events_through.assert_called_once_with(1, 0, 2)
+
+    def test_snapshot_from_another_ranking(self):
+        self.mock_snapshot_repository.get_last_event_id.return_value = None
+
+        with pytest.raises(RankSnapshot.DoesNotExist, match="Snapshot with id 5 does not exist in ranking 1."):
+            self.snapshot_service.get_snapshot_state(1, 5)
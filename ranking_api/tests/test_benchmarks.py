@@ -0,0 +1,105 @@
+import asyncio
+
+import pytest
+
+from ranking_api.benchmarks import compare_results, run_benchmarks, run_server_comparison, run_slow_clients, summarize
+
+
+def _results(*entries):
+    return {'results': [
+        {'name': name, 'size': size, 'median_ms': median_ms, 'queries': queries}
+        for name, size, median_ms, queries in entries
+    ]}
+
+
+class TestSummarize:
+    def test_statistics(self):
+        summary = summarize([5.0, 1.0, 3.0, 2.0, 4.0], queries=7)
+
+        assert summary == {
+            'repeat': 5, 'min_ms': 1.0, 'median_ms': 3.0, 'p95_ms': 5.0, 'max_ms': 5.0, 'queries': 7
+        }
+
+    def test_single_timing(self):
+        assert summarize([2.5], queries=1)['p95_ms'] == 2.5
+
+
+class TestCompareResults:
+    def test_flags_slowdowns_past_threshold(self):
+        baseline = _results(('create_item_top', 1000, 10.0, 8), ('get_all_items', 1000, 10.0, 2))
+        current = _results(('create_item_top', 1000, 13.0, 8), ('get_all_items', 1000, 11.5, 2))
+
+        comparisons = compare_results(baseline, current, threshold=0.2)
+
+        assert [(entry['name'], entry['ratio'], entry['regressed']) for entry in comparisons] == [
+            ('create_item_top', 1.3, True), ('get_all_items', 1.15, False)
+        ]
+
+    def test_ignores_slowdowns_under_min_delta(self):
+        comparisons = compare_results(
+            _results(('create_item_append', 1000, 1.0, 8)), _results(('create_item_append', 1000, 2.0, 8)),
+            min_delta_ms=2.0
+        )
+
+        assert comparisons[0]['regressed'] is False
+
+    def test_flags_extra_queries(self):
+        comparisons = compare_results(
+            _results(('create_item_append', 1000, 5.0, 8)), _results(('create_item_append', 1000, 4.0, 9))
+        )
+
+        assert comparisons[0]['regressed'] is True
+
+    def test_skips_benchmarks_missing_from_baseline(self):
+        comparisons = compare_results(
+            _results(('create_item_append', 1000, 5.0, 8)),
+            _results(('create_item_append', 100000, 5.0, 8), ('get_all_items', 1000, 5.0, 2))
+        )
+
+        assert comparisons == []
+
+
+class TestRunBenchmarks:
+    def test_unknown_benchmark(self):
+        with pytest.raises(ValueError, match="Unknown benchmarks: create_items"):
+            run_benchmarks([10], names=['create_items'])
+
+    def test_invalid_repeat(self):
+        with pytest.raises(ValueError, match="repeat must be at least 1"):
+            run_benchmarks([10], repeat=0)
+
+
+class TestRunSlowClients:
+    def test_counts_ok_responses(self):
+        async def scenario():
+            async def respond(reader, writer):
+                await reader.readuntil(b'\r\n\r\n')
+                writer.write(b'HTTP/1.1 200 OK\r\nContent-Length: 12\r\n\r\n{"items":[]}')
+                await writer.drain()
+                writer.close()
+
+            server = await asyncio.start_server(respond, '127.0.0.1', 0)
+            port = server.sockets[0].getsockname()[1]
+            async with server:
+                return await run_slow_clients(f'http://127.0.0.1:{port}/api/rankings/1/items/', 3, 2, 0)
+
+        result = asyncio.run(scenario())
+
+        assert (result['ok'], result['errors']) == (3, 0)
+        assert result['p50_ms'] is not None
+
+    def test_failed_connections_count_as_errors(self):
+        async def scenario():
+            server = await asyncio.start_server(lambda reader, writer: None, '127.0.0.1', 0)
+            port = server.sockets[0].getsockname()[1]
+            server.close()
+            await server.wait_closed()
+            return await run_slow_clients(f'http://127.0.0.1:{port}/', 2, 2, 0)
+
+        result = asyncio.run(scenario())
+
+        assert result == {'ok': 0, 'errors': 2, 'requests_per_second': 0.0, 'p50_ms': None, 'p95_ms': None}
+
+    def test_invalid_concurrency(self):
+        with pytest.raises(ValueError, match="requests and concurrency must be at least 1"):
+            run_server_comparison(1, 'http://localhost:8000', 'http://localhost:8001', concurrency=0)
@@ -0,0 +1,109 @@
+import pytest
+from asgiref.sync import async_to_sync
+from django.db.models import F
+from django.test import override_settings
+from unittest.mock import AsyncMock, Mock
+
+from ranking_api.cache import ItemListCache
+from ranking_api.models import Item, RankingList
+from ranking_api.repositories.item_repository import ItemRepository
+from ranking_api.services.item_service import ItemService
+
+
+class TestItemListCache:
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        self.cache = ItemListCache()
+
+    def test_miss_then_hit(self):
+        load = Mock(return_value=[{'id': 1}])
+
+        assert self.cache.get_or_load(1, 1, load) == [{'id': 1}]
+        assert self.cache.get_or_load(1, 1, load) == [{'id': 1}]
+
+        load.assert_called_once()
+        assert self.cache.stats() == {'hits': 1, 'misses': 1}
+
+    def test_async_shares_entries_with_sync(self):
+        load = AsyncMock(return_value=[{'id': 1}])
+
+        assert async_to_sync(self.cache.aget_or_load)(1, 1, load) == [{'id': 1}]
+        assert self.cache.get_or_load(1, 1, Mock()) == [{'id': 1}]
+        assert async_to_sync(self.cache.aget_or_load)(1, 1, load) == [{'id': 1}]
+
+        load.assert_awaited_once()
+        assert self.cache.stats() == {'hits': 2, 'misses': 1}
+
+    def test_missing_ranking_is_not_cached(self):
+        load = Mock(return_value=None)
+
+        assert self.cache.get_or_load(1, 1, load) is None
+        assert self.cache.get_or_load(1, 1, load) is None
+
+        assert load.call_count == 2
+
+    def test_new_version_misses(self):
+        self.cache.get_or_load(1, 1, lambda: [{'id': 1}])
+
+        assert self.cache.get_or_load(1, 2, lambda: [{'id': 2}]) == [{'id': 2}]
+        assert self.cache.get_or_load(1, 2, lambda: []) == [{'id': 2}]
+
+    def test_entries_are_per_ranking(self):
+        self.cache.get_or_load(1, 1, lambda: [{'id': 1}])
+
+        assert self.cache.get_or_load(2, 1, lambda: [{'id': 2}]) == [{'id': 2}]
+        assert self.cache.stats() == {'hits': 0, 'misses': 2}
+
+    @override_settings(CACHES={'items': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'lru-test',
+        'OPTIONS': {'MAX_ENTRIES': 2, 'CULL_FREQUENCY': 2},
+    }})
+    def test_least_recently_used_entries_are_evicted(self):
+        for ranking_id in range(1, 3):
+            self.cache.get_or_load(ranking_id, 1, lambda: [{'id': ranking_id}])
+        # Touch ranking 1 so ranking 2 becomes the least recently used.
+        self.cache.get_or_load(1, 1, lambda: [])
+        self.cache.get_or_load(3, 1, lambda: [{'id': 3}])
+
+        assert self.cache.get_or_load(1, 1, lambda: []) == [{'id': 1}]
+        assert self.cache.get_or_load(2, 1, lambda: []) == []
+
+
+@pytest.mark.django_db
+class TestItemServiceCaching:
+    def test_mutations_change_the_cache_key(self):
+        ranking = RankingList.objects.create(title="Cities")
+        service = ItemService(item_repository=ItemRepository(), item_cache=ItemListCache())
+
+        assert service.get_item_rows(ranking.id) == []
+        item = service.create_item("Chicago", ranking.id, rank=1)
+        assert [row['name'] for row in service.get_item_rows(ranking.id)] == ["Chicago"]
+
+        service.patch_item(item.id, name="Boston")
+        assert [row['name'] for row in service.get_item_rows(ranking.id)] == ["Boston"]
+
+        service.delete_item(item.id)
+        assert service.get_item_rows(ranking.id) == []
+        assert not Item.objects.exists()
+
+    def test_write_from_another_process_is_seen(self):
+        # Another worker's cache is never told about the write; the version
+        # it committed is enough to move readers here to a new key.
+        ranking = RankingList.objects.create(title="Cities")
+        service = ItemService(item_repository=ItemRepository(), item_cache=ItemListCache())
+        assert service.get_item_rows(ranking.id) == []
+
+        Item.objects.create(ranking=ranking, name="Chicago", rank=1)
+        RankingList.objects.filter(id=ranking.id).update(version=F('version') + 1)
+
+        assert [row['name'] for row in service.get_item_rows(ranking.id)] == ["Chicago"]
+
+    def test_deleted_ranking(self):
+        ranking = RankingList.objects.create(title="Cities")
+        service = ItemService(item_repository=ItemRepository(), item_cache=ItemListCache())
+        service.get_item_rows(ranking.id)
+
+        ranking.delete()
+
+        assert service.get_item_rows(ranking.id) is None
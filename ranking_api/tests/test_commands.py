@@ -0,0 +1,114 @@
+import json
+from io import StringIO
+
+import pytest
+from django.core.management import CommandError, call_command
+
+from ranking_api.models import Item, RankCheckpoint, RankingList
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def ranking():
+    ranking = RankingList.objects.create(title="Cities", item_count=3)
+    Item.objects.bulk_create(
+        Item(ranking=ranking, name=name, notes=notes, rank=rank)
+        for rank, (name, notes) in enumerate([("London", "Rainy, grey"), ("Paris", None), ("Rome", "Line\nbreak")], start=1)
+    )
+    return ranking
+
+
+class TestExportRanking:
+    def test_export_to_stdout(self, ranking):
+        out = StringIO()
+
+        call_command('export_ranking', ranking.id, stdout=out)
+
+        assert out.getvalue().splitlines()[:3] == ['rank,name,notes', '1,London,"Rainy, grey"', '2,Paris,']
+
+    def test_missing_ranking(self):
+        with pytest.raises(CommandError, match="Ranking with id 999 does not exist."):
+            call_command('export_ranking', 999)
+
+
+class TestImportRanking:
+    @pytest.mark.parametrize('format', ['csv', 'ndjson'])
+    def test_round_trip(self, ranking, tmp_path, format):
+        path = tmp_path / f'cities.{format}'
+        call_command('export_ranking', ranking.id, format=format, output=str(path))
+        out = StringIO()
+
+        call_command('import_ranking', str(path), title="Copy", stdout=out)
+
+        copy = RankingList.objects.get(title="Copy")
+        assert out.getvalue() == f"Imported 3 items into ranking {copy.id}.\n"
+        assert list(Item.objects.filter(ranking=copy).order_by('rank').values_list('name', 'notes', 'rank')) == [
+            ("London", "Rainy, grey", 1), ("Paris", None, 2), ("Rome", "Line\nbreak", 3)
+        ]
+        assert copy.item_count == 3
+        assert RankCheckpoint.objects.get(ranking=copy).item_ids == list(
+            Item.objects.filter(ranking=copy).order_by('rank').values_list('id', flat=True)
+        )
+
+    def test_append_to_existing_ranking(self, ranking, tmp_path):
+        path = tmp_path / 'more.ndjson'
+        path.write_text('{"name": "Oslo"}\n{"name": "Lima", "notes": "Coastal"}\n')
+
+        call_command('import_ranking', str(path), ranking_id=ranking.id, stdout=StringIO())
+
+        assert list(Item.objects.filter(ranking=ranking).order_by('rank').values_list('name', 'rank'))[3:] == [
+            ("Oslo", 4), ("Lima", 5)
+        ]
+
+    def test_invalid_row_imports_nothing(self, tmp_path):
+        path = tmp_path / 'bad.csv'
+        path.write_text('name\nOslo\n\n""\n')
+
+        with pytest.raises(CommandError, match="Line 4: name is required"):
+            call_command('import_ranking', str(path), title="Bad")
+
+        assert not RankingList.objects.filter(title="Bad").exists()
+
+    def test_missing_ranking(self, tmp_path):
+        path = tmp_path / 'cities.csv'
+        path.write_text('name\nOslo\n')
+
+        with pytest.raises(CommandError, match="Ranking with id 999 does not exist."):
+            call_command('import_ranking', str(path), ranking_id=999)
+
+
+class TestBenchmark:
+    def test_writes_results_and_cleans_up(self, tmp_path):
+        path = tmp_path / 'results.json'
+
+        call_command(
+            'benchmark', sizes='20', repeat=1, only=['create_item_top', 'http_list_items_page'],
+            in_place=True, output=str(path), stderr=StringIO()
+        )
+
+        results = json.loads(path.read_text())
+        assert [(result['name'], result['size']) for result in results['results']] == [
+            ('create_item_top', 20), ('http_list_items_page', 20)
+        ]
+        assert results['results'][0]['queries'] > 0
+        assert not RankingList.objects.exists()
+
+    def test_compare_flags_regressions(self, tmp_path):
+        baseline = tmp_path / 'baseline.json'
+        baseline.write_text(json.dumps({'results': [
+            {'name': 'create_item_append', 'size': 10, 'median_ms': 0.001, 'queries': 1}
+        ]}))
+        output = tmp_path / 'results.json'
+
+        with pytest.raises(CommandError, match="1 benchmark\\(s\\) regressed"):
+            call_command(
+                'benchmark', sizes='10', repeat=1, only=['create_item_append'], in_place=True,
+                compare=str(baseline), output=str(output), stderr=StringIO()
+            )
+
+        assert json.loads(output.read_text())['comparison'][0]['regressed'] is True
+
+    def test_invalid_sizes(self):
+        with pytest.raises(CommandError, match="--sizes must be a comma-separated list of integers"):
+            call_command('benchmark', sizes='1k', in_place=True)
@@ -0,0 +1,78 @@
+from itertools import permutations
+
+import numpy as np
+import pytest
+
+from ranking_api.consensus import (
+    borda_order, borda_scores, kemeny_disagreements, kemeny_order, preference_matrix
+)
+
+
+def brute_force_kemeny(matrix):
+    preferences = preference_matrix(matrix)
+    return min(
+        kemeny_disagreements(np.array(order), preferences)
+        for order in permutations(range(matrix.shape[1]))
+    )
+
+
+class TestBorda:
+    def test_scores(self):
+        matrix = np.array([[0, 1, 2], [1, 0, 2], [0, 2, 1]], dtype=float)
+
+        assert borda_scores(matrix).tolist() == [5, 3, 1]
+        assert borda_order(matrix).tolist() == [0, 1, 2]
+
+    def test_ties_keep_candidate_order(self):
+        matrix = np.array([[0, 1], [1, 0]], dtype=float)
+
+        assert borda_order(matrix).tolist() == [0, 1]
+
+
+class TestPreferenceMatrix:
+    def test_counts_rankings_preferring_each_pair(self):
+        matrix = np.array([[0, 1, 2], [2, 0, 1], [1.5, 0, 1.5]])
+
+        assert preference_matrix(matrix).tolist() == [
+            [0, 1, 1],
+            [2, 0, 3],
+            [1, 0, 0],
+        ]
+
+
+class TestKemeny:
+    def test_unanimous(self):
+        matrix = np.array([[2, 0, 1]] * 3, dtype=float)
+
+        order, disagreements = kemeny_order(matrix)
+
+        assert order.tolist() == [1, 2, 0]
+        assert disagreements == 0
+
+    def test_improves_on_borda(self):
+        # Borda puts 0 first on points, but a majority prefers 1 to 0.
+        matrix = np.array([
+            [0, 1, 2, 3],
+            [0, 1, 2, 3],
+            [1, 0, 2, 3],
+            [3, 0, 1, 2],
+            [3, 0, 1, 2],
+        ], dtype=float)
+
+        order, disagreements = kemeny_order(matrix)
+
+        assert borda_order(matrix).tolist() == [1, 0, 2, 3]
+        assert disagreements == brute_force_kemeny(matrix)
+        assert disagreements == kemeny_disagreements(order, preference_matrix(matrix))
+
+    @pytest.mark.parametrize('seed', range(5))
+    def test_close_to_optimum_on_noisy_rankings(self, seed):
+        rng = np.random.default_rng(seed)
+        matrix = np.array([
+            np.argsort(np.argsort(np.arange(6) + rng.normal(0, 2, 6))) for _ in range(9)
+        ], dtype=float)
+
+        order, disagreements = kemeny_order(matrix)
+
+        assert sorted(order.tolist()) == list(range(6))
+        assert disagreements <= brute_force_kemeny(matrix) + 2
@@ -0,0 +1,70 @@
+import pytest
+from unittest.mock import Mock, patch
+
+from django.db import connection
+
+from ranking_api.db_pool import get_pool_stats
+
+
+class TestGetPoolStats:
+    def test_without_pool(self):
+        persistent = Mock(pool=None, settings_dict={'CONN_MAX_AGE': 60, 'CONN_HEALTH_CHECKS': True})
+
+        with patch('ranking_api.db_pool.connections', {'default': persistent}):
+            stats = get_pool_stats()
+
+        assert stats == {
+            'alias': 'default',
+            'pooled': False,
+            'conn_max_age': 60,
+            'conn_health_checks': True,
+        }
+
+    @pytest.mark.skipif(hasattr(connection, 'pool'), reason='backend supports pooling')
+    def test_backend_without_pool_support(self):
+        # SQLite's connection wrapper has no `pool` attribute at all.
+        assert get_pool_stats()['pooled'] is False
+
+    def test_with_pool(self):
+        pool = Mock()
+        pool.get_stats.return_value = {
+            'pool_min': 2,
+            'pool_max': 10,
+            'pool_size': 6,
+            'pool_available': 1,
+            'requests_num': 40,
+            'requests_queued': 4,
+            'requests_wait_ms': 30,
+            'connections_num': 6,
+        }
+
+        with patch('ranking_api.db_pool.connections', {'default': Mock(pool=pool)}):
+            stats = get_pool_stats()
+
+        assert stats == {
+            'alias': 'default',
+            'pooled': True,
+            'min_size': 2,
+            'max_size': 10,
+            'size': 6,
+            'available': 1,
+            'checked_out': 5,
+            'requests': 40,
+            'requests_waiting': 0,
+            'requests_queued': 4,
+            'wait_ms_total': 30,
+            'wait_ms_avg': 7.5,
+            'timeouts': 0,
+            'connections_opened': 6,
+            'connections_lost': 0,
+        }
+
+    def test_fresh_pool_has_no_wait(self):
+        pool = Mock()
+        pool.get_stats.return_value = {'pool_min': 2, 'pool_max': 10, 'pool_size': 0, 'pool_available': 0}
+
+        with patch('ranking_api.db_pool.connections', {'default': Mock(pool=pool)}):
+            stats = get_pool_stats()
+
+        assert stats['checked_out'] == 0
+        assert stats['wait_ms_avg'] == 0
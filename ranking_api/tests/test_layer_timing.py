@@ -0,0 +1,44 @@
+import time
+
+from ranking_api.layer_timing import _timed, start_timing, stop_timing
+
+
+class Repository:
+    def load(self):
+        time.sleep(0.01)
+
+
+class Service:
+    def __init__(self):
+        self.repository = Repository()
+
+    def get(self):
+        return self.helper()
+
+    def helper(self):
+        self.repository.load()
+        self.repository.load()
+        return 'ok'
+
+
+Repository.load = _timed(Repository.load, 'repository')
+Service.get = _timed(Service.get, 'service')
+Service.helper = _timed(Service.helper, 'service')
+
+
+class TestLayerTimer:
+    def test_times_outermost_calls_per_layer(self):
+        timer = start_timing()
+        try:
+            assert Service().get() == 'ok'
+        finally:
+            stop_timing()
+
+        # the nested service call is not counted again; repository time is
+        # included in the service's
+        assert 0.02 <= timer.totals['repository'] <= timer.totals['service'] < 1.5 * timer.totals['repository']
+        assert timer.totals['controller'] == 0
+        assert timer.server_timing().startswith('controller;dur=0.0, service;dur=')
+
+    def test_untimed_without_a_timer(self):
+        assert Service().get() == 'ok'
@@ -0,0 +1,154 @@
+import os
+import pstats
+import re
+import tempfile
+
+from django.contrib.auth.models import User
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from ranking_api.models import Item, RankingList
+
+
+class TestQueryCountMiddleware(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.ranking = RankingList.objects.create(title='Cities', item_count=3)
+        Item.objects.bulk_create(
+            Item(ranking=cls.ranking, name=name, rank=rank) for rank, name in enumerate(['Rome', 'Oslo', 'Lima'], start=1)
+        )
+
+    def test_headers_report_queries(self):
+        with self.assertNumQueries(3):
+            response = self.client.get(reverse('ranking-items', kwargs={'ranking_id': self.ranking.id}))
+
+        self.assertEqual(response['X-DB-Queries'], '3')
+        self.assertRegex(response['Server-Timing'], r'^db;dur=\d+\.\d;desc="3 queries", total;dur=\d+\.\d$')
+
+    def test_counts_are_per_request(self):
+        url = reverse('ranking-items', kwargs={'ranking_id': self.ranking.id})
+        self.client.get(url)
+
+        response = self.client.get(url)
+
+        # the cached list costs only the ETag lookup
+        self.assertEqual(response['X-DB-Queries'], '1')
+
+    async def test_async_requests(self):
+        response = await self.async_client.get(
+            reverse('async-ranking-items', kwargs={'ranking_id': self.ranking.id})
+        )
+
+        self.assertEqual(response.status_code, 200)
+        # queries run in sync_to_async threads are counted too
+        self.assertEqual(response['X-DB-Queries'], '3')
+
+    @override_settings(QUERY_BUDGET=2)
+    def test_logs_requests_over_budget(self):
+        with self.assertLogs('ranking_api.middleware', level='WARNING') as logs:
+            self.client.get(reverse('ranking-items', kwargs={'ranking_id': self.ranking.id}))
+
+        self.assertIn(f'GET /api/rankings/{self.ranking.id}/items/ ran 3 queries', logs.output[0])
+        self.assertIn('budget 2 queries', logs.output[0])
+
+    def test_requests_within_budget_are_not_logged(self):
+        with self.assertNoLogs('ranking_api.middleware', level='WARNING'):
+            self.client.get(reverse('ranking-items', kwargs={'ranking_id': self.ranking.id}))
+
+    @override_settings(QUERY_STATS_HEADERS=False)
+    def test_headers_can_be_disabled(self):
+        response = self.client.get(reverse('ranking-items', kwargs={'ranking_id': self.ranking.id}))
+
+        self.assertNotIn('X-DB-Queries', response)
+        self.assertNotIn('Server-Timing', response)
+
+
+class TestProfilingMiddleware(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.ranking = RankingList.objects.create(title='Cities', item_count=1)
+        Item.objects.create(ranking=cls.ranking, name='Rome', rank=1)
+        cls.url = reverse('ranking-items', kwargs={'ranking_id': cls.ranking.id})
+
+    def setUp(self):
+        profiles = tempfile.TemporaryDirectory()
+        self.addCleanup(profiles.cleanup)
+        self.profiles = profiles.name
+
+    def _profiling(self, **overrides):
+        return override_settings(**{
+            'PROFILING_ENABLED': True, 'PROFILING_TOKEN': 'secret', 'PROFILING_DIR': self.profiles, **overrides
+        })
+
+    def test_disabled_by_default(self):
+        response = self.client.get(self.url, headers={'X-Profile': 'secret'})
+
+        self.assertNotIn('X-Profile-File', response)
+
+    def test_profiles_with_token_header(self):
+        with self._profiling():
+            response = self.client.get(self.url, headers={'X-Profile': 'secret'})
+
+        self.assertEqual(response.status_code, 200)
+        filename = response['X-Profile-File']
+        self.assertRegex(filename, r'^ranking-items-\d{8}T\d{6}-[0-9a-f]{8}\.prof$')
+        self.assertEqual(os.listdir(self.profiles), [filename])
+        stats = pstats.Stats(os.path.join(self.profiles, filename))
+        self.assertTrue(any(function == 'get_ranking_items' for _, _, function in stats.stats))
+
+    def test_profiles_with_token_parameter(self):
+        with self._profiling():
+            response = self.client.get(self.url, {'profile': 'secret'})
+
+        self.assertIn('X-Profile-File', response)
+
+    def test_wrong_token_is_ignored(self):
+        with self._profiling():
+            response = self.client.get(self.url, headers={'X-Profile': 'guess'})
+
+        self.assertNotIn('X-Profile-File', response)
+        self.assertEqual(os.listdir(self.profiles), [])
+
+    def test_staff_users_need_no_token(self):
+        self.client.force_login(User.objects.create_user('admin', is_staff=True))
+
+        with self._profiling(PROFILING_TOKEN=''):
+            response = self.client.get(self.url, {'profile': '1'})
+
+        self.assertIn('X-Profile-File', response)
+
+    def test_other_users_need_the_token(self):
+        self.client.force_login(User.objects.create_user('visitor'))
+
+        with self._profiling(PROFILING_TOKEN=''):
+            response = self.client.get(self.url, {'profile': '1'})
+
+        self.assertNotIn('X-Profile-File', response)
+
+    @override_settings(LAYER_TIMING_SAMPLE_RATE=1.0)
+    def test_sampled_layer_timing(self):
+        with self.assertLogs('ranking_api.middleware', level='INFO'):
+            response = self.client.get(self.url)
+
+        timings = dict(re.findall(r'(\w+);dur=([\d.]+)', response['Server-Timing']))
+        self.assertEqual(set(timings), {'controller', 'service', 'repository', 'db', 'total'})
+        self.assertGreaterEqual(float(timings['controller']), float(timings['service']))
+        self.assertGreaterEqual(float(timings['service']), float(timings['repository']))
+        self.assertGreater(float(timings['repository']), 0)
+
+    @override_settings(LAYER_TIMING_SAMPLE_RATE=1.0)
+    async def test_sampled_layer_timing_async(self):
+        response = await self.async_client.get(
+            reverse('async-ranking-items', kwargs={'ranking_id': self.ranking.id})
+        )
+
+        timings = dict(re.findall(r'(\w+);dur=([\d.]+)', response['Server-Timing']))
+        self.assertGreater(float(timings['service']), 0)
+
+    @override_settings(LAYER_TIMING_SAMPLE_RATE=0.0)
+    def test_unsampled_requests_have_no_layer_timing(self):
+        response = self.client.get(self.url)
+
+        self.assertNotIn('controller;', response['Server-Timing'])
@@ -0,0 +1,86 @@
+import pytest
+
+from ranking_api.pagination import (
+    MAX_PAGE_SIZE, DEFAULT_PAGE_SIZE, DEFAULT_RADIUS, decode_cursor, encode_cursor, parse_limit, parse_radius,
+    parse_rank_window
+)
+
+
+class TestCursor:
+    def test_round_trip(self):
+        cursor = encode_cursor({'rank': 3, 'id': 42, 'position': 3})
+
+        assert '=' not in cursor
+        assert decode_cursor(cursor) == {'rank': 3, 'id': 42, 'position': 3}
+
+    def test_garbage_cursor(self):
+        with pytest.raises(ValueError, match='Invalid cursor'):
+            decode_cursor('not a cursor')
+
+    def test_non_object_cursor(self):
+        with pytest.raises(ValueError, match='Invalid cursor'):
+            decode_cursor(encode_cursor([1, 2]))
+
+
+class TestParseLimit:
+    def test_default(self):
+        assert parse_limit(None) == DEFAULT_PAGE_SIZE
+
+    def test_capped(self):
+        assert parse_limit(str(MAX_PAGE_SIZE + 1)) == MAX_PAGE_SIZE
+
+    @pytest.mark.parametrize('value', ['abc', '0', '-5'])
+    def test_invalid(self, value):
+        with pytest.raises(ValueError):
+            parse_limit(value)
+
+
+class TestParseRankWindow:
+    def test_top(self):
+        assert parse_rank_window('10', None, None) == (1, 10)
+
+    def test_top_capped(self):
+        assert parse_rank_window(str(MAX_PAGE_SIZE * 5), None, None) == (1, MAX_PAGE_SIZE)
+
+    def test_range(self):
+        assert parse_rank_window(None, '11', '20') == (11, 20)
+
+    def test_single_rank(self):
+        assert parse_rank_window(None, '7', '7') == (7, 7)
+
+    def test_open_ended_range(self):
+        assert parse_rank_window(None, '50', None) == (50, 50 + DEFAULT_PAGE_SIZE - 1)
+        assert parse_rank_window(None, None, '5') == (1, 5)
+
+    def test_range_capped(self):
+        assert parse_rank_window(None, '1', '1000000') == (1, MAX_PAGE_SIZE)
+
+    @pytest.mark.parametrize('top, rank_from, rank_to, message', [
+        ('0', None, None, 'top must be at least 1'),
+        ('ten', None, None, 'top must be an integer'),
+        ('5', '1', None, 'top cannot be combined with rank_from or rank_to'),
+        (None, '0', '3', 'rank_from must be at least 1'),
+        (None, '5', '4', 'rank_to must not be less than rank_from'),
+    ])
+    def test_invalid(self, top, rank_from, rank_to, message):
+        with pytest.raises(ValueError, match=message):
+            parse_rank_window(top, rank_from, rank_to)
+
+
+class TestParseRadius:
+    def test_default(self):
+        assert parse_radius(None) == DEFAULT_RADIUS
+
+    def test_zero(self):
+        assert parse_radius('0') == 0
+
+    def test_capped(self):
+        assert parse_radius('1000000') == MAX_PAGE_SIZE // 2
+
+    @pytest.mark.parametrize('value, message', [
+        ('-1', 'radius must not be negative'),
+        ('two', 'radius must be an integer'),
+    ])
+    def test_invalid(self, value, message):
+        with pytest.raises(ValueError, match=message):
+            parse_radius(value)
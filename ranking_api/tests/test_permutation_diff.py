@@ -0,0 +1,59 @@
+import random
+
+from ranking_api.models import RankEvent
+from ranking_api.permutation_diff import diff_orders, longest_increasing_run
+from ranking_api.services.rank_history_service import apply_event
+
+
+def _replay(base, diff):
+    # The two rank events restore_snapshot logs for a diff.
+    order = apply_event(list(base), RankEvent.DELETE, diff['removed'] + [item_id for item_id, _ in diff['placed']])
+    return apply_event(order, RankEvent.INSERT, [[item_id, index + 1] for item_id, index in diff['placed']])
+
+
+class TestLongestIncreasingRun:
+    def test_run(self):
+        values = [3, 1, 4, 1, 5, 9, 2, 6]
+
+        run = sorted(longest_increasing_run(values))
+
+        assert len(run) == 4
+        assert all(values[a] < values[b] for a, b in zip(run, run[1:]))
+
+    def test_empty(self):
+        assert longest_increasing_run([]) == set()
+
+
+class TestDiffOrders:
+    def test_unchanged(self):
+        assert diff_orders([1, 2, 3], [1, 2, 3]) == {'removed': [], 'placed': []}
+
+    def test_single_move_is_one_entry(self):
+        base = list(range(1, 1001))
+        target = base[:]
+        target.insert(10, target.pop(500))
+
+        diff = diff_orders(base, target)
+
+        assert diff == {'removed': [], 'placed': [[501, 10]]}
+        assert _replay(base, diff) == target
+
+    def test_removed_and_added(self):
+        diff = diff_orders([1, 2, 3, 4], [5, 1, 3, 4, 6])
+
+        assert diff == {'removed': [2], 'placed': [[5, 0], [6, 4]]}
+        assert _replay([1, 2, 3, 4], diff) == [5, 1, 3, 4, 6]
+
+    def test_reversal(self):
+        diff = diff_orders([1, 2, 3], [3, 2, 1])
+
+        assert len(diff['placed']) == 2
+        assert _replay([1, 2, 3], diff) == [3, 2, 1]
+
+    def test_random_round_trips(self):
+        generator = random.Random(7)
+        for _ in range(200):
+            base = generator.sample(range(60), generator.randint(0, 40))
+            target = generator.sample(range(60), generator.randint(0, 40))
+
+            assert _replay(base, diff_orders(base, target)) == target
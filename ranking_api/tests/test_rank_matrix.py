@@ -0,0 +1,39 @@
+import numpy as np
+
+from ranking_api.rank_matrix import build_rank_matrix
+
+
+class TestBuildRankMatrix:
+    def test_complete_rankings(self):
+        candidates, matrix = build_rank_matrix({1: ["b", "a", "c"], 2: ["a", "c", "b"]}, [1, 2])
+
+        assert candidates == ["a", "b", "c"]
+        assert matrix.tolist() == [[1, 0, 2], [0, 2, 1]]
+
+    def test_missing_candidates_tie_below_ranked_ones(self):
+        _, matrix = build_rank_matrix({1: ["a", "b", "c", "d"], 2: ["c"]}, [1, 2])
+
+        assert matrix[1].tolist() == [2, 2, 0, 2]
+
+    def test_repeated_key_keeps_best_position(self):
+        candidates, matrix = build_rank_matrix({1: ["a", "b", "a", "c"]}, [1])
+
+        assert candidates == ["a", "b", "c"]
+        assert matrix.tolist() == [[0, 1, 2]]
+
+    def test_rows_follow_ranking_ids(self):
+        _, matrix = build_rank_matrix({1: ["a", "b"], 2: ["b", "a"]}, [2, 1])
+
+        assert matrix.tolist() == [[1, 0], [0, 1]]
+
+    def test_empty_ranking(self):
+        _, matrix = build_rank_matrix({2: ["a", "b"]}, [1, 2])
+
+        assert matrix.tolist() == [[0.5, 0.5], [0, 1]]
+
+    def test_no_items(self):
+        candidates, matrix = build_rank_matrix({}, [1, 2])
+
+        assert candidates == []
+        assert matrix.shape == (2, 0)
+        assert matrix.dtype == np.float64
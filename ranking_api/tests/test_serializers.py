@@ -0,0 +1,88 @@
+import json
+
+import pytest
+
+from ranking_api.models import Item
+from ranking_api.serializers import (
+    STREAM_BATCH_SIZE, parse_csv, parse_ndjson, serialize_item, stream_csv, stream_json_list, stream_ndjson
+)
+
+
+class TestSerializeItem:
+    def test_serialize_item(self):
+        item = Item(id=3, name="London", notes="", rank=2, ranking_id=7)
+
+        assert serialize_item(item) == {'id': 3, 'name': "London", 'notes': "", 'rank': 2, 'ranking_id': 7}
+
+
+class TestStreamJsonList:
+    def test_empty(self):
+        assert json.loads(''.join(stream_json_list('items', []))) == {'items': []}
+
+    def test_rows_span_several_batches(self):
+        rows = [{'id': i} for i in range(STREAM_BATCH_SIZE * 2 + 1)]
+
+        chunks = list(stream_json_list('items', iter(rows)))
+
+        assert len(chunks) == 5
+        assert json.loads(''.join(chunks)) == {'items': rows}
+
+
+ROWS = [
+    {'id': 1, 'name': "London", 'notes': "Big, rainy", 'rank': 1, 'ranking_id': 7},
+    {'id': 2, 'name': 'Paris "the city"', 'notes': None, 'rank': 2, 'ranking_id': 7},
+]
+
+
+class TestStreamCsv:
+    def test_csv(self):
+        assert ''.join(stream_csv(iter(ROWS))) == (
+            'rank,name,notes\r\n1,London,"Big, rainy"\r\n2,"Paris ""the city""",\r\n'
+        )
+
+    def test_round_trip(self):
+        assert list(parse_csv(''.join(stream_csv(ROWS)).splitlines(keepends=True))) == [
+            ("London", "Big, rainy"), ('Paris "the city"', None)
+        ]
+
+    def test_rows_span_several_batches(self):
+        rows = [{'name': f'Item {i}', 'notes': None, 'rank': i} for i in range(STREAM_BATCH_SIZE * 2 + 1)]
+
+        chunks = list(stream_csv(rows))
+
+        assert len(chunks) == 3
+        assert len(''.join(chunks).splitlines()) == len(rows) + 1
+
+
+class TestStreamNdjson:
+    def test_round_trip(self):
+        text = ''.join(stream_ndjson(ROWS))
+
+        assert json.loads(text.splitlines()[0]) == {'rank': 1, 'name': "London", 'notes': "Big, rainy"}
+        assert list(parse_ndjson(text.splitlines())) == [("London", "Big, rainy"), ('Paris "the city"', None)]
+
+
+class TestParseCsv:
+    def test_name_column_required(self):
+        with pytest.raises(ValueError, match="CSV header must include a name column"):
+            list(parse_csv(["title,notes\n"]))
+
+    def test_notes_column_optional(self):
+        assert list(parse_csv(["name\n", "Oslo\n"])) == [("Oslo", None)]
+
+    def test_missing_name(self):
+        with pytest.raises(ValueError, match="Line 3: name is required"):
+            list(parse_csv(["name,notes\n", "Oslo,\n", ",cold\n"]))
+
+
+class TestParseNdjson:
+    def test_blank_lines_are_skipped(self):
+        assert list(parse_ndjson(['{"name": "Oslo"}\n', '\n'])) == [("Oslo", None)]
+
+    def test_invalid_json(self):
+        with pytest.raises(ValueError, match="Line 2: invalid JSON"):
+            list(parse_ndjson(['{"name": "Oslo"}', '{name']))
+
+    def test_notes_must_be_text(self):
+        with pytest.raises(ValueError, match="Line 1: notes must be a string"):
+            list(parse_ndjson(['{"name": "Oslo", "notes": 3}']))
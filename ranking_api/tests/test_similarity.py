@@ -0,0 +1,119 @@
+from itertools import combinations
+
+import numpy as np
+import pytest
+
+from ranking_api.similarity import (
+    count_inversions, kendall_tau, kendall_tau_matrix, rank_biased_overlap, spearman, spearman_matrix
+)
+
+
+def brute_force_tau_b(first, second):
+    pairs = list(combinations(range(len(first)), 2))
+    first_signs = np.array([np.sign(first[i] - first[j]) for i, j in pairs])
+    second_signs = np.array([np.sign(second[i] - second[j]) for i, j in pairs])
+    return (first_signs * second_signs).sum() / np.sqrt((first_signs ** 2).sum() * (second_signs ** 2).sum())
+
+
+class TestCountInversions:
+    @pytest.mark.parametrize('values, expected', [
+        ([], 0),
+        ([1], 0),
+        ([1, 2, 3, 4], 0),
+        ([4, 3, 2, 1], 6),
+        ([2, 4, 1, 3, 5], 3),
+        ([1, 1, 0], 2),
+    ])
+    def test_counts(self, values, expected):
+        assert count_inversions(values) == expected
+
+    def test_matches_brute_force(self):
+        values = np.random.default_rng(0).integers(0, 50, 200).tolist()
+
+        assert count_inversions(values) == sum(
+            1 for i, j in combinations(range(len(values)), 2) if values[i] > values[j]
+        )
+
+
+class TestKendallTau:
+    def test_identical(self):
+        assert kendall_tau(list("abcd"), list("abcd")) == 1
+
+    def test_reversed(self):
+        assert kendall_tau(list("abcd"), list("dcba")) == -1
+
+    def test_one_swap(self):
+        assert kendall_tau(list("abcde"), list("bacde")) == pytest.approx(0.8)
+
+    def test_only_shared_items_count(self):
+        assert kendall_tau(list("axbyc"), list("cbzaq")) == -1
+
+    def test_too_few_shared_items(self):
+        assert kendall_tau(list("ab"), list("bc")) is None
+
+
+class TestSpearman:
+    def test_one_swap(self):
+        rho, footrule = spearman(list("abcde"), list("bacde"))
+
+        assert rho == pytest.approx(0.9)
+        assert footrule == 2
+
+    def test_reversed(self):
+        rho, footrule = spearman(list("abcd"), list("dcba"))
+
+        assert rho == -1
+        assert footrule == 8
+
+
+class TestRankBiasedOverlap:
+    def test_identical(self):
+        assert rank_biased_overlap(list("abcde"), list("abcde")) == pytest.approx(1)
+
+    def test_disjoint(self):
+        assert rank_biased_overlap(list("abc"), list("xyz")) == 0
+
+    def test_top_weighted(self):
+        top_swapped = rank_biased_overlap(list("abcdef"), list("bacdef"))
+        bottom_swapped = rank_biased_overlap(list("abcdef"), list("abcdfe"))
+
+        assert top_swapped < bottom_swapped < 1
+
+    def test_uneven_lengths(self):
+        # Webber et al.'s extrapolation: a prefix agrees with the longer list
+        # everywhere it is defined.
+        assert rank_biased_overlap(list("abc"), list("abcdef")) == pytest.approx(1)
+        assert 0 < rank_biased_overlap(list("abc"), list("xyzabc"), p=0.5) < 0.5
+
+
+class TestSimilarityMatrices:
+    def test_kendall_matches_pairwise_tau_b(self):
+        matrix = np.array([
+            [0, 1, 2, 3, 4],
+            [1, 0, 2, 4, 3],
+            [3.5, 3.5, 0, 1, 2],
+            [4, 3, 2, 1, 0],
+        ], dtype=float)
+
+        taus = kendall_tau_matrix(matrix)
+
+        for i, j in combinations(range(len(matrix)), 2):
+            assert taus[i, j] == pytest.approx(brute_force_tau_b(matrix[i], matrix[j]))
+        assert np.diag(taus) == pytest.approx(1)
+
+    def test_kendall_agrees_with_pairwise_function(self):
+        first, second = list("abcdefgh"), list("bacdhefg")
+        matrix = np.array([range(8), [second.index(key) for key in first]], dtype=float)
+
+        assert kendall_tau_matrix(matrix)[0, 1] == pytest.approx(kendall_tau(first, second))
+
+    def test_spearman(self):
+        matrix = np.array([[0, 1, 2, 3, 4], [1, 0, 2, 3, 4], [4, 3, 2, 1, 0]], dtype=float)
+
+        rhos = spearman_matrix(matrix)
+
+        assert rhos[0, 1] == pytest.approx(0.9)
+        assert rhos[0, 2] == pytest.approx(-1)
+
+    def test_single_ranking(self):
+        assert spearman_matrix(np.array([[0, 1, 2]], dtype=float)).tolist() == [[1]]
@@ -17,8 +17,15 @@ Including another URLconf
 from django.contrib import admin
 from django.urls import path
 
+from ranking_api.controllers.async_item_controller import AsyncItemController
+from ranking_api.controllers.async_ranking_controller import AsyncRankingController
+from ranking_api.controllers.consensus_controller import ConsensusController
+from ranking_api.controllers.history_controller import HistoryController
 from ranking_api.controllers.item_controller import ItemController
+from ranking_api.controllers.metrics_controller import MetricsController
 from ranking_api.controllers.ranking_controller import RankingController
+from ranking_api.controllers.similarity_controller import SimilarityController
+from ranking_api.controllers.snapshot_controller import SnapshotController
 
 urlpatterns = [
     path('admin/', admin.site.urls),
@@ -30,6 +37,27 @@ urlpatterns = [
             'post': 'create_ranking_item',
         }
     ), name='ranking-items'),
+    path('api/rankings/<int:ranking_id>/items/bulk', ItemController.as_view(
+        {
+            'post': 'create_ranking_items',
+            'delete': 'delete_ranking_items',
+        }
+    ), name='ranking-items-bulk'),
+    path('api/rankings/<int:ranking_id>/items/export', ItemController.as_view(
+        {
+            'get': 'export_ranking_items'
+        }
+    ), name='ranking-items-export'),
+    path('api/rankings/<int:ranking_id>/items/search', ItemController.as_view(
+        {
+            'get': 'search_items'
+        }
+    ), name='ranking-items-search'),
+    path('api/items/search', ItemController.as_view(
+        {
+            'get': 'search_items'
+        }
+    ), name='items-search'),
     path('api/items/<int:item_id>/', ItemController.as_view(
         {
             'get': 'get_ranking_item',
@@ -37,6 +65,16 @@ urlpatterns = [
             'patch': 'patch_ranking_item',
         }
     ), name='ranking-item'),
+    path('api/items/<int:item_id>/rank', ItemController.as_view(
+        {
+            'post': 'update_item_rank'
+        }
+    ), name='ranking-item-rank'),
+    path('api/items/<int:item_id>/neighbors', ItemController.as_view(
+        {
+            'get': 'get_item_neighbors'
+        }
+    ), name='ranking-item-neighbors'),
     path('api/rankings/<int:ranking_id>/update-ranks', ItemController.as_view(
         {
             'post': 'update_item_ranks'
@@ -50,11 +88,72 @@ urlpatterns = [
         }
     ), name='rankings-list'),
 
+    path('api/rankings/consensus', ConsensusController.as_view(
+        {
+            'post': 'get_consensus'
+        }
+    ), name='rankings-consensus'),
+    path('api/rankings/similarity-matrix', SimilarityController.as_view(
+        {
+            'post': 'get_similarity_matrix'
+        }
+    ), name='rankings-similarity-matrix'),
+    path('api/rankings/<int:ranking_id>/similarity/<int:other_ranking_id>', SimilarityController.as_view(
+        {
+            'get': 'compare_rankings'
+        }
+    ), name='rankings-similarity'),
+    path('api/rankings/<int:ranking_id>/history', HistoryController.as_view(
+        {
+            'get': 'get_ranking_history'
+        }
+    ), name='ranking-history'),
+    path('api/rankings/<int:ranking_id>/snapshots', SnapshotController.as_view(
+        {
+            'get': 'get_snapshots',
+            'post': 'create_snapshot'
+        }
+    ), name='ranking-snapshots'),
+    path('api/rankings/<int:ranking_id>/snapshots/<int:snapshot_id>/restore', SnapshotController.as_view(
+        {
+            'post': 'restore_snapshot'
+        }
+    ), name='ranking-snapshot-restore'),
+
     path('api/rankings/<int:ranking_id>/', RankingController.as_view(
         {
              'get': 'get_ranking',
              'delete': 'delete_ranking',
              'put': 'update_ranking',
         }
-    ), name='ranking-detail')
+    ), name='ranking-detail'),
+
+    # METRICS
+    path('api/metrics/', MetricsController.as_view(
+        {
+            'get': 'get_metrics'
+        }
+    ), name='metrics'),
+
+    # ASYNC READ ENDPOINTS (served natively when running under ASGI)
+    path('api/async/rankings/<int:ranking_id>/items/', AsyncItemController.as_view(
+        actions={
+            'get': 'get_ranking_items',
+        }
+    ), name='async-ranking-items'),
+    path('api/async/items/<int:item_id>/', AsyncItemController.as_view(
+        actions={
+            'get': 'get_ranking_item',
+        }
+    ), name='async-ranking-item'),
+    path('api/async/rankings/', AsyncRankingController.as_view(
+        actions={
+            'get': 'get_all_rankings',
+        }
+    ), name='async-rankings-list'),
+    path('api/async/rankings/<int:ranking_id>/', AsyncRankingController.as_view(
+        actions={
+            'get': 'get_ranking',
+        }
+    ), name='async-ranking-detail'),
 ]